@@ -18,20 +18,29 @@ from rich.table import Table
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from agents.keyword_researcher import KeywordResearcherAgent
+from agents.keyword_deduplicator import KeywordDeduplicatorAgent
 from agents.topic_clusterer import TopicClustererAgent
 from agents.intent_segmenter import IntentSegmenterAgent
 from agents.report_generator import ReportGeneratorAgent
 from agents.competitive_scraper import CompetitiveScraperAgent
 from agents.content_gap import ContentGapAgent
 from contracts.keyword_researcher import KeywordResearchInput
+from contracts.keyword_deduplicator import KeywordDedupInput
 from contracts.topic_clusterer import TopicClusterInput
 from contracts.intent_segmenter import IntentSegmentInput
 from contracts.content_gap import ContentGapInput
 from contracts.report_generator import ReportInput
 from core.config import settings
+from integrations.google_trends_client import GoogleTrendsClient
+from integrations.serpapi_client import SerpApiClient
+from models.keyword_frame import KeywordFrame
 from models.reports import ReportConfig
 from storage.database import init_database
 from storage.cache import CacheManager
+from storage.cluster_models import ClusterModelStore
+from storage.persistence import RunStore
+from storage.timeseries import TrendSeriesStore
+from utils.rate_limiter import rate_limiter
 
 console = Console()
 
@@ -39,22 +48,31 @@ console = Console()
 class Orchestrator:
     """Coordinates all agents in the topic intelligence pipeline."""
 
-    def __init__(self):
-        self.agents = {
-            "keyword_researcher": KeywordResearcherAgent(),
-            "topic_clusterer": TopicClustererAgent(),
-            "intent_segmenter": IntentSegmenterAgent(),
-            "report_generator": ReportGeneratorAgent(),
-            "competitive_scraper": CompetitiveScraperAgent(),
-            "content_gap": ContentGapAgent(),
-        }
+    def __init__(self, force_refresh: bool = False):
         self.results = {}
         self.run_id = str(uuid4())[:8]
         self.session_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        self.force_refresh = force_refresh
 
         # Initialize storage
         self.engine, self.session_factory = init_database()
-        self.cache = CacheManager(self.session_factory)
+        self.cache = CacheManager(self.session_factory, run_id=self.run_id)
+        self.run_store = RunStore(self.session_factory)
+
+        # One pooled SerpAPI client shared by every agent in this process
+        self.serpapi = SerpApiClient(cache=self.cache)
+        self.trends = GoogleTrendsClient(cache=self.cache, series_store=TrendSeriesStore(self.session_factory))
+        self.agents = {
+            "keyword_researcher": KeywordResearcherAgent(serpapi_client=self.serpapi, trends_client=self.trends),
+            "keyword_deduplicator": KeywordDeduplicatorAgent(),
+            "topic_clusterer": TopicClustererAgent(
+                model_store=ClusterModelStore(self.session_factory), cache=self.cache
+            ),
+            "intent_segmenter": IntentSegmenterAgent(),
+            "report_generator": ReportGeneratorAgent(),
+            "competitive_scraper": CompetitiveScraperAgent(),
+            "content_gap": ContentGapAgent(),
+        }
 
         # Setup logging
         if settings.log_file:
@@ -65,6 +83,17 @@ class Orchestrator:
                 level=settings.log_level,
             )
 
+    async def __aenter__(self) -> "Orchestrator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release shared client connections and worker threads."""
+        await self.serpapi.aclose()
+        self.trends.close()
+
     def _config_hash(self, query: str) -> str:
         """Generate a config hash for cache key."""
         config_str = json.dumps({
@@ -79,6 +108,7 @@ class Orchestrator:
         """Run the full topic intelligence pipeline."""
         query = input_data.get("query", "executive leadership")
         config_hash = self._config_hash(query)
+        self.cache.config_hash = config_hash
 
         console.print(f"[bold cyan]Starting {task_type} pipeline...[/bold cyan]")
         console.print(f"[dim]Run ID: {self.run_id} | Config Hash: {config_hash}[/dim]\n")
@@ -96,19 +126,36 @@ class Orchestrator:
                 queries=queries,
                 max_results=input_data.get("max_results", 100),
                 include_trends=settings.enable_trends,
+                force_refresh=self.force_refresh,
             )
             kw_result = await self.agents["keyword_researcher"].process(kw_input)
             self.results["keyword_research"] = kw_result
             progress.update(task, completed=1)
 
-            keywords_data = kw_result.data.get("keywords", [])
-            from models.keywords import Keyword
-            keywords = [Keyword(**kw) if isinstance(kw, dict) else kw for kw in keywords_data]
+            # Phases hand typed outputs to each other; data dicts are only for output files and APIs
+            keywords = kw_result.output.keywords
+
+            # Phase 1b: Near-duplicate dedup (downstream phases see one canonical keyword per group)
+            if settings.enable_dedup and keywords:
+                task = progress.add_task("[cyan]Merging near-duplicate keywords...", total=1)
+                dedup_result = await self.agents["keyword_deduplicator"].process(KeywordDedupInput(keywords=keywords))
+                self.results["keyword_dedup"] = dedup_result
+                keywords = dedup_result.output.keywords
+                progress.update(task, completed=1)
+
+            # Columnar view shared by the clustering, segmentation and report phases
+            frame = KeywordFrame.from_keywords(keywords)
 
             # Phase 2: Topic Clustering
             if task_type in ("cluster", "full") and len(keywords) >= 3:
                 task = progress.add_task("[green]Clustering topics...", total=1)
-                cluster_input = TopicClusterInput(keywords=keywords)
+                cluster_input = TopicClusterInput(
+                    keywords=frame,
+                    method="auto",
+                    k_selection="fast",
+                    run_id=self.run_id,
+                    force_refresh=self.force_refresh,
+                )
                 cluster_result = await self.agents["topic_clusterer"].process(cluster_input)
                 self.results["topic_clustering"] = cluster_result
                 progress.update(task, completed=1)
@@ -116,29 +163,25 @@ class Orchestrator:
             # Phase 3: Intent Segmentation
             if task_type == "full":
                 task = progress.add_task("[yellow]Segmenting by intent...", total=1)
-                segment_input = IntentSegmentInput(keywords=keywords)
+                segment_input = IntentSegmentInput(keywords=frame)
                 segment_result = await self.agents["intent_segmenter"].process(segment_input)
                 self.results["intent_segmentation"] = segment_result
                 progress.update(task, completed=1)
 
             # Phase 4: Competitive Analysis (if enabled)
             competitors = []
+            crawls = {}
             if task_type in ("gaps", "full") and settings.enable_competitors:
                 task = progress.add_task("[magenta]Analyzing competitors...", total=1)
                 comp_result = await self.agents["competitive_scraper"].process()
                 self.results["competitive_analysis"] = comp_result
-                comp_data = comp_result.data.get("competitors", [])
-                from models.competitors import Competitor
-                competitors = [Competitor(**c) if isinstance(c, dict) else c for c in comp_data]
+                competitors = comp_result.output.competitors
+                crawls = comp_result.output.pages
                 progress.update(task, completed=1)
 
             # Phase 5: Content Gap Analysis
-            topics_data = self.results.get("topic_clustering", {})
-            if isinstance(topics_data, object) and hasattr(topics_data, "data"):
-                topics_data = topics_data.data
-            topics_list = topics_data.get("topics", []) if isinstance(topics_data, dict) else []
-            from models.topics import TopicCategory
-            topics = [TopicCategory(**t) if isinstance(t, dict) else t for t in topics_list]
+            cluster_output = self.results["topic_clustering"].output if "topic_clustering" in self.results else None
+            topics = cluster_output.topics if cluster_output else []
 
             gaps = []
             if task_type in ("gaps", "full") and topics and competitors:
@@ -146,26 +189,15 @@ class Orchestrator:
                 gap_input = ContentGapInput(topics=topics, competitors=competitors)
                 gap_result = await self.agents["content_gap"].process(gap_input)
                 self.results["content_gaps"] = gap_result
-                gap_data = gap_result.data.get("gaps", [])
-                gaps = [TopicCategory(**g) if isinstance(g, dict) else g for g in gap_data]
+                gaps = gap_result.output.gaps
                 progress.update(task, completed=1)
 
             # Phase 6: Report Generation
             task = progress.add_task("[blue]Generating report...", total=1)
 
-            clusters_data = self.results.get("topic_clustering", {})
-            if hasattr(clusters_data, "data"):
-                clusters_data = clusters_data.data
-            clusters_list = clusters_data.get("clusters", []) if isinstance(clusters_data, dict) else []
-            from models.keywords import KeywordCluster
-            clusters = [KeywordCluster(**c) if isinstance(c, dict) else c for c in clusters_list]
-
-            segments_data = self.results.get("intent_segmentation", {})
-            if hasattr(segments_data, "data"):
-                segments_data = segments_data.data
-            segments_list = segments_data.get("segments", []) if isinstance(segments_data, dict) else []
-            from models.segments import IntentSegment
-            segments = [IntentSegment(**s) if isinstance(s, dict) else s for s in segments_list]
+            clusters = cluster_output.clusters if cluster_output else []
+            segment_result = self.results.get("intent_segmentation")
+            segments = segment_result.output.segments if segment_result else []
 
             report_config = ReportConfig(
                 title=f"Leadership Topic Intelligence: {query}",
@@ -174,7 +206,7 @@ class Orchestrator:
             )
             report_input = ReportInput(
                 config=report_config,
-                keywords=keywords,
+                keywords=frame,
                 clusters=clusters,
                 topics=topics,
                 segments=segments,
@@ -184,6 +216,11 @@ class Orchestrator:
             self.results["report"] = report_result
             progress.update(task, completed=1)
 
+            # Phase 7: Persist normalized outputs for historical queries
+            task = progress.add_task("[white]Persisting run...", total=1)
+            persisted = self.run_store.save_run(self.run_id, keywords=keywords, clusters=clusters, crawls=crawls)
+            progress.update(task, completed=1)
+
         # Save session
         session_file = settings.output_dir / f"session_{self.session_id}.json"
         with open(session_file, "w") as f:
@@ -201,22 +238,33 @@ class Orchestrator:
                     "competitors": len(competitors),
                     "gaps": len(gaps),
                 },
+                "persisted": persisted,
+                "cache": self.cache.stats(),
+                "rate_limits": rate_limiter.stats(),
             }, f, indent=2, default=str)
 
         return {
             "session_id": self.session_id,
             "run_id": self.run_id,
+            "cache": self.cache.stats(),
             "results": self.results,
             "report_path": report_result.data.get("path", ""),
         }
 
 
+async def _run_pipeline(orchestrator: Orchestrator, task: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the pipeline and close pooled connections on the same event loop."""
+    async with orchestrator:
+        return await orchestrator.run_pipeline(task, input_data)
+
+
 @click.command()
 @click.option("--task", "-t", type=click.Choice(["research", "cluster", "gaps", "full"]), default="full", help="Pipeline task type")
 @click.option("--query", "-q", default="executive leadership", help="Search query")
 @click.option("--output", "-o", type=click.Path(), help="Output directory")
 @click.option("--dev", is_flag=True, help="Development mode")
-def main(task: str, query: str, output: Optional[str], dev: bool):
+@click.option("--force-refresh", is_flag=True, help="Bypass cached API responses and refetch")
+def main(task: str, query: str, output: Optional[str], dev: bool, force_refresh: bool):
     """M&D AI Academy — Leadership Topic Intelligence System."""
     if dev:
         settings.debug_mode = True
@@ -233,10 +281,10 @@ def main(task: str, query: str, output: Optional[str], dev: bool):
         "max_results": 100,
     }
 
-    orchestrator = Orchestrator()
+    orchestrator = Orchestrator(force_refresh=force_refresh)
 
     try:
-        results = asyncio.run(orchestrator.run_pipeline(task, input_data))
+        results = asyncio.run(_run_pipeline(orchestrator, task, input_data))
 
         console.print("\n[bold green]Pipeline completed successfully![/bold green]\n")
 
@@ -256,7 +304,11 @@ def main(task: str, query: str, output: Optional[str], dev: bool):
         if report_path:
             console.print(f"\n[bold]Report:[/bold] {report_path}")
 
-        console.print(f"\n[dim]Session: {results.get('session_id')} | Run: {results.get('run_id')}[/dim]")
+        cache_stats = results.get("cache", {})
+        console.print(
+            f"\n[dim]Session: {results.get('session_id')} | Run: {results.get('run_id')} | "
+            f"Cache: {cache_stats.get('hit_total', 0)} hits / {cache_stats.get('miss_total', 0)} misses[/dim]"
+        )
 
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
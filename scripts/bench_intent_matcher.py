@@ -0,0 +1,72 @@
+"""Benchmark intent classification: per-pattern re.search vs the compiled single-pass matcher.
+
+Also checks that both produce the same intent for every generated term.
+
+Usage: python scripts/bench_intent_matcher.py [--terms 100000] [--repeat 3]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.intent_segmenter import INTENT_PATTERNS, classify_intent
+
+WORDS = [
+    "leadership", "training", "course", "coach", "coaching", "mentor", "1-on-1", "certification",
+    "credential", "change", "management", "transformation", "team", "building", "collaboration",
+    "executive", "c-suite", "ceo", "senior", "leader", "assessment", "360", "feedback", "thought",
+    "insights", "trends", "future", "of", "strategy", "skills", "for", "managers", "online", "best",
+    "how", "to", "improve", "program", "women", "remote", "new", "first", "time", "development",
+]
+
+
+def legacy_classify(term: str):
+    """The previous loop: every pattern of every intent until one matches."""
+    for intent_name, intent_def in INTENT_PATTERNS.items():
+        for pattern in intent_def["patterns"]:
+            if re.search(pattern, term.lower()):
+                return intent_name
+    return None
+
+
+def build_terms(n: int) -> list:
+    rng = random.Random(0)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(2, 6))).title() if i % 7 == 0
+            else " ".join(rng.choices(WORDS, k=rng.randint(2, 6))) for i in range(n)]
+
+
+def best_of(fn, terms: list, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for term in terms:
+            fn(term)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    terms = build_terms(args.terms)
+    mismatches = sum(legacy_classify(t) != classify_intent(t) for t in terms)
+    unmatched = sum(classify_intent(t) is None for t in terms)
+
+    legacy = best_of(legacy_classify, terms, args.repeat)
+    compiled = best_of(classify_intent, terms, args.repeat)
+    print(f"{args.terms} terms, {unmatched} unclassified (best of {args.repeat})")
+    print(f"  per-pattern re.search: {legacy * 1000:9.1f} ms")
+    print(f"  compiled single pass:  {compiled * 1000:9.1f} ms  ({legacy / compiled:.1f}x)")
+    print(f"  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
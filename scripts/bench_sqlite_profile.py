@@ -0,0 +1,103 @@
+"""Compare concurrent cache read/write throughput across SQLite storage profiles.
+
+Usage: python scripts/bench_sqlite_profile.py [--seconds 5] [--writers 2] [--readers 6]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from loguru import logger
+
+from storage.cache import CacheManager
+from storage.database import STORAGE_PROFILES, init_database
+
+
+def run_profile(profile: str, seconds: float, writers: int, readers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, session_factory = init_database(f"sqlite:///{os.path.join(tmp, 'bench.db')}", profile=profile)
+        seed = CacheManager(session_factory, run_id="bench", config_hash="bench")
+        seed.put_many("bench", "bench", "serpapi", {f"q{i}": {"i": i} for i in range(1000)})
+
+        counts = {"writes": 0, "reads": 0, "write_errors": 0, "read_errors": 0}
+        lock = threading.Lock()
+        logged = threading.local()
+
+        def count_error(_message) -> None:
+            # put_many logs and swallows "database is locked" instead of raising
+            logged.errors = getattr(logged, "errors", 0) + 1
+
+        sink_id = logger.add(count_error, level="ERROR")
+        deadline = time.perf_counter() + seconds
+
+        def attempt(kind: str, operation, *args) -> None:
+            """Run one operation and count it as done or failed (raised or logged)."""
+            logged.errors = 0
+            try:
+                operation(*args)
+                failed = logged.errors > 0
+            except Exception:
+                failed = True
+            with lock:
+                counts[f"{kind}_errors" if failed else f"{kind}s"] += 1
+
+        def writer(worker: int) -> None:
+            # Memory tier disabled so every operation reaches SQLite
+            cache = CacheManager(session_factory, run_id="bench", config_hash="bench")
+            cache.memory.max_entries = 0
+            n = 0
+            while time.perf_counter() < deadline:
+                attempt("write", cache.put_many, "bench", "bench", "serpapi", {f"w{worker}-{n}": {"n": n, "w": worker}})
+                n += 1
+
+        def reader(worker: int) -> None:
+            cache = CacheManager(session_factory, run_id="bench", config_hash="bench")
+            cache.memory.max_entries = 0
+            n = 0
+            while time.perf_counter() < deadline:
+                attempt("read", cache.get_many, "serpapi", [f"q{(n * 7 + worker) % 1000}"], "bench")
+                n += 1
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        logger.remove(sink_id)
+        engine.dispose()
+
+    return {
+        "profile": profile,
+        "writes_per_s": counts["writes"] / seconds,
+        "reads_per_s": counts["reads"] / seconds,
+        "write_errors": counts["write_errors"],
+        "read_errors": counts["read_errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=6)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    for profile in STORAGE_PROFILES:
+        r = run_profile(profile, args.seconds, args.writers, args.readers)
+        print(
+            f"{r['profile']:<12} writes/s={r['writes_per_s']:>8.1f}  reads/s={r['reads_per_s']:>8.1f}  "
+            f"write_errors={r['write_errors']}  read_errors={r['read_errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Profile the orchestrator's phase handoff: dict round trip vs typed outputs.
+
+Both paths start from each agent's contract output and do the work a real handoff
+does. The agent serializes it into ``AgentResponse.data`` (``model_dump``), then the
+orchestrator reads the phase result. The legacy handoff re-validated every model
+from ``result.data`` with ``Keyword(**kw)``, ``KeywordCluster(**c)``,
+``TopicCategory(**t)`` and ``IntentSegment(**s)``. The typed handoff reads
+``result.output``.
+
+Usage: python scripts/profile_handoff.py [--keywords 20000] [--clusters 30] [--repeat 3] [--cprofile]
+"""
+
+import argparse
+import cProfile
+import pstats
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from contracts.intent_segmenter import IntentSegmentOutput
+from contracts.keyword_researcher import KeywordResearchOutput
+from contracts.topic_clusterer import TopicClusterOutput
+from models.base import AgentResponse
+from models.keywords import Keyword, KeywordCluster
+from models.segments import IntentSegment
+from models.topics import TopicCategory
+
+
+def build_outputs(n_keywords: int, n_clusters: int) -> dict:
+    """Phase contract outputs shaped like a real run: clusters embed full keyword lists."""
+    rng = random.Random(0)
+    keywords = [
+        Keyword(
+            term=f"leadership topic {i}",
+            volume=rng.randint(0, 20000),
+            cpc=round(rng.uniform(0, 40), 2),
+            competition=round(rng.random(), 3),
+            trends_interest=rng.randint(0, 100),
+            trends_momentum=round(rng.uniform(-1, 2), 4),
+            related_queries=[f"related {i} {j}" for j in range(3)],
+            people_also_ask=[f"what is leadership topic {i} {j}?" for j in range(4)],
+            serp_features=["video", "people_also_ask"],
+        )
+        for i in range(n_keywords)
+    ]
+    members = [keywords[c::n_clusters] for c in range(n_clusters)]
+    clusters = [
+        KeywordCluster(cluster_id=c, label=f"Cluster {c}", keywords=kws, size=len(kws), avg_demand_signal=0.5)
+        for c, kws in enumerate(members)
+    ]
+    topics = [TopicCategory(name=f"Cluster {c}", keywords=[kw.term for kw in kws]) for c, kws in enumerate(members)]
+    segments = [
+        IntentSegment(name=f"Segment {s}", description="", keywords=[kw.term for kw in keywords[s::8]])
+        for s in range(8)
+    ]
+
+    return {
+        "keyword_research": KeywordResearchOutput(keywords=keywords),
+        "topic_clustering": TopicClusterOutput(clusters=clusters, topics=topics),
+        "intent_segmentation": IntentSegmentOutput(segments=segments),
+    }
+
+
+def respond(outputs: dict, typed: bool) -> dict:
+    """What each agent's create_response does: serialize the output into ``data``."""
+    return {
+        phase: AgentResponse(
+            agent_name=phase, task_id="profile", status="success", data=output.model_dump(),
+            output=output if typed else None,
+        )
+        for phase, output in outputs.items()
+    }
+
+
+def legacy_handoff(outputs: dict) -> tuple:
+    """What run_pipeline did before typed outputs: serialize, then rebuild models from the data."""
+    results = respond(outputs, typed=False)
+    keywords = [Keyword(**kw) for kw in results["keyword_research"].data["keywords"]]
+    topics = [TopicCategory(**t) for t in results["topic_clustering"].data["topics"]]
+    clusters = [KeywordCluster(**c) for c in results["topic_clustering"].data["clusters"]]
+    segments = [IntentSegment(**s) for s in results["intent_segmentation"].data["segments"]]
+    return keywords, topics, clusters, segments
+
+
+def typed_handoff(outputs: dict) -> tuple:
+    """Current run_pipeline handoff: serialize for APIs/persistence, hand the typed output on."""
+    results = respond(outputs, typed=True)
+    return (
+        results["keyword_research"].output.keywords,
+        results["topic_clustering"].output.topics,
+        results["topic_clustering"].output.clusters,
+        results["intent_segmentation"].output.segments,
+    )
+
+
+def best_of(fn, outputs: dict, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(outputs)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keywords", type=int, default=20000)
+    parser.add_argument("--clusters", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cprofile", action="store_true", help="print the top functions of the legacy handoff")
+    args = parser.parse_args()
+
+    outputs = build_outputs(args.keywords, args.clusters)
+    serialize = best_of(lambda o: respond(o, typed=True), outputs, args.repeat)
+    legacy = best_of(legacy_handoff, outputs, args.repeat)
+    typed = best_of(typed_handoff, outputs, args.repeat)
+    validated = args.keywords * 2 + args.clusters * 2 + 8
+    print(f"{args.keywords} keywords, {args.clusters} clusters (best of {args.repeat})")
+    print(f"  serialize only (model_dump): {serialize * 1000:9.1f} ms")
+    print(f"  legacy dict round trip:      {legacy * 1000:9.1f} ms  (serialize + ~{validated} model validations)")
+    print(f"  typed output handoff:        {typed * 1000:9.1f} ms  (serialize + 0 model validations)")
+    print(f"  saved per run:               {(legacy - typed) * 1000:9.1f} ms")
+
+    if args.cprofile:
+        profiler = cProfile.Profile()
+        profiler.runcall(legacy_handoff, outputs)
+        pstats.Stats(profiler).sort_stats("tottime").print_stats(8)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from agents.base_agent import BaseAgent
 from agents.competitive_scraper import CompetitiveScraperAgent
 from agents.content_gap import ContentGapAgent
 from agents.intent_segmenter import IntentSegmenterAgent
+from agents.keyword_deduplicator import KeywordDeduplicatorAgent
 from agents.keyword_researcher import KeywordResearcherAgent
 from agents.report_generator import ReportGeneratorAgent
 from agents.topic_clusterer import TopicClustererAgent
@@ -13,6 +14,7 @@ __all__ = [
     "CompetitiveScraperAgent",
     "ContentGapAgent",
     "IntentSegmenterAgent",
+    "KeywordDeduplicatorAgent",
     "KeywordResearcherAgent",
     "ReportGeneratorAgent",
     "TopicClustererAgent",
@@ -45,7 +45,9 @@ class BaseAgent(ABC):
         status: str,
         data: Dict[str, Any],
         metadata: Optional[Dict[str, Any]] = None,
+        output: Any = None,
     ) -> AgentResponse:
+        """Wrap serialized `data` (for APIs and persistence) and the typed `output` it came from."""
         processing_time = self.end_task()
         return AgentResponse(
             agent_name=self.name,
@@ -55,6 +57,7 @@ class BaseAgent(ABC):
             metadata=metadata or {},
             timestamp=datetime.utcnow(),
             processing_time_seconds=processing_time,
+            output=output,
         )
 
     async def retry_with_backoff(
@@ -1,14 +1,17 @@
 """Competitive Scraper agent — lightweight content intelligence from competitor sites."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
+import httpx
 from loguru import logger
 
 from agents.base_agent import BaseAgent
+from contracts.competitive_scraper import CompetitiveScrapeOutput
 from core.config import settings
 from models.base import AgentResponse
 from models.competitors import Competitor, CompetitorContent
+from utils.rate_limiter import parse_retry_after, rate_limiter
 
 MOCK_COMPETITOR_DATA = {
     "hbr.org": {
@@ -37,43 +40,86 @@ MOCK_COMPETITOR_DATA = {
     },
 }
 
+USER_AGENT = "MDAI-TopicIntel/1.0"
+
 
 class CompetitiveScraperAgent(BaseAgent):
-    """Scrapes competitor sites for content intelligence (lightweight, no Playwright)."""
+    """Scrapes competitor sites for content intelligence (lightweight, no Playwright).
+
+    Pages are fetched on one pooled ``httpx.AsyncClient`` per run (or the injected
+    ``http_client``), paced per host by the shared rate limiter.
+    """
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         super().__init__(name="CompetitiveScraper", model=settings.default_model)
         self.enabled = settings.enable_competitors
+        self._http = http_client
+        self._owns_http = http_client is None
 
     async def process(self, input_data: Dict[str, Any] = None) -> AgentResponse:
         self.start_task()
+        try:
+            return await self._process()
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if this agent created it."""
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+            self._http = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled HTTP client shared by every page fetch."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=10,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
+            )
+            self._owns_http = True
+        return self._http
 
+    async def _process(self) -> AgentResponse:
         if not self.enabled:
             logger.info("Competitive scraping disabled via feature flag")
-            return self.create_response(status="skipped", data={"competitors": [], "reason": "disabled"})
+            return self.create_response(
+                status="skipped", data={"competitors": [], "reason": "disabled"}, output=CompetitiveScrapeOutput()
+            )
 
         competitors = []
+        pages: Dict[str, List[CompetitorContent]] = {}
         domains = settings.competitor_domains
 
         for domain in domains:
             logger.info(f"Analyzing competitor: {domain}")
-            competitor = await self._analyze_competitor(domain)
+            competitor, domain_pages = await self._analyze_competitor(domain)
             if competitor:
                 competitors.append(competitor)
-
-        return self.create_response(
-            status="success",
-            data={"competitors": [c.model_dump() for c in competitors]},
-            metadata={"domains_analyzed": len(domains), "competitors_found": len(competitors)},
+            pages[domain] = domain_pages
+
+        output = CompetitiveScrapeOutput(
+            competitors=competitors,
+            pages=pages,
+            metadata={
+                "domains_analyzed": len(domains),
+                "competitors_found": len(competitors),
+                "pages_crawled": sum(len(p) for p in pages.values()),
+            },
         )
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
 
-    async def _analyze_competitor(self, domain: str) -> Optional[Competitor]:
-        """Analyze a single competitor domain."""
+    async def _analyze_competitor(self, domain: str) -> Tuple[Optional[Competitor], List[CompetitorContent]]:
+        """Analyze a single competitor domain, returning the competitor and its crawled pages."""
         if settings.no_network_mode:
-            return self._mock_competitor(domain)
+            return self._mock_competitor(domain), self._mock_pages(domain)
 
         try:
-            import requests
             from bs4 import BeautifulSoup
 
             # Try to fetch sitemap
@@ -81,7 +127,7 @@ class CompetitiveScraperAgent(BaseAgent):
             pages = []
 
             try:
-                resp = requests.get(sitemap_url, timeout=10, headers={"User-Agent": "MDAI-TopicIntel/1.0"})
+                resp = await self._get(sitemap_url)
                 if resp.status_code == 200 and "xml" in resp.headers.get("content-type", ""):
                     soup = BeautifulSoup(resp.text, "xml")
                     urls = [loc.text for loc in soup.find_all("loc")][:50]
@@ -102,28 +148,47 @@ class CompetitiveScraperAgent(BaseAgent):
 
             topics = list(set(p.topic for p in pages if p.topic))
 
-            return Competitor(
+            competitor = Competitor(
                 domain=domain,
                 name=domain.split(".")[0].title(),
                 content_count=len(pages),
                 top_topics=topics[:10],
                 coverage_ratio=0.0,  # Calculated later by ContentGapAgent
             )
+            return competitor, pages
 
         except ImportError:
-            logger.warning("requests/beautifulsoup4 not installed, using mock data")
-            return self._mock_competitor(domain)
+            logger.warning("beautifulsoup4 not installed, using mock data")
+            return self._mock_competitor(domain), self._mock_pages(domain)
         except Exception as e:
             logger.error(f"Failed to analyze {domain}: {e}")
-            return self._mock_competitor(domain)
+            return self._mock_competitor(domain), self._mock_pages(domain)
+
+    async def _get(self, url: str) -> httpx.Response:
+        """Fetch a URL through the per-host competitor bucket, backing off and retrying after 429s.
+
+        The last 429 response is returned once retries run out; callers treat non-200 as a miss.
+        """
+        provider = f"competitor:{urlparse(url).netloc}"
+        client = self._get_http_client()
+        for attempt in range(settings.max_retries):
+            await rate_limiter.acquire(provider)
+            resp = await client.get(url)
+            if resp.status_code == 429:
+                rate_limiter.report_throttled(provider, parse_retry_after(resp.headers.get("Retry-After")))
+                if attempt < settings.max_retries - 1:
+                    continue
+                return resp
+            rate_limiter.report_success(provider)
+            return resp
+        raise RuntimeError(f"Competitor request not attempted: max_retries is {settings.max_retries}")
 
     async def _scrape_page(self, url: str) -> Optional[CompetitorContent]:
         """Scrape a single page for content metadata."""
         try:
-            import requests
             from bs4 import BeautifulSoup
 
-            resp = requests.get(url, timeout=10, headers={"User-Agent": "MDAI-TopicIntel/1.0"})
+            resp = await self._get(url)
             if resp.status_code != 200:
                 return None
 
@@ -151,12 +216,19 @@ class CompetitiveScraperAgent(BaseAgent):
             logger.debug(f"Failed to scrape {url}: {e}")
             return None
 
-    def _mock_competitor(self, domain: str) -> Competitor:
-        """Return mock competitor data for testing."""
-        mock = MOCK_COMPETITOR_DATA.get(domain, {
+    def _mock_entry(self, domain: str) -> Dict[str, Any]:
+        return MOCK_COMPETITOR_DATA.get(domain, {
             "name": domain.split(".")[0].title(),
             "pages": [{"url": f"https://{domain}", "title": f"{domain} Homepage", "word_count": 1000}],
         })
+
+    def _mock_pages(self, domain: str) -> List[CompetitorContent]:
+        """Return mock crawled pages for testing."""
+        return [CompetitorContent(**page) for page in self._mock_entry(domain).get("pages", [])]
+
+    def _mock_competitor(self, domain: str) -> Competitor:
+        """Return mock competitor data for testing."""
+        mock = self._mock_entry(domain)
         return Competitor(
             domain=domain,
             name=mock.get("name", domain),
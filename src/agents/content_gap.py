@@ -60,7 +60,7 @@ class ContentGapAgent(BaseAgent):
         )
 
         logger.info(f"Identified {len(gaps)} content gaps, top score: {output.metadata.get('top_gap_score', 0):.4f}")
-        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata)
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
 
     def _calculate_coverage(self, topic: TopicCategory, competitors: List[Competitor]) -> float:
         """Calculate what fraction of competitors cover this topic."""
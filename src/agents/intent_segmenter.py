@@ -1,15 +1,17 @@
 """Intent Segmenter agent — classifies keywords by query intent."""
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
+import numpy as np
+import scipy.sparse as sp
 from loguru import logger
 
 from agents.base_agent import BaseAgent
 from contracts.intent_segmenter import IntentSegmentInput, IntentSegmentOutput
 from core.config import settings
 from models.base import AgentResponse
-from models.keywords import Keyword
+from models.keyword_frame import KeywordFrame
 from models.segments import AudiencePersona, IntentSegment
 
 
@@ -50,51 +52,134 @@ INTENT_PATTERNS = {
 }
 
 
+def _intent_alternations(intent_patterns: Dict[str, Dict[str, Any]]) -> Tuple[str, Dict[str, str]]:
+    """Shared ``\\b`` prefix (when every pattern starts with one) and each intent's pattern alternation."""
+    patterns = [p for intent_def in intent_patterns.values() for p in intent_def["patterns"]]
+    prefix = r"\b" if all(p.startswith(r"\b") for p in patterns) else ""
+    alternations = {
+        name: "|".join(f"(?:{p[len(prefix):]})" for p in intent_def["patterns"])
+        for name, intent_def in intent_patterns.items()
+    }
+    return prefix, alternations
+
+
+def compile_intent_matcher(intent_patterns: Dict[str, Dict[str, Any]]) -> Pattern:
+    """One regex for every intent: a lookahead alternation with a named group per intent.
+
+    The lookahead is zero-width, so ``finditer`` reports every start position where some
+    pattern matches instead of skipping text consumed by an earlier match. Alternatives are
+    in priority order, so at each position the group that matched is the highest-priority
+    intent starting there. Intent patterns must not contain capturing groups.
+
+    When every pattern starts with a word boundary, the ``\\b`` is hoisted out of the
+    lookahead so the alternation is only tried at word starts.
+    """
+    prefix, alternations = _intent_alternations(intent_patterns)
+    alternatives = "|".join(f"(?P<{name}>{alternation})" for name, alternation in alternations.items())
+    return re.compile(f"{prefix}(?=(?:{alternatives}))")
+
+
+def compile_intent_lookaheads(intent_patterns: Dict[str, Dict[str, Any]]) -> Pattern:
+    """One regex with a separate optional lookahead (and named group) per intent.
+
+    Every lookahead is tried at every position, so a match's ``groupdict()`` names all
+    intents with a pattern starting there, not just the highest-priority one.
+    """
+    prefix, alternations = _intent_alternations(intent_patterns)
+    lookaheads = "".join(f"(?:(?=(?P<{name}>{alternation})))?" for name, alternation in alternations.items())
+    return re.compile(f"{prefix}{lookaheads}")
+
+
+_INTENT_MATCHER = compile_intent_matcher(INTENT_PATTERNS)
+_INTENT_LOOKAHEADS = compile_intent_lookaheads(INTENT_PATTERNS)
+_INTENT_NAMES = list(INTENT_PATTERNS)
+SCORING_MODES = ("first_match", "weighted")
+_INTENT_PRIORITY = {name: rank for rank, name in enumerate(_INTENT_NAMES)}
+
+
+def classify_intent(term: str) -> Optional[str]:
+    """First intent in ``INTENT_PATTERNS`` order with a pattern matching `term`, in one scan."""
+    best = None
+    for match in _INTENT_MATCHER.finditer(term.lower()):
+        intent = match.lastgroup
+        if intent is None:
+            continue
+        rank = _INTENT_PRIORITY[intent]
+        if best is None or rank < best:
+            if rank == 0:
+                return intent
+            best = rank
+    return None if best is None else _INTENT_NAMES[best]
+
+
+def intent_weight_matrix(
+    terms: List[str], intent_patterns: Optional[Dict[str, Dict[str, Any]]] = None
+) -> sp.csr_matrix:
+    """Sparse (len(terms), n_intents) multi-label intent weights.
+
+    A keyword's weight for an intent is its share of the keyword's pattern matches, so
+    every matched row sums to 1 and unmatched rows are empty. Each intent matching at a
+    position counts once. Columns follow the order of `intent_patterns`
+    (default ``INTENT_PATTERNS``).
+    """
+    if intent_patterns is None:
+        matcher, names = _INTENT_LOOKAHEADS, _INTENT_NAMES
+    else:
+        matcher, names = compile_intent_lookaheads(intent_patterns), list(intent_patterns)
+    column = {name: j for j, name in enumerate(names)}
+    rows: List[int] = []
+    cols: List[int] = []
+    for i, term in enumerate(terms):
+        for match in matcher.finditer(term.lower()):
+            for intent, matched in match.groupdict().items():
+                if matched is not None:
+                    rows.append(i)
+                    cols.append(column[intent])
+    # Duplicate (row, intent) entries are summed into match counts
+    counts = sp.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(terms), len(names)), dtype=np.float64
+    )
+    totals = np.asarray(counts.sum(axis=1)).ravel()
+    scale = np.divide(1.0, totals, out=np.zeros_like(totals), where=totals > 0)
+    return sp.csr_matrix(sp.diags(scale) @ counts)
+
+
+def _segment(intent_name: str, terms: List[str], demand: float, examples: List[str]) -> IntentSegment:
+    return IntentSegment(
+        name=intent_name.replace("_", " ").title(),
+        description=INTENT_PATTERNS.get(intent_name, {}).get("description", "Other/unclassified queries"),
+        query_intents=[intent_name],
+        keywords=terms,
+        demand_signal=round(demand, 4),
+        example_queries=examples,
+    )
+
+
 class IntentSegmenterAgent(BaseAgent):
-    """Segments keywords by query intent using pattern matching."""
+    """Segments keywords by query intent using pattern matching.
+
+    ``scoring="first_match"`` puts each keyword in the first intent it matches;
+    ``scoring="weighted"`` scores every intent through a sparse keyword x intent matrix,
+    so segments can share keywords.
+    """
 
     def __init__(self):
         super().__init__(name="IntentSegmenter", model=settings.default_model)
 
     async def process(self, input_data: IntentSegmentInput) -> AgentResponse:
         self.start_task()
-        logger.info(f"Segmenting {len(input_data.keywords)} keywords by intent")
+        frame = KeywordFrame.coerce(input_data.keywords)
+        logger.info(f"Segmenting {len(frame)} keywords by intent")
 
-        # Classify each keyword
-        intent_buckets: Dict[str, List[Keyword]] = {intent: [] for intent in INTENT_PATTERNS}
-        intent_buckets["other"] = []
-
-        for kw in input_data.keywords:
-            matched = False
-            for intent_name, intent_def in INTENT_PATTERNS.items():
-                for pattern in intent_def["patterns"]:
-                    if re.search(pattern, kw.term.lower()):
-                        intent_buckets[intent_name].append(kw)
-                        matched = True
-                        break
-                if matched:
-                    break
-            if not matched:
-                intent_buckets["other"].append(kw)
-
-        # Build IntentSegment objects
-        segments = []
-        for intent_name, keywords in intent_buckets.items():
-            if not keywords:
-                continue
-
-            desc = INTENT_PATTERNS.get(intent_name, {}).get("description", "Other/unclassified queries")
-            demand = sum(kw.trends_momentum or 0 for kw in keywords) / len(keywords) if keywords else 0
+        scoring = input_data.scoring if input_data.scoring in SCORING_MODES else "first_match"
+        if scoring != input_data.scoring:
+            logger.warning(f"Unknown scoring mode '{input_data.scoring}', using first_match")
 
-            segment = IntentSegment(
-                name=intent_name.replace("_", " ").title(),
-                description=desc,
-                query_intents=[intent_name],
-                keywords=[kw.term for kw in keywords],
-                demand_signal=round(demand, 4),
-                example_queries=[kw.term for kw in keywords[:5]],
-            )
-            segments.append(segment)
+        weights = None
+        if scoring == "weighted":
+            segments, weights, metadata = self._weighted_segments(frame)
+        else:
+            segments, metadata = self._first_match_segments(frame)
 
         # Generate personas (lightweight, no LLM needed for V0)
         personas = []
@@ -104,11 +189,73 @@ class IntentSegmenterAgent(BaseAgent):
         output = IntentSegmentOutput(
             segments=segments,
             personas=personas,
-            metadata={"total_segments": len(segments), "unclassified": len(intent_buckets.get("other", []))},
+            weights=weights,
+            metadata={"total_segments": len(segments), "scoring": scoring, **metadata},
         )
 
         logger.info(f"Created {len(segments)} intent segments")
-        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata)
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
+
+    def _first_match_segments(self, frame: KeywordFrame) -> Tuple[List[IntentSegment], Dict[str, Any]]:
+        """One intent per keyword: the first in ``INTENT_PATTERNS`` order that matches."""
+        intent_buckets: Dict[str, List[int]] = {intent: [] for intent in INTENT_PATTERNS}
+        intent_buckets["other"] = []
+        for i, term in enumerate(frame.terms):
+            intent_buckets[classify_intent(term) or "other"].append(i)
+
+        momentum = frame.filled("momentum")
+        segments = []
+        for intent_name, rows in intent_buckets.items():
+            if not rows:
+                continue
+            terms = [frame.terms[i] for i in rows]
+            segments.append(_segment(intent_name, terms, float(momentum[rows].mean()), terms[:5]))
+        return segments, {"unclassified": len(intent_buckets["other"])}
+
+    def _weighted_segments(self, frame: KeywordFrame) -> Tuple[List[IntentSegment], sp.csr_matrix, Dict[str, Any]]:
+        """Multi-label segments from the keyword x intent weight matrix.
+
+        A keyword joins every intent it matches. Segment demand is the weight-averaged
+        momentum of its keywords, examples are its highest-weight keywords, and overlap
+        counts the keywords each pair of intents shares.
+        """
+        weights = intent_weight_matrix(frame.terms)
+        momentum = frame.filled("momentum")
+        mass = np.asarray(weights.sum(axis=0)).ravel()
+        demand = np.divide(weights.T @ momentum, mass, out=np.zeros_like(mass), where=mass > 0)
+        members = (weights > 0).astype(np.int32)
+        shared = (members.T @ members).toarray()
+        intents_per_keyword = np.asarray(members.sum(axis=1)).ravel()
+
+        by_intent = weights.tocsc()
+        by_intent.sort_indices()
+        segments = []
+        for j, intent_name in enumerate(_INTENT_NAMES):
+            start, stop = by_intent.indptr[j], by_intent.indptr[j + 1]
+            if start == stop:
+                continue
+            rows = by_intent.indices[start:stop]
+            top = rows[np.argsort(-by_intent.data[start:stop], kind="stable")[:5]]
+            terms = [frame.terms[i] for i in rows.tolist()]
+            examples = [frame.terms[i] for i in top.tolist()]
+            segments.append(_segment(intent_name, terms, float(demand[j]), examples))
+
+        unmatched = np.flatnonzero(intents_per_keyword == 0)
+        if unmatched.size:
+            terms = [frame.terms[i] for i in unmatched.tolist()]
+            segments.append(_segment("other", terms, float(momentum[unmatched].mean()), terms[:5]))
+
+        overlap = {
+            _INTENT_NAMES[a]: {_INTENT_NAMES[b]: int(shared[a, b]) for b in np.flatnonzero(shared[a]).tolist() if b != a}
+            for a in range(len(_INTENT_NAMES))
+        }
+        metadata = {
+            "unclassified": int(unmatched.size),
+            "multi_intent": int((intents_per_keyword > 1).sum()),
+            "intents": list(_INTENT_NAMES),
+            "overlap": {name: pairs for name, pairs in overlap.items() if pairs},
+        }
+        return segments, weights, metadata
 
     def _generate_basic_personas(self, segments: List[IntentSegment]) -> List[AudiencePersona]:
         """Generate basic audience personas from intent segments (no LLM, rule-based V0)."""
@@ -0,0 +1,112 @@
+"""Keyword Deduplicator agent — collapses near-duplicate research terms before clustering."""
+
+from typing import Dict, Iterable, List
+
+from loguru import logger
+
+from agents.base_agent import BaseAgent
+from contracts.keyword_deduplicator import KeywordDedupInput, KeywordDedupOutput
+from core.config import settings
+from models.base import AgentResponse
+from models.keyword_frame import KeywordFrame
+from models.keywords import Keyword
+from pipeline.near_duplicates import MinHashLSH, group_near_duplicates
+from storage.timeseries import normalize_keyword
+
+
+def _ordered_union(lists: Iterable[List[str]], exclude: set) -> List[str]:
+    """Concatenate lists keeping the first occurrence of each normalized entry."""
+    seen = set(exclude)
+    merged = []
+    for items in lists:
+        for item in items:
+            key = normalize_keyword(item)
+            if key not in seen:
+                seen.add(key)
+                merged.append(item)
+    return merged
+
+
+def merge_group(members: List[Keyword]) -> Keyword:
+    """Canonical keyword for a near-duplicate group.
+
+    The representative is the member with the highest volume, then Trends interest, then
+    the shortest term. It keeps its own volume, CPC and intent; PAA, related queries and
+    SERP features are unioned across the group, and Trends interest/momentum come from
+    the member with the highest interest.
+    """
+    representative = min(
+        members,
+        key=lambda kw: (-(kw.volume if kw.volume is not None else -1),
+                        -(kw.trends_interest if kw.trends_interest is not None else -1),
+                        len(kw.term)),
+    )
+    if len(members) == 1:
+        return representative
+    ordered = [representative] + [kw for kw in members if kw is not representative]
+    member_terms = {normalize_keyword(kw.term) for kw in members}
+    with_trends = [kw for kw in ordered if kw.trends_interest is not None]
+    trends_source = max(with_trends, key=lambda kw: kw.trends_interest) if with_trends else representative
+    return representative.model_copy(update={
+        "related_queries": _ordered_union((kw.related_queries for kw in ordered), member_terms),
+        "people_also_ask": _ordered_union((kw.people_also_ask for kw in ordered), set()),
+        "serp_features": _ordered_union((kw.serp_features for kw in ordered), set()),
+        "trends_interest": trends_source.trends_interest,
+        "trends_momentum": (
+            trends_source.trends_momentum if trends_source.trends_momentum is not None
+            else representative.trends_momentum
+        ),
+    })
+
+
+class KeywordDeduplicatorAgent(BaseAgent):
+    """Groups near-identical keywords (plurals, reordered words, small typos) and keeps one per group.
+
+    Terms are reduced to a canonical form (lowercase, punctuation dropped, plurals
+    stripped, tokens sorted); identical forms merge directly and the remaining forms
+    are grouped with shingled MinHash and LSH banding, so cost grows roughly linearly
+    with the number of terms instead of pairwise. Question words and negations are
+    never folded away, so "how to improve leadership" stays apart from "improve leadership".
+    """
+
+    def __init__(self):
+        super().__init__(name="KeywordDeduplicator", model=settings.default_model)
+
+    async def process(self, input_data: KeywordDedupInput) -> AgentResponse:
+        self.start_task()
+        keywords = KeywordFrame.coerce(input_data.keywords).to_keywords()
+        threshold = input_data.threshold or settings.dedup_threshold
+        lsh = MinHashLSH(
+            num_perm=settings.dedup_num_perm,
+            bands=settings.dedup_bands,
+            threshold=threshold,
+            shingle_size=settings.dedup_shingle_size,
+        )
+        groups = group_near_duplicates([kw.term for kw in keywords], lsh)
+
+        canonical: List[Keyword] = []
+        group_terms: Dict[str, List[str]] = {}
+        mapping: Dict[str, str] = {}
+        for indices in groups:
+            members = [keywords[i] for i in indices]
+            merged = merge_group(members)
+            canonical.append(merged)
+            terms = list(dict.fromkeys(kw.term for kw in members))
+            # Identical terms share a canonical form, so each canonical term heads one group
+            group_terms[merged.term] = terms
+            for term in terms:
+                mapping[term] = merged.term
+
+        output = KeywordDedupOutput(
+            keywords=canonical,
+            groups={term: members for term, members in group_terms.items() if len(members) > 1},
+            mapping=mapping,
+            metadata={
+                "input_keywords": len(keywords),
+                "output_keywords": len(canonical),
+                "merged": len(keywords) - len(canonical),
+                "threshold": threshold,
+            },
+        )
+        logger.info(f"Deduplicated {len(keywords)} keywords to {len(canonical)} ({len(keywords) - len(canonical)} merged)")
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
@@ -1,6 +1,8 @@
 """Keyword Researcher agent — discovers keywords via SerpAPI and Google Trends."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -10,7 +12,9 @@ from core.config import settings
 from integrations.google_trends_client import GoogleTrendsClient
 from integrations.serpapi_client import SerpApiClient
 from models.base import AgentResponse
-from models.keywords import Keyword
+from models.keywords import Keyword, KeywordGraph
+from pipeline.keyword_graph import KeywordGraphExpander
+from utils.trend_signals import score_series
 
 
 class KeywordResearcherAgent(BaseAgent):
@@ -23,29 +27,48 @@ class KeywordResearcherAgent(BaseAgent):
 
     async def process(self, input_data: KeywordResearchInput) -> AgentResponse:
         self.start_task()
-        logger.info(f"Starting keyword research for {len(input_data.queries)} queries")
+        max_in_flight = input_data.max_concurrency or settings.research_max_concurrency
+        logger.info(
+            f"Starting keyword research for {len(input_data.queries)} queries (max_in_flight={max_in_flight})"
+        )
+
+        serp_results = await self._research_all(input_data.queries, max_in_flight, input_data.force_refresh)
 
         all_keywords: List[Keyword] = []
         seen_terms: set = set()
+        query_latency: Dict[str, float] = {}
 
-        for query in input_data.queries:
-            # Get SERP data
-            serp_keywords = await self._research_serp(query)
+        # Merge in query order so output matches sequential execution
+        for query, (serp_keywords, latency) in zip(input_data.queries, serp_results, strict=True):
+            query_latency[query] = latency
             for kw in serp_keywords:
                 if kw.term.lower() not in seen_terms:
                     seen_terms.add(kw.term.lower())
                     all_keywords.append(kw)
 
-            # Get trends data if enabled
-            if input_data.include_trends:
-                trends_data = self._enrich_with_trends(query, all_keywords)
+        graph: Optional[KeywordGraph] = None
+        if input_data.expand_depth > 0:
+            graph = await self._expand_graph(input_data)
+            for term in graph.nodes:
+                if term not in seen_terms:
+                    seen_terms.add(term)
+                    all_keywords.append(Keyword(term=term, source="graph_expansion"))
+
+        # Get trends data if enabled
+        if input_data.include_trends:
+            await self._enrich_with_trends(all_keywords, input_data.force_refresh)
 
         output = KeywordResearchOutput(
             keywords=all_keywords,
             total_discovered=len(all_keywords),
+            graph=graph,
             metadata={
                 "queries_processed": len(input_data.queries),
+                "graph_terms": len(graph.nodes) if graph else 0,
+                "graph_queries": graph.queries_used if graph else 0,
                 "sources": ["serpapi", "trends"] if input_data.include_trends else ["serpapi"],
+                "max_concurrency": max_in_flight,
+                "query_latency_seconds": query_latency,
             },
         )
 
@@ -53,23 +76,54 @@ class KeywordResearcherAgent(BaseAgent):
             status="success",
             data=output.model_dump(),
             metadata=output.metadata,
+            output=output,
         )
 
-    async def _research_serp(self, query: str) -> List[Keyword]:
+    async def _research_all(
+        self, queries: List[str], max_in_flight: int, force_refresh: bool = False
+    ) -> List[Tuple[List[Keyword], float]]:
+        """Research all queries concurrently, bounded by max_in_flight. Results keep input order."""
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def run(query: str) -> Tuple[List[Keyword], float]:
+            async with semaphore:
+                started = time.perf_counter()
+                keywords = await self._research_serp(query, force_refresh)
+                return keywords, round(time.perf_counter() - started, 4)
+
+        return list(await asyncio.gather(*(run(query) for query in queries)))
+
+    async def _expand_graph(self, input_data: KeywordResearchInput) -> KeywordGraph:
+        """Breadth-first expansion of the seed queries into a keyword graph."""
+        expander = KeywordGraphExpander(
+            self.serpapi,
+            self.trends if input_data.include_trends else None,
+            max_depth=input_data.expand_depth,
+            max_queries=input_data.expand_max_queries,
+            max_terms=input_data.expand_max_terms,
+            workers=input_data.max_concurrency,
+            force_refresh=input_data.force_refresh,
+        )
+        return await expander.expand(input_data.queries)
+
+    async def _research_serp(self, query: str, force_refresh: bool = False) -> List[Keyword]:
         """Research a single query via SerpAPI."""
         keywords = []
 
         try:
+            # One SERP payload feeds related searches, PAA and features
+            result = await self.serpapi.search(query, force_refresh=force_refresh)
+
             # Get related searches
-            related = await self.serpapi.get_related_searches(query)
+            related = self.serpapi.parse_related_searches(result)
             for term in related:
                 keywords.append(Keyword(term=term, source="serpapi_related"))
 
             # Get PAA questions
-            paa = await self.serpapi.get_people_also_ask(query)
+            paa = self.serpapi.parse_people_also_ask(result)
 
             # Get SERP features for the main query
-            features = await self.serpapi.get_serp_features(query)
+            features = self.serpapi.parse_serp_features(result)
 
             # Create main keyword entry
             main_kw = Keyword(
@@ -86,21 +140,39 @@ class KeywordResearcherAgent(BaseAgent):
 
         return keywords
 
-    def _enrich_with_trends(self, query: str, keywords: List[Keyword]) -> None:
-        """Enrich keywords with Google Trends data."""
-        try:
-            trends_data = self.trends.get_interest_over_time([query])
-            interest_values = trends_data.get("interest_over_time", {}).get(query, [])
+    async def _enrich_with_trends(self, keywords: List[Keyword], force_refresh: bool = False) -> None:
+        """Enrich every keyword without Trends data (seed, related, PAA and graph terms).
 
-            if interest_values:
-                momentum = self.trends.calculate_momentum(interest_values)
-                current_interest = interest_values[-1] if interest_values else None
+        Terms are deduplicated case-insensitively and fetched in 5-keyword batches
+        off the event loop; every keyword whose term matches gets the result.
 
-                for kw in keywords:
-                    if kw.term.lower() == query.lower():
-                        kw.trends_interest = current_interest
-                        kw.trends_momentum = momentum
-                        break
+        Trends scales each batch to its largest keyword, so raw values depend on the
+        batch partners. Only scale-free signals are kept: momentum is a ratio within
+        the series, and interest is the latest value relative to the keyword's own peak,
+        as a single-keyword request would report it.
+        """
+        terms = list(dict.fromkeys(" ".join(kw.term.lower().split()) for kw in keywords if kw.trends_interest is None))
+        if not terms:
+            return
 
+        try:
+            trends_data = await self.trends.get_interest_over_time_async(terms, force_refresh=force_refresh)
         except Exception as e:
-            logger.error(f"Trends enrichment failed for '{query}': {e}")
+            logger.error(f"Trends enrichment failed for {len(terms)} terms: {e}")
+            return
+
+        interest = trends_data.get("interest_over_time", {})
+        series = {term: interest[term] for term in terms if interest.get(term)}
+        scores = score_series(series)
+        signals = {term: (_own_scale_latest(values), scores[term]["momentum"]) for term, values in series.items()}
+
+        for kw in keywords:
+            signal = signals.get(" ".join(kw.term.lower().split())) if kw.trends_interest is None else None
+            if signal:
+                kw.trends_interest, kw.trends_momentum = signal
+
+
+def _own_scale_latest(values: List[float]) -> int:
+    """Latest interest rescaled so the series peaks at 100, independent of batch partners."""
+    peak = max(values)
+    return round(values[-1] * 100 / peak) if peak > 0 else 0
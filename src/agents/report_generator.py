@@ -4,15 +4,29 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from loguru import logger
 
 from agents.base_agent import BaseAgent
 from contracts.report_generator import ReportInput, ReportOutput
 from core.config import settings
 from models.base import AgentResponse
-from models.keywords import Keyword, KeywordCluster
+from models.keyword_frame import KeywordFrame
+from models.keywords import KeywordCluster
 from models.segments import IntentSegment
 from models.topics import TopicCategory
+from utils.trend_signals import round_exact
+
+# Demand signal weights
+DEMAND_W_TRENDS = 0.30
+DEMAND_W_SERP = 0.30
+DEMAND_W_PAA = 0.20
+DEMAND_W_VOLUME = 0.20
+
+
+def _int_or_na(value: float) -> str:
+    """Table cell for an optional integer column (missing or zero shows N/A)."""
+    return str(int(value)) if value and not np.isnan(value) else "N/A"
 
 
 class ReportGeneratorAgent(BaseAgent):
@@ -23,6 +37,7 @@ class ReportGeneratorAgent(BaseAgent):
 
     async def process(self, input_data: ReportInput) -> AgentResponse:
         self.start_task()
+        frame = KeywordFrame.coerce(input_data.keywords)
         logger.info(f"Generating {input_data.config.output_format} report: {input_data.config.title}")
 
         sections = []
@@ -32,7 +47,7 @@ class ReportGeneratorAgent(BaseAgent):
 
         # Top Keywords by Demand Signal
         if "top_keywords" in input_data.config.sections:
-            sections.append(self._build_top_keywords(input_data.keywords))
+            sections.append(self._build_top_keywords(frame))
 
         # Topic Clusters
         if "topic_clusters" in input_data.config.sections:
@@ -52,7 +67,7 @@ class ReportGeneratorAgent(BaseAgent):
 
         # Momentum & Breakout Trends
         if "momentum_trends" in input_data.config.sections:
-            sections.append(self._build_momentum_trends(input_data.keywords))
+            sections.append(self._build_momentum_trends(frame))
 
         # Assemble report
         content = self._assemble_report(input_data.config.title, input_data.config.query, sections)
@@ -70,22 +85,23 @@ class ReportGeneratorAgent(BaseAgent):
             metadata={"sections": len(sections), "keywords_analyzed": len(input_data.keywords)},
         )
 
-        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata)
-
-    def _calculate_demand_signal(self, kw: Keyword) -> float:
-        """Calculate composite demand signal for a keyword."""
-        w_trends = 0.30
-        w_serp = 0.30
-        w_paa = 0.20
-        w_volume = 0.20
-
-        trends_score = max(min(kw.trends_momentum or 0, 1.0), 0.0)
-        serp_score = min(len(kw.serp_features) / 6, 1.0)
-        paa_score = min(len(kw.people_also_ask) / 10, 1.0)
-        volume_score = min((kw.volume or 0) / 10000, 1.0)
-
-        signal = (trends_score * w_trends) + (serp_score * w_serp) + (paa_score * w_paa) + (volume_score * w_volume)
-        return round(signal, 4)
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
+
+    @staticmethod
+    def _demand_signals(frame: KeywordFrame) -> np.ndarray:
+        """Composite demand signal for every row of a frame (see docs/scoring-spec.md)."""
+        trends_score = np.clip(frame.filled("momentum"), 0.0, 1.0)
+        serp_score = np.minimum(frame.serp_feature_count / 6, 1.0)
+        paa_score = np.minimum(frame.paa_count / 10, 1.0)
+        volume_score = np.minimum(frame.filled("volume") / 10000, 1.0)
+        signal = (
+            (trends_score * DEMAND_W_TRENDS)
+            + (serp_score * DEMAND_W_SERP)
+            + (paa_score * DEMAND_W_PAA)
+            + (volume_score * DEMAND_W_VOLUME)
+        )
+        rounded: np.ndarray = round_exact(signal, 4)
+        return rounded
 
     def _calculate_opportunity_score(self, demand: float, competition: Optional[float], cpc: Optional[float]) -> float:
         """Calculate opportunity score."""
@@ -108,21 +124,21 @@ class ReportGeneratorAgent(BaseAgent):
 - **Report Generated**: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}
 """
 
-    def _build_top_keywords(self, keywords: List[Keyword]) -> str:
+    def _build_top_keywords(self, frame: KeywordFrame) -> str:
         """Build top keywords section ranked by demand signal."""
-        scored = [(kw, self._calculate_demand_signal(kw)) for kw in keywords]
-        scored.sort(key=lambda x: x[1], reverse=True)
-        top_20 = scored[:20]
+        demand = self._demand_signals(frame)
+        # Stable descending order keeps input order among ties, like list.sort(reverse=True)
+        top_20 = np.argsort(-demand, kind="stable")[:20].tolist()
 
         lines = ["## Top Keywords by Demand Signal\n"]
         lines.append("| Rank | Keyword | Demand Signal | Volume | Trends | PAA Count |")
         lines.append("|------|---------|--------------|--------|--------|-----------|")
 
-        for i, (kw, demand) in enumerate(top_20, 1):
-            vol = str(kw.volume) if kw.volume else "N/A"
-            trends = str(kw.trends_interest) if kw.trends_interest else "N/A"
-            paa = str(len(kw.people_also_ask))
-            lines.append(f"| {i} | {kw.term} | {demand:.4f} | {vol} | {trends} | {paa} |")
+        for i, row in enumerate(top_20, 1):
+            vol = _int_or_na(frame.volume[row])
+            trends = _int_or_na(frame.interest[row])
+            paa = str(frame.paa_count[row])
+            lines.append(f"| {i} | {frame.terms[row]} | {demand[row]:.4f} | {vol} | {trends} | {paa} |")
 
         return "\n".join(lines) + "\n"
 
@@ -176,19 +192,21 @@ class ReportGeneratorAgent(BaseAgent):
 
         return "\n".join(lines) + "\n"
 
-    def _build_momentum_trends(self, keywords: List[Keyword]) -> str:
+    def _build_momentum_trends(self, frame: KeywordFrame) -> str:
         """Build momentum and breakout trends section."""
-        trending = [(kw, kw.trends_momentum or 0) for kw in keywords if (kw.trends_momentum or 0) > 0]
-        trending.sort(key=lambda x: x[1], reverse=True)
+        momentum = frame.filled("momentum")
+        rising = np.flatnonzero(momentum > 0)
+        trending = rising[np.argsort(-momentum[rising], kind="stable")][:15].tolist()
 
         lines = ["## Momentum & Breakout Trends\n"]
         lines.append("| Keyword | Momentum | Trends Interest | Status |")
         lines.append("|---------|----------|----------------|--------|")
 
-        for kw, momentum in trending[:15]:
-            interest = str(kw.trends_interest) if kw.trends_interest else "N/A"
-            status = "BREAKOUT" if momentum > 1.0 else ("Rising" if momentum > 0.2 else "Stable")
-            lines.append(f"| {kw.term} | {momentum:.4f} | {interest} | {status} |")
+        for row in trending:
+            value = momentum[row]
+            interest = _int_or_na(frame.interest[row])
+            status = "BREAKOUT" if value > 1.0 else ("Rising" if value > 0.2 else "Stable")
+            lines.append(f"| {frame.terms[row]} | {value:.4f} | {interest} | {status} |")
 
         return "\n".join(lines) + "\n"
 
@@ -1,10 +1,13 @@
 """Topic Clusterer agent — groups keywords into semantic topic clusters."""
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 from loguru import logger
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import silhouette_score
 
@@ -12,87 +15,419 @@ from agents.base_agent import BaseAgent
 from contracts.topic_clusterer import TopicClusterInput, TopicClusterOutput
 from core.config import settings
 from models.base import AgentResponse
-from models.keywords import Keyword, KeywordCluster
+from models.keyword_frame import KeywordFrame
+from models.keywords import KeywordCluster
 from models.topics import TopicCategory
+from pipeline.cluster_model import FittedClusterModel
+from pipeline.text_features import HashingTfidfVectorizer
+from storage.cache import CacheManager
+from storage.cluster_models import ClusterModelStore
+from storage.payloads import canonical_json
+from storage.timeseries import normalize_keyword
+
+CLUSTERING_METHODS = ("tfidf_kmeans", "tfidf_minibatch")
+FEATURE_MODES = ("tfidf", "hashing")
+CLUSTER_CACHE_SOURCE = "topic_clusters"
+SILHOUETTE_SEED = 42
+
+
+def cluster_fingerprint(
+    terms: List[str], n_clusters_range: Tuple[int, int], method: str, features: str, k_selection: str
+) -> str:
+    """Order-independent sha256 of the normalized term multiset and the settings that shape the result."""
+    key = {
+        "terms": sorted(normalize_keyword(t) for t in terms),
+        "n_clusters_range": list(n_clusters_range),
+        "method": method,
+        "features": features,
+        "k_selection": k_selection,
+    }
+    return hashlib.sha256(canonical_json(key)).hexdigest()
+
+
+def _make_model(method: str, k: int, batch_size: int):
+    if method == "tfidf_minibatch":
+        return MiniBatchKMeans(n_clusters=k, batch_size=batch_size, n_init=3, random_state=42)
+    return KMeans(n_clusters=k, random_state=42, n_init=10)
+
+
+def _fit_candidate(
+    tfidf_matrix, k: int, method: str, sample_size: Optional[int], batch_size: int
+) -> Tuple[int, Optional[float], Any, np.ndarray]:
+    """Fit one candidate k and score it; the score is None when all points share one label.
+
+    Module-level (and free of ``settings`` reads) so joblib worker processes can run it.
+    """
+    model = _make_model(method, k, batch_size)
+    labels = model.fit_predict(tfidf_matrix)
+    if np.unique(labels).size < 2:
+        return k, None, model, labels
+    if sample_size is None or sample_size >= tfidf_matrix.shape[0]:
+        score = silhouette_score(tfidf_matrix, labels)
+    else:
+        score = silhouette_score(tfidf_matrix, labels, sample_size=sample_size, random_state=SILHOUETTE_SEED)
+    return k, float(score), model, labels
+
+
+def _better(best: Optional[Tuple], candidate: Tuple) -> Optional[Tuple]:
+    """Keep the higher-scoring fitted candidate; ties keep the smaller (earlier) k."""
+    if candidate[1] is None:
+        return best
+    if best is None or candidate[1] > best[1]:
+        return candidate
+    return best
+
+
+def _sparse_nbytes(matrix) -> int:
+    """Bytes held by a CSR matrix's data, index and pointer arrays."""
+    return int(matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+        import sys
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
 
 
 class TopicClustererAgent(BaseAgent):
-    """Clusters keywords into topic groups using TF-IDF + KMeans."""
+    """Clusters keywords into topic groups using TF-IDF + KMeans.
+
+    ``tfidf_kmeans`` runs full-batch KMeans for every candidate k. ``tfidf_minibatch``
+    fits MiniBatchKMeans on the sparse TF-IDF matrix and scores k on a fixed-seed
+    silhouette sample, keeping memory bounded for large keyword sets. ``auto`` picks
+    between them at ``settings.clustering_scalable_threshold`` keywords.
+
+    ``k_selection="fast"`` scores candidate k values on a silhouette sample, fits them
+    in parallel across cores and stops once the score curve plateaus; every mode keeps
+    the best fitted model instead of refitting it.
 
-    def __init__(self):
+    ``features="hashing"`` replaces the fitted TF-IDF vocabulary with hashed n-grams and
+    an incrementally updated IDF, vectorizing keywords in chunks with memory fixed by
+    ``settings.clustering_hash_features`` rather than by vocabulary size.
+
+    With a ``model_store`` every fit is persisted (vectorizer, centroids, labels) and
+    ``mode="assign"`` places new keywords into a stored model's clusters, reporting
+    how far they sit from the centroids compared with the training keywords (drift).
+
+    With a ``cache`` a fit is keyed by ``cluster_fingerprint``; repeating the same
+    keyword set and settings reuses the stored assignments instead of reclustering.
+    """
+
+    def __init__(self, model_store: Optional[ClusterModelStore] = None, cache: Optional[CacheManager] = None):
         super().__init__(name="TopicClusterer", model=settings.clustering_model)
+        self.model_store = model_store
+        self.cache = cache
+
+    @staticmethod
+    def resolve_method(method: str, n_terms: int) -> str:
+        """Map the requested method (including "auto") to the clustering path to run."""
+        if method == "auto":
+            return "tfidf_minibatch" if n_terms >= settings.clustering_scalable_threshold else "tfidf_kmeans"
+        if method not in CLUSTERING_METHODS:
+            logger.warning(f"Unknown clustering method '{method}', using tfidf_kmeans")
+            return "tfidf_kmeans"
+        return method
 
     async def process(self, input_data: TopicClusterInput) -> AgentResponse:
         self.start_task()
-        terms = [kw.term for kw in input_data.keywords]
-        logger.info(f"Clustering {len(terms)} keywords (method={input_data.method})")
-
-        # NOTE: If keywords >= 2000, consider upgrading to embeddings + HDBSCAN
-        if len(terms) >= 2000:
-            logger.warning("Large keyword set (>=2000). Consider embeddings + HDBSCAN for better clustering.")
+        if input_data.mode == "assign":
+            return self._assign(input_data)
+        started = time.perf_counter()
+        frame = KeywordFrame.coerce(input_data.keywords)
+        terms = frame.terms
+        method = self.resolve_method(input_data.method, len(terms))
+        logger.info(f"Clustering {len(terms)} keywords (method={input_data.method} -> {method})")
 
         if len(terms) < 3:
             # Not enough keywords to cluster
             cluster = KeywordCluster(
                 cluster_id=0,
                 label="All Keywords",
-                keywords=input_data.keywords,
+                keywords=frame.to_keywords(),
                 size=len(terms),
             )
             topic = TopicCategory(name="All Keywords", keywords=terms)
             output = TopicClusterOutput(
                 clusters=[cluster],
                 topics=[topic],
-                method_used=input_data.method,
+                method_used=method,
             )
-            return self.create_response(status="success", data=output.model_dump())
+            return self.create_response(status="success", data=output.model_dump(), output=output)
+
+        features = input_data.features if input_data.features in FEATURE_MODES else "tfidf"
+        if features != input_data.features:
+            logger.warning(f"Unknown feature mode '{input_data.features}', using tfidf")
 
-        # TF-IDF vectorization
-        vectorizer = TfidfVectorizer(
-            max_features=5000,
-            stop_words="english",
-            ngram_range=(1, 2),
+        fingerprint = None
+        if self.cache is not None:
+            fingerprint = cluster_fingerprint(terms, input_data.n_clusters_range, method, features, input_data.k_selection)
+            cached = self.cache.lookup(CLUSTER_CACHE_SOURCE, fingerprint, force_refresh=input_data.force_refresh)
+            if cached is not None:
+                return self._from_cache(frame, cached, fingerprint, input_data.run_id, started)
+
+        vectorizer, tfidf_matrix, label_parts = self._vectorize(
+            terms, features, np.float32 if method == "tfidf_minibatch" else np.float64
         )
-        tfidf_matrix = vectorizer.fit_transform(terms)
+        vectorized = time.perf_counter()
 
         # Find optimal k via silhouette score
         min_k, max_k = input_data.n_clusters_range
         max_k = min(max_k, len(terms) - 1)
-        min_k = max(min_k, 2)
+        min_k = min(max(min_k, 2), max_k)
+
+        best_k, best_score, kmeans, cluster_labels, selection = self._select_k(
+            tfidf_matrix, min_k, max_k, method, input_data.k_selection
+        )
+        clustered = time.perf_counter()
+
+        centers = kmeans.cluster_centers_
+        clusters, topics = self._build_clusters(
+            frame,
+            cluster_labels,
+            lambda cluster_id, cluster_terms: " / ".join(label_parts(centers[cluster_id], cluster_terms)).title(),
+        )
+        model_id = self._save_model(
+            input_data, vectorizer, tfidf_matrix, cluster_labels, centers, clusters, method, features
+        )
+
+        output = TopicClusterOutput(
+            clusters=clusters,
+            topics=topics,
+            method_used=method,
+            metadata={
+                "features": features,
+                "model_id": model_id,
+                "optimal_k": best_k,
+                "silhouette_score": round(best_score, 4),
+                "n_keywords": len(terms),
+                **selection,
+                "timing_seconds": {
+                    "vectorize": round(vectorized - started, 4),
+                    "select_k": round(clustered - vectorized, 4),
+                    "total": round(time.perf_counter() - started, 4),
+                },
+                "memory": {
+                    "feature_matrix_mb": round(_sparse_nbytes(tfidf_matrix) / 1e6, 3),
+                    "peak_rss_mb": _peak_rss_mb(),
+                },
+            },
+        )
+        if self.cache is not None and fingerprint is not None:
+            output.metadata.update(cache_hit=False, fingerprint=fingerprint)
+            self.cache.store(CLUSTER_CACHE_SOURCE, fingerprint, {
+                "assignments": {normalize_keyword(t): int(c) for t, c in zip(terms, cluster_labels, strict=True)},
+                "labels": {str(c.cluster_id): c.label for c in clusters},
+                "method_used": method,
+                "metadata": output.metadata,
+            })
+
+        logger.info(f"Created {len(clusters)} clusters (silhouette={best_score:.4f}, method={method})")
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
+
+    def _from_cache(
+        self, frame: KeywordFrame, cached: Dict[str, Any], fingerprint: str, run_id: Optional[str], started: float
+    ) -> AgentResponse:
+        """Rebuild a cached clustering around the current keyword objects.
+
+        The cache holds term -> cluster assignments and labels rather than the keywords
+        themselves, so demand signals reflect this call's keyword metrics. `run_id` is linked
+        to the cached fit's stored model, so assign calls by run find it as after a refit.
+        """
+        assignments = cached["assignments"]
+        label_by_id = {int(cluster_id): label for cluster_id, label in cached["labels"].items()}
+        cluster_labels = np.array([assignments[normalize_keyword(t)] for t in frame.terms], dtype=np.int64)
+        clusters, topics = self._build_clusters(frame, cluster_labels, lambda cluster_id, _: label_by_id[cluster_id])
+        output = TopicClusterOutput(
+            clusters=clusters,
+            topics=topics,
+            method_used=cached["method_used"],
+            metadata={
+                **cached["metadata"],
+                "model_id": self._link_model(cached["metadata"].get("model_id"), run_id),
+                "cache_hit": True,
+                "fingerprint": fingerprint,
+                "timing_seconds": {"total": round(time.perf_counter() - started, 4)},
+            },
+        )
+        output.metadata.pop("memory", None)
+        logger.info(f"Cluster cache hit for {len(frame)} keywords ({fingerprint[:12]})")
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
+
+    def _assign(self, input_data: TopicClusterInput) -> AgentResponse:
+        """Place keywords into the clusters of a stored model without refitting.
+
+        Raises ValueError when no store is configured or no matching model exists.
+        """
+        started = time.perf_counter()
+        if self.model_store is None:
+            raise ValueError("assign mode needs a cluster model store")
+        model = self.model_store.load(model_id=input_data.model_id, run_id=input_data.run_id)
+        if model is None:
+            raise ValueError(f"No stored cluster model (model_id={input_data.model_id}, run_id={input_data.run_id})")
+
+        frame = KeywordFrame.coerce(input_data.keywords)
+        terms = frame.terms
+        assigned, distances, unknown = model.assign(terms)
+        label_by_id = dict(zip(model.cluster_ids, model.labels, strict=True))
+        clusters, topics = self._build_clusters(frame, assigned, lambda cluster_id, _: label_by_id[cluster_id])
+        drift = model.drift(distances, unknown, settings.clustering_refit_far_share)
+        if drift["refit_recommended"]:
+            logger.warning(f"Cluster drift: {drift['far_share']:.0%} of keywords are far from every centroid")
+
+        output = TopicClusterOutput(
+            clusters=clusters,
+            topics=topics,
+            method_used=model.method,
+            metadata={
+                "mode": "assign",
+                "model_id": model.model_id,
+                "features": model.features,
+                "n_keywords": len(terms),
+                "drift": drift,
+                "timing_seconds": {"total": round(time.perf_counter() - started, 4)},
+            },
+        )
+        logger.info(f"Assigned {len(terms)} keywords to {len(clusters)} existing clusters")
+        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata, output=output)
 
-        best_k = min_k
-        best_score = -1
+    def _save_model(
+        self, input_data: TopicClusterInput, vectorizer, matrix, cluster_labels: np.ndarray, centers: np.ndarray,
+        clusters: List[KeywordCluster], method: str, features: str,
+    ) -> Optional[str]:
+        """Persist the fit for later assign calls; returns the model_id (None without a store)."""
+        if self.model_store is None:
+            return None
+        if hasattr(vectorizer, "stop_words_"):
+            # Terms cut by max_features; only needed for introspection and can be large
+            del vectorizer.stop_words_
+        model = FittedClusterModel.from_fit(
+            vectorizer, matrix, cluster_labels, centers, {c.cluster_id: c.label for c in clusters}, method, features
+        )
+        model_id: str = self.model_store.save(model, input_data.run_id or "adhoc")
+        return model_id
+
+    def _link_model(self, model_id: Optional[str], run_id: Optional[str]) -> Optional[str]:
+        """Point this run at the cached fit's stored model; returns its model_id (None if unavailable)."""
+        if self.model_store is None or model_id is None:
+            return None
+        if not self.model_store.link(model_id, run_id or "adhoc"):
+            logger.warning(f"Cached cluster model {model_id} is no longer stored; assign by run will not find it")
+            return None
+        return model_id
+
+    @staticmethod
+    def _vectorize(
+        terms: List[str], features: str, dtype
+    ) -> Tuple[Any, Any, Callable[[np.ndarray, List[str]], List[str]]]:
+        """Fit the vectorizer; return it, the feature matrix and a (centroid, member terms) -> label parts function."""
+        if features == "hashing":
+            vectorizer = HashingTfidfVectorizer(n_features=settings.clustering_hash_features, dtype=dtype)
+            size = settings.clustering_hash_chunk_size
+            matrix = vectorizer.fit_transform_chunks(terms[i : i + size] for i in range(0, len(terms), size))
+            # Hashed columns have no names; label by the members' most frequent tokens
+            return vectorizer, matrix, lambda _, cluster_terms: vectorizer.top_tokens(cluster_terms, 3)
+
+        vectorizer = TfidfVectorizer(max_features=5000, stop_words="english", ngram_range=(1, 2), dtype=dtype)
+        matrix = vectorizer.fit_transform(terms)
+        feature_names = vectorizer.get_feature_names_out()
+        return vectorizer, matrix, lambda center, _: [feature_names[i] for i in center.argsort()[-3:][::-1]]
+
+    def _select_k(
+        self, tfidf_matrix, min_k: int, max_k: int, method: str, k_selection: str
+    ) -> Tuple[int, float, Any, np.ndarray, Dict[str, Any]]:
+        """Pick k for the clustering path and return (k, score, fitted model, labels, selection metadata)."""
+        candidates = list(range(min_k, max_k + 1))
+        # Full-batch exhaustive search keeps the exact silhouette; everything else samples it
+        sample_size = None if method == "tfidf_kmeans" and k_selection == "exhaustive" else (
+            settings.clustering_silhouette_sample_size
+        )
+        if k_selection == "fast":
+            best, scores, stopped_early = self._sweep_fast(tfidf_matrix, candidates, method, sample_size)
+        else:
+            best, scores, stopped_early = None, {}, False
+            for k in candidates:
+                result = _fit_candidate(tfidf_matrix, k, method, sample_size, settings.clustering_batch_size)
+                best = _better(best, result)
+                if result[1] is not None:
+                    scores[k] = result[1]
+
+        if best is None:
+            # No candidate produced two clusters; keep the min_k fit unscored
+            model = _make_model(method, min_k, settings.clustering_batch_size)
+            best = (min_k, -1, model, model.fit_predict(tfidf_matrix))
 
-        for k in range(min_k, max_k + 1):
-            km = KMeans(n_clusters=k, random_state=42, n_init=10)
-            labels = km.fit_predict(tfidf_matrix)
-            if len(set(labels)) > 1:
-                score = silhouette_score(tfidf_matrix, labels)
-                if score > best_score:
-                    best_score = score
-                    best_k = k
+        selection = {
+            "k_selection": k_selection,
+            "k_scores": {k: round(score, 4) for k, score in scores.items()},
+            "stopped_early": stopped_early,
+            "silhouette_sample_size": sample_size,
+        }
+        return best[0], best[1], best[2], best[3], selection
 
-        # Final clustering with optimal k
-        kmeans = KMeans(n_clusters=best_k, random_state=42, n_init=10)
-        cluster_labels = kmeans.fit_predict(tfidf_matrix)
+    def _sweep_fast(
+        self, tfidf_matrix, candidates: List[int], method: str, sample_size: Optional[int]
+    ) -> Tuple[Optional[Tuple[int, float, Any, np.ndarray]], Dict[int, float], bool]:
+        """Evaluate k values in parallel, one chunk of n_jobs at a time, until the score curve plateaus.
 
-        # Build cluster objects
+        The plateau check walks results in k order and ignores anything past the stopping
+        point, so the chosen k does not depend on how many workers ran. Small inputs
+        run serially: a worker pool costs more to start than their fits take.
+        """
+        n_jobs = max(1, effective_n_jobs(settings.clustering_n_jobs))
+        if tfidf_matrix.shape[0] < settings.clustering_parallel_min_keywords or len(candidates) < 2:
+            n_jobs = 1
+        best = None
+        scores: Dict[int, float] = {}
+        plateau_score: Optional[float] = None
+        since_improvement = 0
+
+        with Parallel(n_jobs=n_jobs) as parallel:
+            for offset in range(0, len(candidates), n_jobs):
+                chunk = candidates[offset : offset + n_jobs]
+                fitted = parallel(
+                    delayed(_fit_candidate)(tfidf_matrix, k, method, sample_size, settings.clustering_batch_size)
+                    for k in chunk
+                )
+                for result in fitted:
+                    k, score = result[0], result[1]
+                    best = _better(best, result)
+                    if score is not None:
+                        scores[k] = score
+                    if score is not None and (plateau_score is None or score > plateau_score + settings.clustering_plateau_tol):
+                        plateau_score = score
+                        since_improvement = 0
+                    else:
+                        since_improvement += 1
+                    if since_improvement >= settings.clustering_plateau_patience:
+                        return best, scores, k < candidates[-1]
+        return best, scores, False
+
+    @staticmethod
+    def _build_clusters(
+        frame: KeywordFrame,
+        cluster_labels: np.ndarray,
+        label_for: Callable[[int, List[str]], str],
+    ) -> Tuple[List[KeywordCluster], List[TopicCategory]]:
+        """Group keywords by cluster label into labelled clusters and topics (empty clusters are skipped)."""
         clusters = []
         topics = []
-        feature_names = vectorizer.get_feature_names_out()
+        momentum = frame.filled("momentum")
 
-        for cluster_id in range(best_k):
-            mask = cluster_labels == cluster_id
-            cluster_keywords = [input_data.keywords[i] for i, m in enumerate(mask) if m]
-            cluster_terms = [terms[i] for i, m in enumerate(mask) if m]
+        # Mini-batch k-means can leave a centroid without members; only populated ids appear here
+        for cluster_id in np.unique(cluster_labels).tolist():
+            members = np.flatnonzero(cluster_labels == cluster_id)
+            cluster_keywords = frame.keywords_at(members.tolist())
+            cluster_terms = [frame.terms[i] for i in members.tolist()]
 
-            # Get top terms for label
-            center = kmeans.cluster_centers_[cluster_id]
-            top_indices = center.argsort()[-3:][::-1]
-            label_parts = [feature_names[i] for i in top_indices]
-            label = " / ".join(label_parts).title()
+            label = label_for(cluster_id, cluster_terms)
 
-            avg_demand = np.mean([kw.trends_momentum or 0 for kw in cluster_keywords]) if cluster_keywords else 0.0
+            avg_demand = momentum[members].mean()
 
             cluster = KeywordCluster(
                 cluster_id=cluster_id,
@@ -110,12 +445,4 @@ class TopicClustererAgent(BaseAgent):
             )
             topics.append(topic)
 
-        output = TopicClusterOutput(
-            clusters=clusters,
-            topics=topics,
-            method_used=input_data.method,
-            metadata={"optimal_k": best_k, "silhouette_score": round(best_score, 4)},
-        )
-
-        logger.info(f"Created {best_k} clusters (silhouette={best_score:.4f})")
-        return self.create_response(status="success", data=output.model_dump(), metadata=output.metadata)
+        return clusters, topics
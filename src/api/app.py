@@ -9,7 +9,12 @@ from fastapi.middleware.cors import CORSMiddleware
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from api.routes import router
+from integrations.google_trends_client import GoogleTrendsClient
+from integrations.serpapi_client import SerpApiClient
+from storage.cache import CacheManager
+from storage.cluster_models import ClusterModelStore
 from storage.database import init_database
+from storage.timeseries import TrendSeriesStore
 
 app = FastAPI(
     title="Leadership Topic Intelligence API",
@@ -30,8 +35,21 @@ app.include_router(router, prefix="/api")
 
 @app.on_event("startup")
 async def startup():
-    """Initialize database on startup."""
-    init_database()
+    """Initialize database and shared clients on startup."""
+    _, session_factory = init_database()
+    app.state.cache = CacheManager(session_factory, run_id="api")
+    app.state.serpapi_client = SerpApiClient(cache=app.state.cache)
+    app.state.trends_client = GoogleTrendsClient(
+        cache=app.state.cache, series_store=TrendSeriesStore(session_factory)
+    )
+    app.state.cluster_model_store = ClusterModelStore(session_factory)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled HTTP connections and the Trends worker pool."""
+    await app.state.serpapi_client.aclose()
+    app.state.trends_client.close()
 
 
 @app.get("/api/health")
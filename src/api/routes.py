@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, ValidationError
 
 from agents.content_gap import ContentGapAgent
@@ -15,24 +15,64 @@ from contracts.keyword_researcher import KeywordResearchInput
 from contracts.topic_clusterer import TopicClusterInput
 from contracts.intent_segmenter import IntentSegmentInput
 from contracts.report_generator import ReportInput
+from integrations.google_trends_client import GoogleTrendsClient
+from integrations.serpapi_client import SerpApiClient
 from models.competitors import Competitor
 from models.keywords import Keyword
 from models.reports import ReportConfig
 from models.topics import TopicCategory
+from storage.cache import CacheManager
+from storage.cluster_models import ClusterModelStore
+from utils.rate_limiter import rate_limiter
+from utils.trend_signals import score_series
 
 router = APIRouter()
 
 
+def get_serpapi_client(http_request: Request) -> Optional[SerpApiClient]:
+    """Return the app-wide pooled SerpAPI client, if the app created one."""
+    return getattr(http_request.app.state, "serpapi_client", None)
+
+
+def get_trends_client(http_request: Request) -> Optional[GoogleTrendsClient]:
+    """Return the app-wide Google Trends client, if the app created one."""
+    return getattr(http_request.app.state, "trends_client", None)
+
+
+def get_cache(http_request: Request) -> Optional[CacheManager]:
+    """Return the app-wide response cache, if the app created one."""
+    return getattr(http_request.app.state, "cache", None)
+
+
+def get_cluster_model_store(http_request: Request) -> Optional[ClusterModelStore]:
+    """Return the app-wide cluster model store, if the app created one."""
+    return getattr(http_request.app.state, "cluster_model_store", None)
+
+
 class KeywordResearchRequest(BaseModel):
     queries: List[str]
     max_results: int = 100
     include_trends: bool = True
+    force_refresh: bool = False
+    expand_depth: int = 0
+    expand_max_queries: Optional[int] = None
 
 
 class TopicClusterRequest(BaseModel):
     keywords: List[dict]
     n_clusters_min: int = 10
     n_clusters_max: int = 30
+    method: str = "tfidf_kmeans"
+    k_selection: str = "exhaustive"
+    features: str = "tfidf"
+    run_id: Optional[str] = None
+    force_refresh: bool = False
+
+
+class TopicAssignRequest(BaseModel):
+    keywords: List[dict]
+    model_id: Optional[str] = None
+    run_id: Optional[str] = None
 
 
 class IntentSegmentRequest(BaseModel):
@@ -43,6 +83,14 @@ class IntentSegmentRequest(BaseModel):
 class TrendsAnalyzeRequest(BaseModel):
     keywords: List[str]
     timeframe: str = "today 12-m"
+    force_refresh: bool = False
+
+
+class TrendsRegionsRequest(BaseModel):
+    keywords: List[str]
+    resolution: str = "COUNTRY"
+    timeframe: str = "today 12-m"
+    force_refresh: bool = False
 
 
 class ReportGenerateRequest(BaseModel):
@@ -57,31 +105,71 @@ class ContentGapAnalyzeRequest(BaseModel):
 
 
 @router.post("/keywords/research")
-async def research_keywords(request: KeywordResearchRequest):
+async def research_keywords(
+    request: KeywordResearchRequest,
+    serpapi_client: Optional[SerpApiClient] = Depends(get_serpapi_client),
+    trends_client: Optional[GoogleTrendsClient] = Depends(get_trends_client),
+):
     """Trigger keyword research."""
-    agent = KeywordResearcherAgent()
+    agent = KeywordResearcherAgent(serpapi_client=serpapi_client, trends_client=trends_client)
     input_data = KeywordResearchInput(
         queries=request.queries,
         max_results=request.max_results,
         include_trends=request.include_trends,
+        force_refresh=request.force_refresh,
+        expand_depth=request.expand_depth,
+        expand_max_queries=request.expand_max_queries,
     )
     result = await agent.process(input_data)
     return result.model_dump()
 
 
 @router.post("/topics/cluster")
-async def cluster_topics(request: TopicClusterRequest):
+async def cluster_topics(
+    request: TopicClusterRequest,
+    model_store: Optional[ClusterModelStore] = Depends(get_cluster_model_store),
+    cache: Optional[CacheManager] = Depends(get_cache),
+):
     """Trigger topic clustering."""
-    agent = TopicClustererAgent()
+    agent = TopicClustererAgent(model_store=model_store, cache=cache)
     keywords = [Keyword(**kw) for kw in request.keywords]
     input_data = TopicClusterInput(
         keywords=keywords,
         n_clusters_range=(request.n_clusters_min, request.n_clusters_max),
+        method=request.method,
+        k_selection=request.k_selection,
+        features=request.features,
+        run_id=request.run_id or "api",
+        force_refresh=request.force_refresh,
     )
     result = await agent.process(input_data)
     return result.model_dump()
 
 
+@router.post("/topics/assign")
+async def assign_topics(
+    request: TopicAssignRequest,
+    model_store: Optional[ClusterModelStore] = Depends(get_cluster_model_store),
+):
+    """Place keywords into the clusters of a stored model, with a drift report."""
+    if not request.keywords:
+        raise HTTPException(status_code=422, detail="keywords must contain at least one item")
+    if model_store is None:
+        raise HTTPException(status_code=503, detail="cluster model store is not configured")
+    agent = TopicClustererAgent(model_store=model_store)
+    input_data = TopicClusterInput(
+        keywords=[Keyword(**kw) for kw in request.keywords],
+        mode="assign",
+        model_id=request.model_id,
+        run_id=request.run_id,
+    )
+    try:
+        result = await agent.process(input_data)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    return result.model_dump()
+
+
 @router.post("/gaps/analyze")
 async def analyze_gaps(request: ContentGapAnalyzeRequest):
     """Trigger content gap analysis."""
@@ -103,17 +191,47 @@ async def analyze_gaps(request: ContentGapAnalyzeRequest):
 
 
 @router.post("/trends/analyze")
-async def analyze_trends(request: TrendsAnalyzeRequest):
+async def analyze_trends(
+    request: TrendsAnalyzeRequest,
+    trends_client: Optional[GoogleTrendsClient] = Depends(get_trends_client),
+):
     """Trigger trend analysis."""
-    from integrations.google_trends_client import GoogleTrendsClient
-    client = GoogleTrendsClient()
-    interest = client.get_interest_over_time(request.keywords, request.timeframe)
-    momentum = {}
-    for kw in request.keywords:
-        values = interest.get("interest_over_time", {}).get(kw, [])
-        if values:
-            momentum[kw] = client.calculate_momentum(values)
-    return {"interest": interest, "momentum": momentum}
+    client = trends_client or GoogleTrendsClient()
+    try:
+        # pytrends blocks; fetch batches on the client's worker pool so the event loop stays free
+        interest = await client.get_interest_over_time_async(
+            request.keywords, request.timeframe, force_refresh=request.force_refresh
+        )
+    finally:
+        if trends_client is None:
+            client.close()
+    series = interest.get("interest_over_time", {})
+    scores = score_series({kw: series[kw] for kw in request.keywords if series.get(kw)})
+    return {
+        "interest": interest,
+        "momentum": {kw: s["momentum"] for kw, s in scores.items()},
+        "breakout": {kw: s["breakout"] for kw, s in scores.items()},
+        "slope": {kw: s["slope"] for kw, s in scores.items()},
+        "volatility": {kw: s["volatility"] for kw, s in scores.items()},
+    }
+
+
+@router.post("/trends/regions")
+async def trends_regions(
+    request: TrendsRegionsRequest,
+    trends_client: Optional[GoogleTrendsClient] = Depends(get_trends_client),
+):
+    """Keyword x region interest matrix; each keyword's row is on its own 0-100 scale (top region = 100)."""
+    if not request.keywords:
+        raise HTTPException(status_code=422, detail="keywords must contain at least one item")
+    client = trends_client or GoogleTrendsClient()
+    try:
+        return await client.get_interest_by_region_batch_async(
+            request.keywords, request.resolution.upper(), request.timeframe, force_refresh=request.force_refresh
+        )
+    finally:
+        if trends_client is None:
+            client.close()
 
 
 @router.post("/reports/generate")
@@ -128,3 +246,9 @@ async def generate_report(request: ReportGenerateRequest):
     input_data = ReportInput(config=config, keywords=keywords)
     result = await agent.process(input_data)
     return result.model_dump()
+
+
+@router.get("/rate-limits")
+async def rate_limit_stats():
+    """Report per-provider rate limiter statistics."""
+    return rate_limiter.stats()
@@ -1,16 +1,21 @@
 """Agent I/O contracts for the topic intelligence system."""
 
+from contracts.competitive_scraper import CompetitiveScrapeOutput
 from contracts.content_gap import ContentGapInput, ContentGapOutput
 from contracts.intent_segmenter import IntentSegmentInput, IntentSegmentOutput
+from contracts.keyword_deduplicator import KeywordDedupInput, KeywordDedupOutput
 from contracts.keyword_researcher import KeywordResearchInput, KeywordResearchOutput
 from contracts.report_generator import ReportInput, ReportOutput
 from contracts.topic_clusterer import TopicClusterInput, TopicClusterOutput
 
 __all__ = [
+    "CompetitiveScrapeOutput",
     "ContentGapInput",
     "ContentGapOutput",
     "IntentSegmentInput",
     "IntentSegmentOutput",
+    "KeywordDedupInput",
+    "KeywordDedupOutput",
     "KeywordResearchInput",
     "KeywordResearchOutput",
     "ReportInput",
@@ -0,0 +1,13 @@
+"""Output contract for the Competitive Scraper agent."""
+
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from models.competitors import Competitor, CompetitorContent
+
+
+class CompetitiveScrapeOutput(BaseModel):
+    competitors: List[Competitor] = []
+    pages: Dict[str, List[CompetitorContent]] = {}  # crawled pages per domain
+    metadata: Dict = {}
@@ -1,19 +1,26 @@
 """Input/output contracts for the Intent Segmenter agent."""
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from models.keywords import Keyword
+from models.keyword_frame import KeywordsInput, require_keywords
 from models.segments import AudiencePersona, IntentSegment
 
 
 class IntentSegmentInput(BaseModel):
-    keywords: List[Keyword] = Field(..., min_length=1)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    keywords: KeywordsInput = Field(...)
     generate_personas: bool = True
+    scoring: str = "first_match"  # first_match (one intent per keyword) | weighted (multi-label, sparse weights)
+
+    _require_keywords = field_validator("keywords")(require_keywords)
 
 
 class IntentSegmentOutput(BaseModel):
     segments: List[IntentSegment] = []
     personas: List[AudiencePersona] = []
     metadata: Dict = {}
+    # weighted scoring: scipy CSR keyword x intent matrix, columns in metadata["intents"]
+    weights: Optional[Any] = Field(default=None, exclude=True, repr=False)
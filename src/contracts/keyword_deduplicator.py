@@ -0,0 +1,24 @@
+"""Input/output contracts for the Keyword Deduplicator agent."""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from models.keyword_frame import KeywordsInput, require_keywords
+from models.keywords import Keyword
+
+
+class KeywordDedupInput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    keywords: KeywordsInput = Field(...)
+    threshold: Optional[float] = Field(default=None, gt=0, le=1)  # defaults to settings.dedup_threshold
+
+    _require_keywords = field_validator("keywords")(require_keywords)
+
+
+class KeywordDedupOutput(BaseModel):
+    keywords: List[Keyword] = []  # one canonical keyword per group, group data merged in
+    groups: Dict[str, List[str]] = {}  # canonical term -> original terms, for groups of two or more
+    mapping: Dict[str, str] = {}  # original term -> canonical term
+    metadata: Dict = {}
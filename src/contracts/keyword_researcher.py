@@ -1,10 +1,10 @@
 """Input/output contracts for the Keyword Researcher agent."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from models.keywords import Keyword, KeywordCluster
+from models.keywords import Keyword, KeywordCluster, KeywordGraph
 
 
 class KeywordResearchInput(BaseModel):
@@ -12,10 +12,16 @@ class KeywordResearchInput(BaseModel):
     max_results: int = Field(default=100, ge=1, le=1000)
     include_trends: bool = True
     include_paa: bool = True
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    force_refresh: bool = False
+    expand_depth: int = Field(default=0, ge=0, le=5)  # 0 = one-hop discovery only
+    expand_max_queries: Optional[int] = Field(default=None, ge=1)
+    expand_max_terms: Optional[int] = Field(default=None, ge=1)
 
 
 class KeywordResearchOutput(BaseModel):
     keywords: List[Keyword] = []
     clusters: List[KeywordCluster] = []
     total_discovered: int = 0
+    graph: Optional[KeywordGraph] = None
     metadata: Dict = {}
@@ -2,18 +2,21 @@
 
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from models.competitors import Competitor
-from models.keywords import Keyword, KeywordCluster
+from models.keyword_frame import KeywordsInput
+from models.keywords import KeywordCluster
 from models.reports import ReportConfig
 from models.segments import IntentSegment
 from models.topics import TopicCategory
 
 
 class ReportInput(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     config: ReportConfig
-    keywords: List[Keyword] = []
+    keywords: KeywordsInput = []
     clusters: List[KeywordCluster] = []
     topics: List[TopicCategory] = []
     segments: List[IntentSegment] = []
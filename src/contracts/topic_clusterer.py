@@ -2,16 +2,27 @@
 
 from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from models.keywords import Keyword, KeywordCluster
+from models.keyword_frame import KeywordsInput, require_keywords
+from models.keywords import KeywordCluster
 from models.topics import TopicCategory
 
 
 class TopicClusterInput(BaseModel):
-    keywords: List[Keyword] = Field(..., min_length=1)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    keywords: KeywordsInput = Field(...)
     n_clusters_range: Tuple[int, int] = (10, 30)
-    method: str = "tfidf_kmeans"
+    method: str = "tfidf_kmeans"  # tfidf_kmeans | tfidf_minibatch | auto (by keyword count)
+    k_selection: str = "exhaustive"  # exhaustive | fast (sampled silhouette, parallel sweep, plateau stop)
+    features: str = "tfidf"  # tfidf (fitted vocabulary) | hashing (chunked, incremental IDF, no vocabulary)
+    mode: str = "fit"  # fit | assign (place keywords into a stored model's clusters)
+    model_id: Optional[str] = None  # assign: stored model to use (default: newest for run_id, else newest)
+    run_id: Optional[str] = None  # fit: run the stored model belongs to; assign: pick its newest model
+    force_refresh: bool = False  # bypass the cluster result cache
+
+    _require_keywords = field_validator("keywords")(require_keywords)
 
 
 class TopicClusterOutput(BaseModel):
@@ -34,6 +34,49 @@ class Settings(BaseSettings):
     max_retries: int = 3
     request_timeout: int = 30
     rate_limit_delay: float = 1.0
+    research_max_concurrency: int = 5
+    serpapi_coalesce_ttl: float = 300.0
+    trends_max_workers: int = 3  # concurrent pytrends batches; the trends rate limit still applies
+    keyword_graph_workers: int = 5
+    keyword_graph_max_queries: int = 200  # nodes expanded (SerpAPI + Trends lookups) per graph run
+    keyword_graph_max_terms: int = 5000
+    trends_incremental: bool = True  # only fetch periods newer than the stored series (needs a series store)
+
+    # Rate Limits (requests per second, per provider bucket)
+    serpapi_rate_limit: float = 2.0
+    trends_rate_limit: float = 0.5
+    competitor_rate_limit: float = 1.0
+    rate_limit_burst: int = 3
+
+    # Response Cache TTLs (seconds)
+    serpapi_cache_ttl: int = 86400
+    trends_cache_ttl: int = 86400
+    topic_cluster_cache_ttl: int = 604800
+    cache_memory_max_entries: int = 2048
+
+    # HTTP Connection Pool
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = False
+
+    # Clustering
+    clustering_scalable_threshold: int = 2000  # "auto" switches to mini-batch k-means at this many keywords
+    clustering_batch_size: int = 2048
+    clustering_silhouette_sample_size: int = 2000
+    clustering_n_jobs: int = -1  # parallel k candidates in fast selection (-1 = all cores)
+    clustering_parallel_min_keywords: int = 1000  # fast selection sweeps serially below this many keywords
+    clustering_plateau_tol: float = 0.005
+    clustering_plateau_patience: int = 3  # stop after this many k without a tol improvement
+    clustering_hash_features: int = 2 ** 16  # hashed feature columns for features="hashing"
+    clustering_hash_chunk_size: int = 5000  # keywords hashed per chunk
+    clustering_refit_far_share: float = 0.25  # assign: recommend a refit when this share lands beyond the training p95 distance
+
+    # Near-duplicate keyword dedup (MinHash + LSH)
+    dedup_threshold: float = 0.8  # estimated Jaccard of character shingles to merge
+    dedup_num_perm: int = 64
+    dedup_bands: int = 16  # num_perm / bands rows per band; candidate threshold ~ (1/bands)^(1/rows)
+    dedup_shingle_size: int = 3
 
     # Paths
     output_dir: Path = Path("./outputs")
@@ -50,6 +93,14 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./data/topic_intel.db"
+    storage_profile: str = "default"  # "production" opts into WAL, NORMAL sync and a larger pool
+    sqlite_journal_mode: Optional[str] = None
+    sqlite_synchronous: Optional[str] = None
+    sqlite_mmap_size: Optional[int] = None
+    sqlite_cache_size: Optional[int] = None
+    sqlite_busy_timeout_ms: Optional[int] = None
+    db_pool_size: Optional[int] = None
+    db_max_overflow: Optional[int] = None
 
     # Logging
     log_level: str = "INFO"
@@ -60,6 +111,7 @@ class Settings(BaseSettings):
     enable_trends: bool = True
     enable_gsc: bool = False
     enable_competitors: bool = True
+    enable_dedup: bool = True
     enable_news: bool = False
     enable_firmographics: bool = False
     no_network_mode: bool = False
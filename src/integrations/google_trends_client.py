@@ -1,13 +1,67 @@
 """Google Trends integration client for directional demand signals."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from loguru import logger
 
 from core.config import settings
+from models.keywords import SearchVolumeTimeSeries
+from storage.cache import CacheManager
+from storage.timeseries import TrendSeriesStore, normalize_keyword, period_key
+from utils.rate_limiter import parse_retry_after, rate_limiter
+from utils.trend_signals import has_rising_breakout, round_exact, score_matrix, slope_batch, volatility_batch
 
+# pytrends only supports up to 5 keywords per payload
+TRENDS_BATCH_SIZE = 5
 
-MOCK_TRENDS_RESPONSE = {
+
+def _months_before(day: date, months: int) -> date:
+    month_index = day.year * 12 + day.month - 1 - months
+    year, month = divmod(month_index, 12)
+    return day.replace(year=year, month=month + 1, day=min(day.day, 28))
+
+
+def timeframe_start(timeframe: str, today: Optional[date] = None) -> Optional[date]:
+    """First day covered by a rolling "today N-m"/"today N-y" timeframe; None for other forms."""
+    today = today or date.today()
+    match = re.fullmatch(r"today (\d+)-([my])", timeframe.strip())
+    if not match:
+        return None
+    count, unit = int(match.group(1)), match.group(2)
+    return _months_before(today, count if unit == "m" else count * 12)
+
+
+def resample_to_cadence(
+    periods: List[str], values: List[float], anchor: date, cadence_days: int
+) -> List[Tuple[date, float]]:
+    """Average points into complete buckets of `cadence_days` starting at `anchor`."""
+    # A keyword missing from the payload has no values; it yields no buckets
+    points = [(date.fromisoformat(p[:10]), v) for p, v in zip(periods, values, strict=False)]
+    points = [(d, v) for d, v in points if d >= anchor]
+    if not points or cadence_days <= 0:
+        return []
+    last_day = max(d for d, _ in points)
+    buckets: Dict[int, List[float]] = defaultdict(list)
+    for d, v in points:
+        buckets[(d - anchor).days // cadence_days].append(v)
+    resampled = []
+    for k in sorted(buckets):
+        start = anchor + timedelta(days=k * cadence_days)
+        # Only keep buckets whose whole span has been reported
+        if start + timedelta(days=cadence_days - 1) <= last_day:
+            resampled.append((start, sum(buckets[k]) / len(buckets[k])))
+    return resampled
+
+MOCK_TRENDS_RESPONSE: Dict[str, Any] = {
     "interest_over_time": {
         "executive leadership": [45, 52, 48, 55, 60, 58, 62, 65, 70, 68, 72, 75],
         "dates": [
@@ -31,29 +85,98 @@ MOCK_TRENDS_RESPONSE = {
     },
 }
 
+MOCK_REGION_INTEREST = {"United States": 100, "United Kingdom": 72, "Canada": 65, "Australia": 58, "India": 45}
+
 
 class GoogleTrendsClient:
-    """Client for Google Trends directional demand data."""
+    """Client for Google Trends directional demand data.
+
+    When a ``CacheManager`` is given, pytrends results are read from and written to it.
+    pytrends is synchronous; async callers use the ``*_async`` methods, which run the
+    blocking calls on a thread pool owned by the client. Each worker thread gets its
+    own ``TrendReq`` because pytrends keeps payload state on the instance.
+
+    When a ``TrendSeriesStore`` is given, fetched series are persisted per period and
+    incremental mode only requests periods newer than the stored history.
+    """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheManager] = None, series_store: Optional[TrendSeriesStore] = None):
         self.enabled = settings.enable_trends and not settings.no_network_mode
-        self._pytrends = None
+        self._local = threading.local()
+        self.cache = cache
+        self.series_store = series_store
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for blocking pytrends calls, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.trends_max_workers), thread_name_prefix="trends"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the client's thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     def _get_pytrends(self):
-        """Lazy-load pytrends to avoid import errors in no-network mode."""
-        if self._pytrends is None and self.enabled:
+        """Lazy-load a per-thread pytrends instance to avoid import errors in no-network mode."""
+        pytrends = getattr(self._local, "pytrends", None)
+        if pytrends is None and self.enabled:
             try:
                 from pytrends.request import TrendReq
-                self._pytrends = TrendReq(hl="en-US", tz=360)
+                pytrends = self._local.pytrends = TrendReq(hl="en-US", tz=360)
             except ImportError:
                 logger.warning("pytrends not installed, falling back to mock data")
                 self.enabled = False
-        return self._pytrends
+        return pytrends
+
+    def _rate_limited(self, func, *args, **kwargs):
+        """Call a pytrends method through the shared trends bucket, retrying after 429s."""
+        for attempt in range(settings.max_retries):
+            rate_limiter.acquire_sync("trends")
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                response = getattr(e, "response", None)
+                if getattr(response, "status_code", None) != 429:
+                    raise
+                headers = getattr(response, "headers", None) or {}
+                rate_limiter.report_throttled("trends", parse_retry_after(headers.get("Retry-After")))
+                if attempt == settings.max_retries - 1:
+                    raise
+                continue
+            rate_limiter.report_success("trends")
+            return result
+
+    def _read_through(self, query: str, params: Dict[str, Any], fetch, force_refresh: bool = False) -> Dict[str, Any]:
+        """Serve a Trends result from the response cache, or fetch it and store the result."""
+        if self.cache is None:
+            fetched: Dict[str, Any] = fetch()
+            return fetched
+        cached: Optional[Dict[str, Any]] = self.cache.lookup("trends", query, params, force_refresh=force_refresh)
+        if cached is not None:
+            logger.debug(f"Trends cache hit: {query}")
+            return cached
+        result: Dict[str, Any] = fetch()
+        self.cache.store("trends", query, result, params)
+        return result
 
     def get_interest_over_time(
-        self, keywords: List[str], timeframe: str = "today 12-m"
+        self,
+        keywords: List[str],
+        timeframe: str = "today 12-m",
+        force_refresh: bool = False,
+        incremental: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Get interest over time for keywords (normalized 0-100)."""
+        """Get interest over time for keywords (normalized 0-100).
+
+        With a series store and incremental mode (default ``settings.trends_incremental``),
+        keywords with stored history only fetch the periods after their newest stored one.
+        """
         if not self.enabled or settings.no_network_mode:
             logger.info(f"Trends disabled or no-network mode, returning mock for: {keywords}")
             return self._mock_interest(keywords)
@@ -62,67 +185,329 @@ class GoogleTrendsClient:
         if pt is None:
             return self._mock_interest(keywords)
 
+        incremental = settings.trends_incremental if incremental is None else incremental
         try:
-            # pytrends only supports up to 5 keywords at a time
-            batch_size = 5
+            store = self.series_store
+            if incremental and store is not None and not force_refresh:
+                window_start = timeframe_start(timeframe)
+                if window_start is not None:
+                    return self._incremental_interest(pt, store, keywords, timeframe, window_start)
+
             results = {}
-            for i in range(0, len(keywords), batch_size):
-                batch = keywords[i : i + batch_size]
-                pt.build_payload(batch, timeframe=timeframe)
-                df = pt.interest_over_time()
-                if not df.empty:
-                    for kw in batch:
-                        if kw in df.columns:
-                            results[kw] = df[kw].tolist()
-                    results["dates"] = [d.strftime("%Y-%m") for d in df.index]
+            for i in range(0, len(keywords), TRENDS_BATCH_SIZE):
+                batch = keywords[i : i + TRENDS_BATCH_SIZE]
+                results.update(self._interest_batch(pt, batch, timeframe, force_refresh))
             return {"interest_over_time": results}
         except Exception as e:
             logger.error(f"Google Trends API error: {e}")
             return self._mock_interest(keywords)
 
-    def get_related_queries(self, keyword: str) -> Dict[str, Any]:
-        """Get related queries for a keyword."""
+    async def get_interest_over_time_async(
+        self,
+        keywords: List[str],
+        timeframe: str = "today 12-m",
+        force_refresh: bool = False,
+        incremental: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Get interest over time without blocking the event loop.
+
+        Each 5-keyword batch is an executor task, so up to ``trends_max_workers``
+        batches are fetched concurrently, all paced by the shared trends rate limit.
+        """
+        loop = asyncio.get_running_loop()
+        batches = [keywords[i : i + TRENDS_BATCH_SIZE] for i in range(0, len(keywords), TRENDS_BATCH_SIZE)]
+        responses = await asyncio.gather(*(
+            loop.run_in_executor(
+                self.executor,
+                partial(self.get_interest_over_time, batch, timeframe, force_refresh=force_refresh, incremental=incremental),
+            )
+            for batch in batches
+        ))
+        results: Dict[str, Any] = {}
+        keyword_periods: Dict[str, List[str]] = {}
+        for response in responses:
+            interest = response.get("interest_over_time", {})
+            keyword_periods.update(interest.get("keyword_periods", {}))
+            results.update(interest)
+        if keyword_periods:
+            results["keyword_periods"] = keyword_periods
+        return {"interest_over_time": results}
+
+    def _interest_batch(self, pt, batch: List[str], timeframe: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """Read-through fetch of one 5-keyword batch, persisting its points when a series store is set."""
+        result = self._read_through(
+            ",".join(batch),
+            {"kind": "interest_over_time", "timeframe": timeframe},
+            lambda: self._fetch_interest_batch(pt, batch, timeframe),
+            force_refresh,
+        )
+        if self.series_store is not None and result.get("periods"):
+            self.series_store.upsert(
+                SearchVolumeTimeSeries(keyword=kw, timestamps=result["periods"], values=result[kw])
+                for kw in batch
+                if kw in result
+            )
+        return result
+
+    def _incremental_interest(
+        self, pt, store: TrendSeriesStore, keywords: List[str], timeframe: str, window_start: date
+    ) -> Dict[str, Any]:
+        """Fetch only periods missing from the series store, then answer from the store."""
+        today = date.today()
+        stored = store.load(keywords, start=window_start)
+        full_fetch: List[str] = []
+        by_anchor: Dict[Tuple[date, int], List[str]] = defaultdict(list)
+        for kw in dict.fromkeys(keywords):
+            series = stored.get(normalize_keyword(kw))
+            if series is None or len(series.timestamps) < 2:
+                full_fetch.append(kw)
+                continue
+            last = series.timestamps[-1].date()
+            cadence = (last - series.timestamps[-2].date()).days
+            # Current until the period after `last` has fully elapsed
+            if (today - last).days < 2 * cadence - 1:
+                continue
+            by_anchor[(last, cadence)].append(kw)
+
+        for (anchor, cadence), group in by_anchor.items():
+            for i in range(0, len(group), TRENDS_BATCH_SIZE):
+                batch = group[i : i + TRENDS_BATCH_SIZE]
+                full_fetch.extend(self._extend_batch(pt, store, batch, stored, anchor, cadence, today))
+
+        for i in range(0, len(full_fetch), TRENDS_BATCH_SIZE):
+            self._interest_batch(pt, full_fetch[i : i + TRENDS_BATCH_SIZE], timeframe)
+
+        logger.info(
+            f"Trends incremental: {len(keywords)} keywords, {len(full_fetch)} full fetches, "
+            f"{sum(len(g) for g in by_anchor.values())} extended"
+        )
+        # Stored spans can differ per keyword (shifted weekly grid, failed extension), so each
+        # keyword keeps its own periods instead of being zero-filled onto a shared grid
+        current = store.load(keywords, start=window_start)
+        results: Dict[str, Any] = {}
+        keyword_periods: Dict[str, List[str]] = {}
+        for kw in keywords:
+            series = current.get(normalize_keyword(kw))
+            if series is not None and series.values:
+                results[kw] = list(series.values)
+                keyword_periods[kw] = [period_key(ts) for ts in series.timestamps]
+        periods = sorted({p for spans in keyword_periods.values() for p in spans})
+        results["dates"] = [p[:7] for p in periods]
+        results["periods"] = periods
+        results["keyword_periods"] = keyword_periods
+        return {"interest_over_time": results}
+
+    def _extend_batch(
+        self,
+        pt,
+        store: TrendSeriesStore,
+        batch: List[str],
+        stored: Dict[str, SearchVolumeTimeSeries],
+        anchor: date,
+        cadence: int,
+        today: date,
+    ) -> List[str]:
+        """Fetch the window since `anchor` and append it rescaled onto the stored history.
+
+        Trends normalizes every request to its own 0-100 range, so new points are scaled by
+        the ratio of the stored to the refetched value of the overlapping `anchor` period.
+        Returns the keywords that cannot be rescaled and need a full refetch instead.
+        """
+        window = f"{anchor.isoformat()} {today.isoformat()}"
+        fetched = self._read_through(
+            ",".join(batch),
+            {"kind": "interest_over_time", "timeframe": window},
+            lambda: self._fetch_interest_batch(pt, batch, window),
+        )
+        periods = fetched.get("periods") or []
+        needs_full: List[str] = []
+        updates: List[SearchVolumeTimeSeries] = []
+        for kw in batch:
+            buckets = resample_to_cadence(periods, fetched.get(kw) or [], anchor, cadence)
+            stored_anchor = stored[normalize_keyword(kw)].values[-1]
+            if not buckets or buckets[0][0] != anchor or buckets[0][1] <= 0 or stored_anchor <= 0:
+                needs_full.append(kw)
+                continue
+            factor = stored_anchor / buckets[0][1]
+            new_points = [(day, round(value * factor)) for day, value in buckets[1:]]
+            if any(value > 100 for _, value in new_points):
+                # A new peak invalidates the stored 0-100 normalization
+                needs_full.append(kw)
+                continue
+            if new_points:
+                updates.append(SearchVolumeTimeSeries(
+                    keyword=kw, timestamps=[d for d, _ in new_points], values=[v for _, v in new_points]
+                ))
+        if updates:
+            store.upsert(updates)
+        return needs_full
+
+    def _fetch_interest_batch(self, pt, batch: List[str], timeframe: str) -> Dict[str, Any]:
+        """Fetch interest over time for up to 5 keywords in one pytrends payload."""
+        results = {}
+        self._rate_limited(pt.build_payload, batch, timeframe=timeframe)
+        df = self._rate_limited(pt.interest_over_time)
+        if not df.empty:
+            for kw in batch:
+                if kw in df.columns:
+                    results[kw] = df[kw].tolist()
+            results["dates"] = [d.strftime("%Y-%m") for d in df.index]
+            results["periods"] = [d.strftime("%Y-%m-%d") for d in df.index]
+        return results
+
+    def get_related_queries(self, keyword: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get related queries for a keyword.
+
+        Mock fallbacks (no-network mode, missing pytrends, API errors) carry ``"mock": True``
+        and, after an error, ``"error"``; their queries are not related to `keyword`.
+        """
         if not self.enabled or settings.no_network_mode:
-            return MOCK_TRENDS_RESPONSE["related_queries"]
+            return self._mock_related_queries()
 
         pt = self._get_pytrends()
         if pt is None:
-            return MOCK_TRENDS_RESPONSE["related_queries"]
+            return self._mock_related_queries()
 
         try:
-            pt.build_payload([keyword], timeframe="today 12-m")
-            related = pt.related_queries()
-            result = {"top": [], "rising": []}
-            if keyword in related:
-                top_df = related[keyword].get("top")
-                if top_df is not None and not top_df.empty:
-                    result["top"] = top_df.to_dict("records")
-                rising_df = related[keyword].get("rising")
-                if rising_df is not None and not rising_df.empty:
-                    result["rising"] = rising_df.to_dict("records")
-            return result
+            return self._read_through(
+                keyword,
+                {"kind": "related_queries"},
+                lambda: self._fetch_related_queries(pt, keyword),
+                force_refresh,
+            )
         except Exception as e:
             logger.error(f"Google Trends related queries error: {e}")
-            return MOCK_TRENDS_RESPONSE["related_queries"]
+            return self._mock_related_queries(error=str(e))
+
+    async def get_related_queries_async(self, keyword: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get related queries on the client's worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(self.get_related_queries, keyword, force_refresh=force_refresh)
+        )
+
+    def _fetch_related_queries(self, pt, keyword: str) -> Dict[str, Any]:
+        """Fetch top and rising related queries for one keyword."""
+        self._rate_limited(pt.build_payload, [keyword], timeframe="today 12-m")
+        related = self._rate_limited(pt.related_queries)
+        result = {"top": [], "rising": []}
+        if keyword in related:
+            top_df = related[keyword].get("top")
+            if top_df is not None and not top_df.empty:
+                result["top"] = top_df.to_dict("records")
+            rising_df = related[keyword].get("rising")
+            if rising_df is not None and not rising_df.empty:
+                result["rising"] = rising_df.to_dict("records")
+        return result
 
-    def get_interest_by_region(self, keyword: str) -> Dict[str, int]:
+    def get_interest_by_region(
+        self, keyword: str, resolution: str = "COUNTRY", timeframe: str = "today 12-m", force_refresh: bool = False
+    ) -> Dict[str, int]:
         """Get interest by region for a keyword."""
         if not self.enabled or settings.no_network_mode:
-            return {"United States": 100, "United Kingdom": 72, "Canada": 65, "Australia": 58, "India": 45}
+            return dict(MOCK_REGION_INTEREST)
+        regions = self.get_interest_by_region_batch([keyword], resolution, timeframe, force_refresh)
+        if not regions["keywords"]:
+            return {}
+        return dict(zip(regions["regions"], regions["matrix"][0], strict=True))
+
+    def get_interest_by_region_batch(
+        self,
+        keywords: List[str],
+        resolution: str = "COUNTRY",
+        timeframe: str = "today 12-m",
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Get interest by region for many keywords, 5 per pytrends payload.
+
+        Returns a dense keyword x region matrix: ``{"keywords", "regions", "matrix"}``, where
+        ``matrix[i][j]`` is the interest of ``keywords[i]`` in ``regions[j]`` (0 if not reported).
+        pytrends scales a multi-keyword payload across all its keywords, so each row is
+        rescaled to its own 0-100 range (top region = 100), the scale of a single-keyword
+        ``get_interest_by_region`` call; values do not depend on which keywords share a batch
+        and are not comparable across rows. Each batch is cached per resolution and timeframe.
+        """
+        if not self.enabled or settings.no_network_mode:
+            return self._region_matrix(keywords, [{kw: dict(MOCK_REGION_INTEREST) for kw in keywords}])
 
         pt = self._get_pytrends()
         if pt is None:
-            return {}
+            return self._region_matrix([], [])
 
-        try:
-            pt.build_payload([keyword], timeframe="today 12-m")
-            df = pt.interest_by_region(resolution="COUNTRY")
-            if not df.empty:
-                return df[keyword].to_dict()
-            return {}
-        except Exception as e:
-            logger.error(f"Google Trends region error: {e}")
+        batches = []
+        for i in range(0, len(keywords), TRENDS_BATCH_SIZE):
+            batch = keywords[i : i + TRENDS_BATCH_SIZE]
+            try:
+                batches.append(self._region_batch(pt, batch, resolution, timeframe, force_refresh))
+            except Exception as e:
+                logger.error(f"Google Trends region error for {batch}: {e}")
+        return self._region_matrix(keywords, batches)
+
+    async def get_interest_by_region_batch_async(
+        self,
+        keywords: List[str],
+        resolution: str = "COUNTRY",
+        timeframe: str = "today 12-m",
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Regional interest matrix with 5-keyword batches fetched concurrently on the worker pool."""
+        if not self.enabled or settings.no_network_mode:
+            return self.get_interest_by_region_batch(keywords, resolution, timeframe, force_refresh)
+
+        loop = asyncio.get_running_loop()
+
+        def fetch(batch: List[str]) -> Dict[str, Dict[str, int]]:
+            pt = self._get_pytrends()
+            if pt is None:
+                return {}
+            try:
+                return self._region_batch(pt, batch, resolution, timeframe, force_refresh)
+            except Exception as e:
+                logger.error(f"Google Trends region error for {batch}: {e}")
+                return {}
+
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, fetch, keywords[i : i + TRENDS_BATCH_SIZE])
+            for i in range(0, len(keywords), TRENDS_BATCH_SIZE)
+        ))
+        return self._region_matrix(keywords, batches)
+
+    def _region_batch(
+        self, pt, batch: List[str], resolution: str, timeframe: str, force_refresh: bool = False
+    ) -> Dict[str, Dict[str, int]]:
+        """Read-through fetch of {keyword: {region: interest}} for up to 5 keywords."""
+        return self._read_through(
+            ",".join(batch),
+            {"kind": "interest_by_region", "resolution": resolution, "timeframe": timeframe},
+            lambda: self._fetch_region_batch(pt, batch, resolution, timeframe),
+            force_refresh,
+        )
+
+    def _fetch_region_batch(self, pt, batch: List[str], resolution: str, timeframe: str) -> Dict[str, Dict[str, int]]:
+        """Fetch interest by region for up to 5 keywords in one pytrends payload."""
+        self._rate_limited(pt.build_payload, batch, timeframe=timeframe)
+        df = self._rate_limited(pt.interest_by_region, resolution=resolution)
+        if df.empty:
             return {}
+        return {kw: {str(region): int(v) for region, v in df[kw].items()} for kw in batch if kw in df.columns}
+
+    @staticmethod
+    def _region_matrix(keywords: List[str], batches: List[Dict[str, Dict[str, int]]]) -> Dict[str, Any]:
+        """Assemble per-batch {keyword: {region: value}} maps into a dense matrix, each row scaled to 0-100."""
+        by_keyword: Dict[str, Dict[str, int]] = {}
+        for batch in batches:
+            by_keyword.update(batch)
+        rows = [kw for kw in dict.fromkeys(keywords) if kw in by_keyword]
+        regions = sorted({region for kw in rows for region in by_keyword[kw]})
+        column = {region: j for j, region in enumerate(regions)}
+        matrix = np.zeros((len(rows), len(regions)), dtype=np.int64)
+        for i, kw in enumerate(rows):
+            for region, value in by_keyword[kw].items():
+                matrix[i, column[region]] = value
+        peaks = matrix.max(axis=1, initial=0)
+        scaled = round_exact(matrix * 100.0 / np.maximum(peaks, 1)[:, None], 0)
+        matrix = np.where(peaks[:, None] > 0, scaled, matrix).astype(np.int64)
+        return {"keywords": rows, "regions": regions, "matrix": matrix.tolist()}
 
     def calculate_momentum(self, values: List[int]) -> float:
         """Calculate momentum: (recent_avg - prior_avg) / prior_avg."""
@@ -138,19 +523,41 @@ class GoogleTrendsClient:
 
     def detect_breakout(self, values: List[int], related_queries: Optional[Dict] = None) -> bool:
         """Detect breakout trend (>5000% growth or momentum > 1.0 with steep slope)."""
-        if related_queries:
-            rising = related_queries.get("rising", [])
-            for q in rising:
-                val = q.get("value", 0)
-                if isinstance(val, str) and "Breakout" in val:
-                    return True
-                if isinstance(val, (int, float)) and val >= 5000:
-                    return True
+        if has_rising_breakout(related_queries):
+            return True
         momentum = self.calculate_momentum(values)
         if momentum > 1.0:
             return True
         return False
 
+    def calculate_slope(self, values: List[int]) -> float:
+        """Least-squares slope of interest per period."""
+        return float(slope_batch(np.array([values], dtype=np.float64))[0]) if values else 0.0
+
+    def calculate_volatility(self, values: List[int]) -> float:
+        """Coefficient of variation of interest (std / mean)."""
+        return float(volatility_batch(np.array([values], dtype=np.float64))[0]) if values else 0.0
+
+    def score_batch(
+        self, matrix: np.ndarray, related_queries: Optional[Sequence[Optional[Dict]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Momentum, breakout flags, slope and volatility for a keywords x periods matrix in one pass.
+
+        Row results equal ``calculate_momentum``/``detect_breakout``/``calculate_slope``/
+        ``calculate_volatility`` on the same row.
+        """
+        scores: Dict[str, np.ndarray] = score_matrix(matrix, related_queries)
+        return scores
+
+    @staticmethod
+    def _mock_related_queries(error: Optional[str] = None) -> Dict[str, Any]:
+        """Mock related queries, flagged so callers can tell them from real results."""
+        mock: Dict[str, Any] = copy.deepcopy(MOCK_TRENDS_RESPONSE["related_queries"])
+        mock["mock"] = True
+        if error is not None:
+            mock["error"] = error
+        return mock
+
     def _mock_interest(self, keywords: List[str]) -> Dict[str, Any]:
         """Return mock interest data for testing."""
         mock = {"interest_over_time": {}}
@@ -1,14 +1,20 @@
 """SerpAPI integration client for SERP intelligence and keyword discovery."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from loguru import logger
 
 from core.config import settings
+from storage.cache import CacheManager
+from utils.rate_limiter import parse_retry_after, rate_limiter
 
 
-MOCK_SERP_RESPONSE = {
+MOCK_SERP_RESPONSE: Dict[str, Any] = {
     "search_parameters": {"q": "executive leadership", "engine": "google"},
     "organic_results": [
         {"position": 1, "title": "Executive Leadership Programs", "link": "https://example.com/leadership", "snippet": "Top executive leadership programs..."},
@@ -33,26 +39,82 @@ MOCK_SERP_RESPONSE = {
 
 
 class SerpApiClient:
-    """Client for SerpAPI search intelligence."""
+    """Client for SerpAPI search intelligence.
 
-    def __init__(self, api_key: Optional[str] = None):
+    Holds one pooled ``httpx.AsyncClient`` for its lifetime. Share a single instance
+    per process and release it with ``aclose()`` or ``async with``. When a
+    ``CacheManager`` is given, responses are read from and written to it.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[CacheManager] = None,
+    ):
         self.api_key = api_key or settings.serpapi_key
         self.base_url = "https://serpapi.com/search"
         self.enabled = settings.enable_serpapi and not settings.no_network_mode
+        self.coalesce_ttl = settings.serpapi_coalesce_ttl
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+        self._recent: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._http = http_client
+        self._owns_http = http_client is None
+        self.cache = cache
+
+    async def __aenter__(self) -> "SerpApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if this instance created it."""
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+            self._http = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled HTTP client (keep-alive, optional HTTP/2)."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=settings.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
+                http2=self._http2_available(),
+            )
+            self._owns_http = True
+        return self._http
+
+    @staticmethod
+    def _http2_available() -> bool:
+        """Check whether HTTP/2 is requested and the h2 package is installed."""
+        if not settings.http2_enabled:
+            return False
+        try:
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            logger.warning("HTTP/2 requested but h2 not installed, falling back to HTTP/1.1")
+            return False
 
-    async def search(self, query: str, **params) -> Dict[str, Any]:
-        """Execute a search query via SerpAPI."""
+    async def search(self, query: str, force_refresh: bool = False, **params) -> Dict[str, Any]:
+        """Execute a search query via SerpAPI.
+
+        Identical (query, params) searches that are in flight or completed within
+        ``coalesce_ttl`` seconds share a single HTTP request; each caller gets its own
+        copy of the payload. ``force_refresh`` bypasses both coalescing and the response cache.
+        """
         if not self.enabled or settings.no_network_mode:
             logger.info(f"SerpAPI disabled or no-network mode, returning mock for: {query}")
-            mock = MOCK_SERP_RESPONSE.copy()
-            mock["search_parameters"]["q"] = query
-            return mock
+            return self._mock_response(query)
 
         if not self.api_key:
             logger.warning("No SerpAPI key configured, returning mock data")
-            mock = MOCK_SERP_RESPONSE.copy()
-            mock["search_parameters"]["q"] = query
-            return mock
+            return self._mock_response(query)
 
         request_params = {
             "q": query,
@@ -62,10 +124,82 @@ class SerpApiClient:
             **{k: v for k, v in params.items() if k != "num"},
         }
 
-        async with httpx.AsyncClient(timeout=settings.request_timeout) as client:
+        key = self._coalesce_key(request_params)
+        if force_refresh:
+            result = await self._cached_fetch(request_params, force_refresh=True)
+            self._recent[key] = (time.monotonic(), result)
+            return copy.deepcopy(result)
+
+        recent = self._recent.get(key)
+        if recent and time.monotonic() - recent[0] < self.coalesce_ttl:
+            logger.debug(f"SerpAPI coalesced (recent): {query}")
+            return copy.deepcopy(recent[1])
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._cached_fetch(request_params))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._on_fetch_done(key, f))
+        else:
+            logger.debug(f"SerpAPI coalesced (in flight): {query}")
+
+        # Shield so one cancelled caller does not cancel the shared request
+        return copy.deepcopy(await asyncio.shield(future))
+
+    @staticmethod
+    def _mock_response(query: str) -> Dict[str, Any]:
+        """Fresh copy of the mock SERP payload for `query`."""
+        mock = copy.deepcopy(MOCK_SERP_RESPONSE)
+        mock["search_parameters"]["q"] = query
+        return mock
+
+    async def _cached_fetch(self, request_params: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
+        """Serve a search from the response cache, or fetch it and store the result."""
+        if self.cache is None:
+            return await self._fetch(request_params)
+
+        query = request_params["q"]
+        cache_params = {k: v for k, v in request_params.items() if k not in ("q", "api_key")}
+        cached: Optional[Dict[str, Any]] = self.cache.lookup("serpapi", query, cache_params, force_refresh=force_refresh)
+        if cached is not None:
+            logger.debug(f"SerpAPI cache hit: {query}")
+            return cached
+
+        result = await self._fetch(request_params)
+        self.cache.store("serpapi", query, result, cache_params)
+        return result
+
+    async def _fetch(self, request_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Perform the HTTP request to SerpAPI, retrying after 429 responses."""
+        client = self._get_http_client()
+        for attempt in range(settings.max_retries):
+            await rate_limiter.acquire("serpapi")
             response = await client.get(self.base_url, params=request_params)
+            if response.status_code == 429:
+                rate_limiter.report_throttled("serpapi", parse_retry_after(response.headers.get("Retry-After")))
+                if attempt < settings.max_retries - 1:
+                    continue
             response.raise_for_status()
-            return response.json()
+            rate_limiter.report_success("serpapi")
+            payload: Dict[str, Any] = response.json()
+            return payload
+        raise RuntimeError(f"SerpAPI request not attempted: max_retries is {settings.max_retries}")
+
+    @staticmethod
+    def _coalesce_key(request_params: Dict[str, Any]) -> Tuple:
+        """Build a hashable key from request params, excluding the API key."""
+        return tuple(
+            sorted((k, json.dumps(v, sort_keys=True, default=str)) for k, v in request_params.items() if k != "api_key")
+        )
+
+    def _on_fetch_done(self, key: Tuple, future: asyncio.Future) -> None:
+        """Move a finished request from the in-flight map into the recent-response map."""
+        self._in_flight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        now = time.monotonic()
+        self._recent = {k: v for k, v in self._recent.items() if now - v[0] < self.coalesce_ttl}
+        self._recent[key] = (now, future.result())
 
     async def search_keywords(self, query: str, num: int = 100) -> List[Dict[str, Any]]:
         """Get SERP data including organic results, related searches, and PAA."""
@@ -91,20 +225,31 @@ class SerpApiClient:
 
         return keywords
 
-    async def get_related_searches(self, query: str) -> List[str]:
+    async def get_related_searches(self, query: str, force_refresh: bool = False) -> List[str]:
         """Get related search queries."""
-        result = await self.search(query)
-        return [item.get("query", "") for item in result.get("related_searches", [])]
+        return self.parse_related_searches(await self.search(query, force_refresh=force_refresh))
 
-    async def get_people_also_ask(self, query: str) -> List[str]:
+    async def get_people_also_ask(self, query: str, force_refresh: bool = False) -> List[str]:
         """Get People Also Ask questions."""
-        result = await self.search(query)
-        return [item.get("question", "") for item in result.get("related_questions", [])]
+        return self.parse_people_also_ask(await self.search(query, force_refresh=force_refresh))
 
-    async def get_serp_features(self, query: str) -> Dict[str, Any]:
+    async def get_serp_features(self, query: str, force_refresh: bool = False) -> Dict[str, Any]:
         """Analyze SERP features for a query."""
-        result = await self.search(query)
+        return self.parse_serp_features(await self.search(query, force_refresh=force_refresh))
+
+    @staticmethod
+    def parse_related_searches(result: Dict[str, Any]) -> List[str]:
+        """Extract related search queries from a SERP payload."""
+        return [item.get("query", "") for item in result.get("related_searches", [])]
+
+    @staticmethod
+    def parse_people_also_ask(result: Dict[str, Any]) -> List[str]:
+        """Extract People Also Ask questions from a SERP payload."""
+        return [item.get("question", "") for item in result.get("related_questions", [])]
 
+    @staticmethod
+    def parse_serp_features(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive SERP feature counts and richness from a SERP payload."""
         features = {
             "has_featured_snippet": "answer_box" in result,
             "has_knowledge_panel": "knowledge_graph" in result,
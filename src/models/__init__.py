@@ -2,7 +2,15 @@
 
 from models.base import AgentResponse, ConfidenceLevel, DataSource
 from models.competitors import Competitor, CompetitorContent
-from models.keywords import Keyword, KeywordCluster, SearchIntent, SearchVolumeTimeSeries
+from models.keyword_frame import KeywordFrame
+from models.keywords import (
+    Keyword,
+    KeywordCluster,
+    KeywordGraph,
+    KeywordGraphEdge,
+    SearchIntent,
+    SearchVolumeTimeSeries,
+)
 from models.reports import ReportConfig, ReportSection
 from models.segments import AudiencePersona, IntentSegment
 from models.topics import TopicCategory, TopicTrend, TrendDirection
@@ -17,6 +25,9 @@ __all__ = [
     "IntentSegment",
     "Keyword",
     "KeywordCluster",
+    "KeywordFrame",
+    "KeywordGraph",
+    "KeywordGraphEdge",
     "ReportConfig",
     "ReportSection",
     "SearchIntent",
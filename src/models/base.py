@@ -29,3 +29,5 @@ class AgentResponse(BaseModel):
     metadata: Dict[str, Any] = {}
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     processing_time_seconds: Optional[float] = None
+    # Typed output for in-process consumers (the agent's contract output); never serialized
+    output: Optional[Any] = Field(default=None, exclude=True, repr=False)
@@ -0,0 +1,140 @@
+"""Columnar keyword representation for large keyword sets."""
+
+import sys
+from typing import Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from models.keywords import Keyword
+
+
+def _optional_column(values: Iterable[Optional[float]], count: int) -> np.ndarray:
+    """float64 column with NaN for missing values."""
+    return np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64, count=count)
+
+
+class KeywordFrame:
+    """Keywords as parallel NumPy columns plus interned terms.
+
+    Numeric fields that may be missing (volume, cpc, competition, momentum, interest)
+    are float64 with NaN for None; ``paa_count`` and ``serp_feature_count`` are int32.
+    A frame built with ``from_keywords`` keeps the original objects, so ``to_keywords``
+    is free and list fields (PAA, related queries, intent) survive a round trip. Frames
+    built from bare columns materialize ``Keyword`` objects without validation, once.
+    """
+
+    def __init__(
+        self,
+        terms: Sequence[str],
+        volume: Optional[np.ndarray] = None,
+        cpc: Optional[np.ndarray] = None,
+        competition: Optional[np.ndarray] = None,
+        momentum: Optional[np.ndarray] = None,
+        interest: Optional[np.ndarray] = None,
+        paa_count: Optional[np.ndarray] = None,
+        serp_feature_count: Optional[np.ndarray] = None,
+        keywords: Optional[List[Keyword]] = None,
+    ):
+        n = len(terms)
+        self.terms: List[str] = [sys.intern(t) for t in terms]
+
+        def column(values, dtype, fill):
+            if values is None:
+                return np.full(n, fill, dtype=dtype)
+            values = np.asarray(values, dtype=dtype)
+            if values.shape != (n,):
+                raise ValueError(f"column has shape {values.shape}, expected ({n},)")
+            return values
+
+        self.volume = column(volume, np.float64, np.nan)
+        self.cpc = column(cpc, np.float64, np.nan)
+        self.competition = column(competition, np.float64, np.nan)
+        self.momentum = column(momentum, np.float64, np.nan)
+        self.interest = column(interest, np.float64, np.nan)
+        self.paa_count = column(paa_count, np.int32, 0)
+        self.serp_feature_count = column(serp_feature_count, np.int32, 0)
+        self._keywords = keywords
+
+    @classmethod
+    def from_keywords(cls, keywords: Sequence[Keyword]) -> "KeywordFrame":
+        """Build the columns in one pass over `keywords` (which are kept, not copied)."""
+        keywords = list(keywords)
+        n = len(keywords)
+        return cls(
+            terms=[kw.term for kw in keywords],
+            volume=_optional_column((kw.volume for kw in keywords), n),
+            cpc=_optional_column((kw.cpc for kw in keywords), n),
+            competition=_optional_column((kw.competition for kw in keywords), n),
+            momentum=_optional_column((kw.trends_momentum for kw in keywords), n),
+            interest=_optional_column((kw.trends_interest for kw in keywords), n),
+            paa_count=np.fromiter((len(kw.people_also_ask) for kw in keywords), dtype=np.int32, count=n),
+            serp_feature_count=np.fromiter((len(kw.serp_features) for kw in keywords), dtype=np.int32, count=n),
+            keywords=keywords,
+        )
+
+    @classmethod
+    def coerce(cls, keywords: Union["KeywordFrame", Sequence[Keyword]]) -> "KeywordFrame":
+        """Return `keywords` as a frame (frames pass through unchanged)."""
+        if isinstance(keywords, KeywordFrame):
+            return keywords
+        return cls.from_keywords(keywords)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def to_keywords(self) -> List[Keyword]:
+        """Keyword objects for every row (the originals when the frame was built from them)."""
+        if self._keywords is None:
+            self._keywords = [self._row_keyword(i) for i in range(len(self))]
+        return self._keywords
+
+    def keywords_at(self, indices: Iterable[int]) -> List[Keyword]:
+        """Keyword objects for selected rows."""
+        keywords = self.to_keywords()
+        return [keywords[i] for i in indices]
+
+    def take(self, indices: Union[Sequence[int], np.ndarray]) -> "KeywordFrame":
+        """Sub-frame of the selected rows."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return KeywordFrame(
+            terms=[self.terms[i] for i in indices.tolist()],
+            volume=self.volume[indices],
+            cpc=self.cpc[indices],
+            competition=self.competition[indices],
+            momentum=self.momentum[indices],
+            interest=self.interest[indices],
+            paa_count=self.paa_count[indices],
+            serp_feature_count=self.serp_feature_count[indices],
+            keywords=self.keywords_at(indices.tolist()) if self._keywords is not None else None,
+        )
+
+    def filled(self, column: str, value: float = 0.0) -> np.ndarray:
+        """A numeric column with missing values replaced by `value` (the ``or 0`` of the object API)."""
+        values = getattr(self, column)
+        return np.where(np.isnan(values), value, values) if values.dtype.kind == "f" else values
+
+    def _row_keyword(self, i: int) -> Keyword:
+        def optional(values, cast):
+            value = values[i]
+            return None if np.isnan(value) else cast(value)
+
+        # Only scalar columns exist here; build without re-running field validation
+        return Keyword.model_construct(
+            term=self.terms[i],
+            volume=optional(self.volume, int),
+            cpc=optional(self.cpc, float),
+            competition=optional(self.competition, float),
+            trends_interest=optional(self.interest, int),
+            trends_momentum=optional(self.momentum, float),
+        )
+
+
+# Contract field type: agents accept either representation
+KeywordsInput = Union[List[Keyword], KeywordFrame]
+
+
+def require_keywords(value: KeywordsInput) -> KeywordsInput:
+    """Contract validator: at least one keyword, in either representation."""
+    if len(value) == 0:
+        raise ValueError("keywords must contain at least one item")
+    return value
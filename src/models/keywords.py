@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -42,3 +42,19 @@ class SearchVolumeTimeSeries(BaseModel):
     timestamps: List[datetime] = []
     values: List[int] = []
     source: str = "trends"
+
+
+class KeywordGraphEdge(BaseModel):
+    source: str
+    target: str
+    relation: str  # related_search, people_also_ask, trends_top, trends_rising
+    depth: int = Field(default=1, ge=1)
+    weight: float = 0.0
+
+
+class KeywordGraph(BaseModel):
+    seeds: List[str] = []
+    nodes: Dict[str, int] = {}  # normalized term -> BFS depth (seeds are 0)
+    edges: List[KeywordGraphEdge] = []
+    queries_used: int = 0
+    truncated: bool = False
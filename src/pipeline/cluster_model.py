@@ -0,0 +1,91 @@
+"""Fitted topic cluster models that place new keywords without refitting."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.metrics import pairwise_distances_argmin_min
+
+
+class FittedClusterModel:
+    """A fitted vectorizer plus the centroids and labels of the non-empty clusters.
+
+    ``train_distance_mean`` and ``train_distance_p95`` describe how far training
+    keywords sat from their own centroid; ``drift`` compares new keywords against them.
+    """
+
+    def __init__(
+        self,
+        vectorizer: Any,
+        centers: np.ndarray,
+        cluster_ids: List[int],
+        labels: List[str],
+        method: str,
+        features: str,
+        train_distance_mean: float,
+        train_distance_p95: float,
+        n_train: int,
+    ):
+        self.vectorizer = vectorizer
+        self.centers = np.asarray(centers)
+        self.cluster_ids = list(cluster_ids)
+        self.labels = list(labels)
+        self.method = method
+        self.features = features
+        self.train_distance_mean = train_distance_mean
+        self.train_distance_p95 = train_distance_p95
+        self.n_train = n_train
+        self.model_id: Optional[str] = None  # set when stored
+
+    @classmethod
+    def from_fit(
+        cls, vectorizer: Any, matrix, cluster_labels: np.ndarray, centers: np.ndarray, labels: Dict[int, str],
+        method: str, features: str,
+    ) -> "FittedClusterModel":
+        """Build from a finished fit; `labels` maps each kept cluster_id to its label."""
+        cluster_ids = sorted(labels)
+        centers = np.asarray(centers)
+        # Distance of every training row to its own centroid, without densifying the rows
+        rows = np.arange(matrix.shape[0])
+        dot = np.asarray(matrix @ centers.T)[rows, cluster_labels]
+        row_sq = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+        center_sq = (centers ** 2).sum(axis=1)[cluster_labels]
+        distances = np.sqrt(np.clip(row_sq - 2 * dot + center_sq, 0, None))
+        return cls(
+            vectorizer=vectorizer,
+            centers=centers[cluster_ids],
+            cluster_ids=cluster_ids,
+            labels=[labels[i] for i in cluster_ids],
+            method=method,
+            features=features,
+            train_distance_mean=float(distances.mean()),
+            train_distance_p95=float(np.percentile(distances, 95)),
+            n_train=int(matrix.shape[0]),
+        )
+
+    def assign(self, terms: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Nearest cluster_id, centroid distance and an "no known features" flag for each term."""
+        matrix = self.vectorizer.transform(terms).astype(self.centers.dtype)
+        nearest, distances = pairwise_distances_argmin_min(matrix, self.centers)
+        unknown = np.diff(matrix.indptr) == 0
+        return np.asarray(self.cluster_ids)[nearest], distances, unknown
+
+    def drift(self, distances: np.ndarray, unknown: np.ndarray, far_share_threshold: float) -> Dict[str, Any]:
+        """Compare assignment distances with the training distribution.
+
+        About 5% of training keywords lie beyond the training p95 distance; a much larger
+        share of far new keywords means the topics no longer describe the input. Keywords
+        with no feature the vectorizer knows sit at the origin and always count as far.
+        """
+        if distances.size == 0:
+            return {"mean_distance": 0.0, "distance_ratio": 0.0, "far_share": 0.0, "unknown_share": 0.0,
+                    "refit_recommended": False}
+        mean_distance = float(distances.mean())
+        far_share = float(((distances > self.train_distance_p95) | unknown).mean())
+        return {
+            "mean_distance": round(mean_distance, 4),
+            "train_mean_distance": round(self.train_distance_mean, 4),
+            "distance_ratio": round(mean_distance / self.train_distance_mean, 4) if self.train_distance_mean else 0.0,
+            "far_share": round(far_share, 4),
+            "unknown_share": round(float(unknown.mean()), 4),
+            "refit_recommended": far_share >= far_share_threshold,
+        }
@@ -0,0 +1,149 @@
+"""Breadth-first keyword graph expansion over SerpAPI and Google Trends relations."""
+
+import asyncio
+import itertools
+from typing import Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from core.config import settings
+from integrations.google_trends_client import GoogleTrendsClient
+from integrations.serpapi_client import SerpApiClient
+from models.keywords import KeywordGraph, KeywordGraphEdge
+from storage.timeseries import normalize_keyword
+
+# Rising values Google reports as "Breakout" (>5000% growth) rank above any numeric value
+BREAKOUT_PRIORITY = 1_000_000.0
+
+
+def rising_priority(value) -> float:
+    """Frontier priority of a Trends rising query value."""
+    if isinstance(value, str):
+        if "Breakout" in value:
+            return BREAKOUT_PRIORITY
+        try:
+            return float(value.rstrip("%").replace(",", "").lstrip("+"))
+        except ValueError:
+            return 0.0
+    return float(value or 0)
+
+
+class _Expansion:
+    """State of one expansion: the graph being built, its edge index and the frontier."""
+
+    def __init__(self, seeds: List[str], max_depth: int, max_terms: int):
+        self.graph = KeywordGraph(seeds=[normalize_keyword(s) for s in seeds])
+        self.max_depth = max_depth
+        self.max_terms = max_terms
+        self.edge_keys: Set[Tuple[str, str, str]] = set()
+        self.order = itertools.count()
+        self.frontier: "asyncio.PriorityQueue[Tuple[int, float, int, str]]" = asyncio.PriorityQueue()
+        for seed in self.graph.seeds:
+            if seed and seed not in self.graph.nodes:
+                self.graph.nodes[seed] = 0
+                self.frontier.put_nowait((0, 0.0, next(self.order), seed))
+
+    def discover(self, source: str, target: str, relation: str, depth: int, weight: float, expandable: bool) -> None:
+        """Record an edge, adding and queueing `target` if it is new and within the limits."""
+        target = normalize_keyword(target)
+        if not target or target == source:
+            return
+        if target not in self.graph.nodes:
+            if len(self.graph.nodes) >= self.max_terms:
+                self.graph.truncated = True
+                return
+            self.graph.nodes[target] = depth
+            if expandable and depth < self.max_depth:
+                self.frontier.put_nowait((depth, -weight, next(self.order), target))
+        key = (source, target, relation)
+        if key not in self.edge_keys:
+            self.edge_keys.add(key)
+            self.graph.edges.append(
+                KeywordGraphEdge(source=source, target=target, relation=relation, depth=depth, weight=weight)
+            )
+
+
+class KeywordGraphExpander:
+    """Expands seed queries into a keyword graph, breadth first.
+
+    The frontier is a priority queue ordered by (depth, -priority): shallower terms are
+    always expanded first and, within a depth, terms reached through higher Trends
+    rising values go first. Terms are deduplicated on their normalized form before they
+    enter the frontier. ``max_queries`` caps expanded nodes (each costs one SERP lookup
+    and one Trends lookup), ``max_terms`` caps discovered nodes. People Also Ask
+    questions are recorded as leaf nodes and never expanded.
+    """
+
+    def __init__(
+        self,
+        serpapi_client: SerpApiClient,
+        trends_client: Optional[GoogleTrendsClient] = None,
+        max_depth: int = 2,
+        max_queries: Optional[int] = None,
+        max_terms: Optional[int] = None,
+        workers: Optional[int] = None,
+        force_refresh: bool = False,
+    ):
+        self.serpapi = serpapi_client
+        self.trends = trends_client
+        self.max_depth = max_depth
+        self.max_queries = max_queries or settings.keyword_graph_max_queries
+        self.max_terms = max_terms or settings.keyword_graph_max_terms
+        self.workers = workers or settings.keyword_graph_workers
+        self.force_refresh = force_refresh
+
+    async def expand(self, seeds: List[str]) -> KeywordGraph:
+        """Run the BFS from `seeds` and return the discovered graph."""
+        state = _Expansion(seeds, self.max_depth, self.max_terms)
+        tasks = [asyncio.create_task(self._worker(state)) for _ in range(max(1, self.workers))]
+        try:
+            await state.frontier.join()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        graph = state.graph
+        logger.info(
+            f"Keyword graph: {len(graph.seeds)} seeds -> {len(graph.nodes)} terms, "
+            f"{len(graph.edges)} edges, {graph.queries_used} queries (truncated={graph.truncated})"
+        )
+        return graph
+
+    async def _worker(self, state: "_Expansion") -> None:
+        """Expand frontier terms until cancelled, within the query budget."""
+        while True:
+            depth, _, _, term = await state.frontier.get()
+            try:
+                if state.graph.queries_used >= self.max_queries:
+                    state.graph.truncated = True
+                    continue
+                state.graph.queries_used += 1
+                for target, relation, weight, expandable in await self._neighbours(term):
+                    state.discover(term, target, relation, depth + 1, weight, expandable)
+            except Exception as e:
+                logger.error(f"Keyword graph expansion failed for '{term}': {e}")
+            finally:
+                state.frontier.task_done()
+
+    async def _neighbours(self, term: str) -> List[Tuple[str, str, float, bool]]:
+        """(target, relation, weight, expandable) for every relation of one term."""
+        # One SERP payload feeds both related searches and PAA
+        lookups = [self.serpapi.search(term, force_refresh=self.force_refresh)]
+        if self.trends is not None:
+            lookups.append(self.trends.get_related_queries_async(term, force_refresh=self.force_refresh))
+        results = await asyncio.gather(*lookups)
+
+        serp = results[0]
+        neighbours: List[Tuple[str, str, float, bool]] = []
+        neighbours.extend((t, "related_search", 0.0, True) for t in self.serpapi.parse_related_searches(serp))
+        neighbours.extend((q, "people_also_ask", 0.0, False) for q in self.serpapi.parse_people_also_ask(serp))
+        related: Dict = (results[1] or {}) if len(results) > 1 else {}
+        if related.get("mock"):
+            # Trends fell back to mock data (API error or no-network mode); its queries are unrelated
+            return neighbours
+        for item in related.get("rising", []):
+            neighbours.append((item.get("query", ""), "trends_rising", rising_priority(item.get("value")), True))
+        for item in related.get("top", []):
+            neighbours.append((item.get("query", ""), "trends_top", 0.0, True))
+        return neighbours
@@ -0,0 +1,153 @@
+"""Near-duplicate keyword grouping with shingled MinHash and LSH banding."""
+
+import re
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Words that change what a query asks; terms only group with terms using the same set
+MARKER_WORDS = frozenset({
+    "what", "how", "why", "when", "where", "who", "which", "whom", "whose",
+    "not", "no", "without", "never", "non", "vs", "versus",
+})
+# Shingle codes hashed per block; bounds the (num_perm x shingles) working matrix
+_SHINGLE_BLOCK = 65536
+
+
+def _stem(token: str) -> str:
+    """Strip a plain English plural ("trainings" -> "training", "coaches" -> "coach")."""
+    if len(token) > 4 and token.endswith(("ches", "shes", "sses", "xes")):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def canonical_form(term: str) -> str:
+    """Case-, punctuation-, plural- and order-insensitive form: stemmed tokens, sorted.
+
+    "Leadership Trainings" and "training, leadership" both become "leadership training".
+    Every word is kept, so question words and modifiers ("what is leadership",
+    "leadership without authority") stay distinct from the bare term.
+    """
+    return " ".join(sorted(_stem(t) for t in _TOKEN_RE.findall(term.lower())))
+
+
+def shingle_codes(texts: List[str], size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Byte `size`-grams of every space-padded text packed into uint64 codes.
+
+    Returns the concatenated codes and the offset of each text's first code. Repeated
+    grams are kept; they do not change a minimum.
+    """
+    if not 1 <= size <= 8:
+        raise ValueError(f"shingle size must be between 1 and 8 bytes, got {size}")
+    encoded = [f" {text} ".encode("utf-8").ljust(size) for text in texts]
+    lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    counts = lengths - size + 1
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    text_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    positions = np.arange(int(counts.sum())) + np.repeat(text_starts - offsets, counts)
+    codes = np.zeros(positions.size, dtype=np.uint64)
+    for j in range(size):
+        codes |= buf[positions + j] << np.uint64(8 * (size - 1 - j))
+    return codes, offsets
+
+
+class MinHashLSH:
+    """MinHash signatures over character shingles, grouped by LSH banding.
+
+    ``num_perm`` hash functions are split into ``bands`` bands; terms sharing any band
+    become candidates, and a candidate joins a group only when its estimated Jaccard
+    similarity to the bucket's first term reaches ``threshold``. Each term is compared
+    with one bucket head per band, so grouping is near-linear in the number of terms
+    (one sort per band) rather than pairwise.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.8, shingle_size: int = 3, seed: int = 42):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: odd a, wrapping uint64 arithmetic, keep the high 32 bits
+        self._a = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self._b = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True)
+        # Random odd multipliers that fold a band's rows into one bucket key
+        self._fold = rng.integers(0, np.iinfo(np.uint64).max, size=num_perm // bands, dtype=np.uint64, endpoint=True) | np.uint64(1)
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """(len(texts), num_perm) uint32 MinHash signature matrix."""
+        codes, offsets = shingle_codes(texts, self.shingle_size)
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        ends = np.append(offsets[1:], codes.size)
+        start = 0
+        while start < len(texts):
+            # Whole texts per block, about _SHINGLE_BLOCK codes (at least one text)
+            stop = max(start + 1, int(np.searchsorted(ends, offsets[start] + _SHINGLE_BLOCK, side="right")))
+            block = codes[offsets[start] : ends[stop - 1]]
+            permuted = (self._a[:, None] * block[None, :] + self._b[:, None]) >> np.uint64(32)
+            result[start:stop] = np.minimum.reduceat(permuted, offsets[start:stop] - offsets[start], axis=1).T
+            start = stop
+        return result
+
+    def group(self, texts: List[str]) -> List[int]:
+        """Group index of every text; group indices are the position of the group's first member."""
+        n = len(texts)
+        parent = list(range(n))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        if n == 0:
+            return []
+        signatures = self.signatures(texts)
+        rows = self.num_perm // self.bands
+        for band in range(self.bands):
+            band_rows = signatures[:, band * rows : (band + 1) * rows].astype(np.uint64)
+            # Key collisions only add candidates; the Jaccard check below rejects them
+            keys = (band_rows * self._fold).sum(axis=1)
+            _, first, bucket = np.unique(keys, return_index=True, return_inverse=True)
+            heads = first[bucket.ravel()]
+            candidates = np.flatnonzero(heads != np.arange(n))
+            if candidates.size == 0:
+                continue
+            similar = (signatures[candidates] == signatures[heads[candidates]]).mean(axis=1) >= self.threshold
+            for i, head in zip(candidates[similar].tolist(), heads[candidates[similar]].tolist(), strict=True):
+                root_i, root_head = find(i), find(head)
+                if root_i != root_head:
+                    # Lower index wins so group ids follow input order
+                    parent[max(root_i, root_head)] = min(root_i, root_head)
+        return [find(i) for i in range(n)]
+
+
+def group_near_duplicates(terms: List[str], lsh: MinHashLSH) -> List[List[int]]:
+    """Indices of `terms` grouped by near-identical canonical form, groups in first-seen order.
+
+    Forms only group with forms containing the same ``MARKER_WORDS``, so "why leadership
+    training fails" never merges into "leadership training fails" however similar the text.
+    """
+    forms = [canonical_form(t) for t in terms]
+    # Identical canonical forms are grouped exactly; MinHash only runs over distinct forms
+    distinct: Dict[str, int] = {}
+    form_ids = [distinct.setdefault(form, len(distinct)) for form in forms]
+    partitions: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+    for form, form_id in distinct.items():
+        partitions[tuple(t for t in form.split() if t in MARKER_WORDS)].append(form_id)
+    distinct_forms = list(distinct)
+    form_groups = [0] * len(distinct_forms)
+    for members in partitions.values():
+        local = lsh.group([distinct_forms[i] for i in members])
+        for form_id, head in zip(members, local, strict=True):
+            form_groups[form_id] = members[head]
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for index, form_id in enumerate(form_ids):
+        groups[form_groups[form_id]].append(index)
+    return sorted(groups.values(), key=lambda members: members[0])
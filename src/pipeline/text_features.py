@@ -0,0 +1,87 @@
+"""Vocabulary-free keyword features: hashed n-gram counts with incrementally updated IDF."""
+
+from collections import Counter
+from typing import Iterable, List
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+
+class IncrementalIdf:
+    """Smoothed IDF (same formula as sklearn's TfidfTransformer) over a fixed number of features.
+
+    Document frequencies are kept in one dense array of ``n_features`` counters, so
+    memory is constant however many distinct terms are seen.
+    """
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.n_docs = 0
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+
+    def partial_fit(self, counts: sp.csr_matrix) -> "IncrementalIdf":
+        """Add a chunk of documents (rows of a hashed count matrix)."""
+        counts = sp.csr_matrix(counts)
+        self.n_docs += counts.shape[0]
+        # Each stored entry is one (document, feature) occurrence
+        self.doc_freq += np.bincount(counts.indices, minlength=self.n_features)
+        return self
+
+    @property
+    def idf(self) -> np.ndarray:
+        return np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1.0
+
+    def transform(self, counts: sp.csr_matrix, dtype=np.float64) -> sp.csr_matrix:
+        """Reweight counts by the current IDF and L2-normalize each row."""
+        weighted = sp.csr_matrix(counts, dtype=dtype) @ sp.diags(self.idf.astype(dtype))
+        return normalize(sp.csr_matrix(weighted), norm="l2", copy=False)
+
+
+class HashingTfidfVectorizer:
+    """TF-IDF over hashed word n-grams that can be fitted chunk by chunk.
+
+    ``partial_fit`` may be called as keyword batches arrive; ``transform`` applies the
+    IDF accumulated so far. There is no vocabulary, so cluster labels come from token
+    counts (see ``top_tokens``) rather than from feature names.
+    """
+
+    def __init__(self, n_features: int = 2 ** 16, ngram_range=(1, 2), dtype=np.float64):
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            stop_words="english",
+            ngram_range=ngram_range,
+            alternate_sign=False,
+            norm=None,
+        )
+        self.idf = IncrementalIdf(n_features)
+        self.dtype = dtype
+
+    def partial_fit(self, terms: List[str]) -> "HashingTfidfVectorizer":
+        """Update document frequencies with a chunk of terms."""
+        self.idf.partial_fit(self.hasher.transform(terms))
+        return self
+
+    def transform(self, terms: List[str]) -> sp.csr_matrix:
+        return self.idf.transform(self.hasher.transform(terms), dtype=self.dtype)
+
+    def fit_transform_chunks(self, chunks: Iterable[List[str]]) -> sp.csr_matrix:
+        """Fit on every chunk, then weight all rows with the final IDF.
+
+        Hashed counts are computed once per chunk; only the sparse counts are kept.
+        """
+        counts = []
+        for chunk in chunks:
+            chunk_counts = self.hasher.transform(chunk)
+            self.idf.partial_fit(chunk_counts)
+            counts.append(chunk_counts)
+        if not counts:
+            return sp.csr_matrix((0, self.idf.n_features), dtype=self.dtype)
+        return self.idf.transform(sp.vstack(counts, format="csr"), dtype=self.dtype)
+
+    def top_tokens(self, terms: List[str], n: int = 3) -> List[str]:
+        """Most frequent analyzed tokens (unigrams and n-grams) across `terms`, ties broken alphabetically."""
+        analyzer = self.hasher.build_analyzer()
+        counts = Counter(token for term in terms for token in analyzer(term))
+        return [token for token, _ in sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:n]]
@@ -1,21 +1,35 @@
 """Storage layer for caching and persistence."""
 
 from storage.cache import CacheManager
+from storage.cluster_models import ClusterModelStore
 from storage.database import (
     Base,
+    ClusterModelRecord,
+    ClusterModelRun,
     CompetitorCrawl,
     DerivedCluster,
     NormalizedKeyword,
+    RawApiPayload,
     RawApiResponse,
+    TrendPoint,
     init_database,
 )
+from storage.persistence import RunStore
+from storage.timeseries import TrendSeriesStore
 
 __all__ = [
     "Base",
     "CacheManager",
+    "ClusterModelRecord",
+    "ClusterModelRun",
+    "ClusterModelStore",
     "CompetitorCrawl",
     "DerivedCluster",
     "NormalizedKeyword",
+    "RawApiPayload",
     "RawApiResponse",
+    "RunStore",
+    "TrendPoint",
+    "TrendSeriesStore",
     "init_database",
 ]
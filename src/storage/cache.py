@@ -1,54 +1,168 @@
 """Cache manager for API response deduplication and reproducibility."""
 
-from typing import Any, Dict, Optional
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from loguru import logger
+from sqlalchemy import and_, func, insert, select
 from sqlalchemy.orm import Session
 
-from storage.database import RawApiResponse
+from core.config import settings
+from storage.database import RawApiPayload, RawApiResponse
+from storage.payloads import encode_payload, resolve_response
+
+# SQLite bound-parameter budget per IN (...) query
+_BULK_CHUNK_SIZE = 500
+
+
+class MemoryLRU:
+    """Thread-safe in-process LRU of (created_at, response) entries."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[datetime, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Tuple[str, str, str], max_age_seconds: Optional[int] = None
+    ) -> Optional[Tuple[datetime, Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if max_age_seconds is not None and entry[0] < datetime.utcnow() - timedelta(seconds=max_age_seconds):
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[str, str, str], created_at: datetime, response: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or current[0] <= created_at:
+                self._entries[key] = (created_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class CacheManager:
-    """Manages caching of API responses using SQLite storage."""
+    """Manages caching of API responses using SQLite storage.
 
-    def __init__(self, session_factory):
+    Integration clients use ``lookup``/``store`` as a read-through/write-through
+    cache keyed by source, normalized query, request params and ``config_hash``.
+    Entries older than the source's TTL are treated as misses. Reads go through
+    an in-process LRU before falling back to a single indexed SQLite query.
+    """
+
+    def __init__(self, session_factory, run_id: str = "adhoc", config_hash: str = "default"):
         self.session_factory = session_factory
+        self.run_id = run_id
+        self.config_hash = config_hash
+        self.ttls = {
+            "serpapi": settings.serpapi_cache_ttl,
+            "trends": settings.trends_cache_ttl,
+            "topic_clusters": settings.topic_cluster_cache_ttl,
+        }
+        self.memory = MemoryLRU(settings.cache_memory_max_entries)
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
 
     def _get_session(self) -> Session:
-        return self.session_factory()
+        session: Session = self.session_factory()
+        return session
 
     def is_cache_hit(self, source: str, query: str, config_hash: str) -> bool:
         """Check if a cached response exists for this source + query + config."""
-        session = self._get_session()
-        try:
-            count = (
-                session.query(RawApiResponse)
-                .filter_by(source=source, query=query, config_hash=config_hash)
-                .count()
-            )
-            return count > 0
-        finally:
-            session.close()
+        return self.get_cached_response(source, query, config_hash) is not None
 
     def get_cached_response(
-        self, source: str, query: str, config_hash: str
+        self, source: str, query: str, config_hash: str, max_age_seconds: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
-        """Retrieve a cached API response."""
+        """Retrieve a cached API response, optionally ignoring entries older than max_age_seconds."""
+        found = self.get_many(source, [query], config_hash, max_age_seconds=max_age_seconds)
+        response = found.get(query)
+        if response is not None:
+            logger.debug(f"Cache hit: {source}/{query}")
+        return response
+
+    def get_many(
+        self,
+        source: str,
+        queries: Iterable[str],
+        config_hash: str,
+        max_age_seconds: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve the newest cached response for each query, keyed by query. Misses are omitted."""
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for query in dict.fromkeys(queries):
+            entry = self.memory.get((source, query, config_hash), max_age_seconds)
+            if entry is not None:
+                found[query] = entry[1]
+            else:
+                missing.append(query)
+        if not missing:
+            return found
+
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds) if max_age_seconds is not None else None
+        newest: Dict[str, Tuple[datetime, Dict[str, Any]]] = {}
         session = self._get_session()
         try:
-            record = (
-                session.query(RawApiResponse)
-                .filter_by(source=source, query=query, config_hash=config_hash)
-                .order_by(RawApiResponse.created_at.desc())
-                .first()
-            )
-            if record:
-                logger.debug(f"Cache hit: {source}/{query}")
-                return record.response_json
-            return None
+            for start in range(0, len(missing), _BULK_CHUNK_SIZE):
+                chunk = missing[start : start + _BULK_CHUNK_SIZE]
+                # MAX(created_at) per query comes from ix_raw_api_responses_lookup alone; the join
+                # then reads (and decodes) only each query's newest row through the same index
+                latest = select(
+                    RawApiResponse.query, func.max(RawApiResponse.created_at).label("created_at")
+                ).where(
+                    RawApiResponse.source == source,
+                    RawApiResponse.config_hash == config_hash,
+                    RawApiResponse.query.in_(chunk),
+                )
+                if cutoff is not None:
+                    latest = latest.where(RawApiResponse.created_at >= cutoff)
+                newest_rows = latest.group_by(RawApiResponse.query).subquery()
+                stmt = select(
+                    RawApiResponse.query,
+                    RawApiResponse.created_at,
+                    RawApiResponse.response_json,
+                    RawApiPayload.compressed,
+                ).select_from(newest_rows).join(
+                    RawApiResponse,
+                    and_(
+                        RawApiResponse.source == source,
+                        RawApiResponse.query == newest_rows.c.query,
+                        RawApiResponse.config_hash == config_hash,
+                        RawApiResponse.created_at == newest_rows.c.created_at,
+                    ),
+                ).outerjoin(
+                    RawApiPayload, RawApiPayload.digest == RawApiResponse.payload_digest
+                ).where(RawApiResponse.query.in_(chunk))
+                for query, created_at, response_json, compressed in session.execute(stmt):
+                    # Rows stored in the same instant tie on created_at; keep one
+                    if query not in newest:
+                        newest[query] = (created_at, resolve_response(response_json, compressed))
         finally:
             session.close()
 
+        for query, (created_at, response) in newest.items():
+            self.memory.put((source, query, config_hash), created_at, response)
+            found[query] = response
+        return found
+
     def store_response(
         self,
         run_id: str,
@@ -58,20 +172,105 @@ class CacheManager:
         response: Dict[str, Any],
     ) -> None:
         """Store an API response in the cache."""
+        self.put_many(run_id, config_hash, source, {query: response})
+
+    def put_many(
+        self,
+        run_id: str,
+        config_hash: str,
+        source: str,
+        responses: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Store many responses for one source in a single batched insert.
+
+        Each distinct payload body is compressed and stored once in ``raw_api_payloads``;
+        response rows reference it by digest.
+        """
+        if not responses:
+            return
+        created_at = datetime.utcnow()
+        payloads: Dict[str, Dict[str, Any]] = {}
+        rows = []
+        for query, response in responses.items():
+            digest, compressed, size = encode_payload(response)
+            payloads.setdefault(digest, {"digest": digest, "compressed": compressed, "size_bytes": size})
+            rows.append({
+                "run_id": run_id,
+                "config_hash": config_hash,
+                "source": source,
+                "query": query,
+                "response_json": None,
+                "payload_digest": digest,
+                "created_at": created_at,
+            })
+
         session = self._get_session()
         try:
-            record = RawApiResponse(
-                run_id=run_id,
-                config_hash=config_hash,
-                source=source,
-                query=query,
-                response_json=response,
-            )
-            session.add(record)
+            new_payloads = self._filter_new_payloads(session, payloads)
+            if new_payloads:
+                # OR IGNORE covers a concurrent writer storing the same digest first
+                session.execute(insert(RawApiPayload).prefix_with("OR IGNORE", dialect="sqlite"), [
+                    {**payload, "created_at": created_at} for payload in new_payloads
+                ])
+            session.execute(insert(RawApiResponse), rows)
             session.commit()
-            logger.debug(f"Cached response: {source}/{query} (run={run_id})")
+            for query, response in responses.items():
+                self.memory.put((source, query, config_hash), created_at, response)
+            logger.debug(
+                f"Cached {len(rows)} response(s): {source} (run={run_id}, new payloads={len(new_payloads)})"
+            )
         except Exception as e:
             session.rollback()
             logger.error(f"Failed to cache response: {e}")
         finally:
             session.close()
+
+    @staticmethod
+    def _filter_new_payloads(session: Session, payloads: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop payloads whose digest is already stored."""
+        digests = list(payloads)
+        existing: Set[str] = set()
+        for start in range(0, len(digests), _BULK_CHUNK_SIZE):
+            chunk = digests[start : start + _BULK_CHUNK_SIZE]
+            existing.update(session.scalars(select(RawApiPayload.digest).where(RawApiPayload.digest.in_(chunk))))
+        return [payload for digest, payload in payloads.items() if digest not in existing]
+
+    @staticmethod
+    def cache_key(query: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the stored query key: whitespace/case-normalized query plus canonical params."""
+        key = " ".join(query.lower().split())
+        if params:
+            key += "?" + json.dumps(params, sort_keys=True, default=str)
+        return key
+
+    def lookup(
+        self, source: str, query: str, params: Optional[Dict[str, Any]] = None, force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Read-through lookup honoring the per-source TTL. force_refresh always misses."""
+        response = None
+        if not force_refresh:
+            response = self.get_cached_response(
+                source, self.cache_key(query, params), self.config_hash, max_age_seconds=self.ttls.get(source)
+            )
+        counter = self.hits if response is not None else self.misses
+        with self._stats_lock:
+            counter[source] = counter.get(source, 0) + 1
+        return response
+
+    def store(
+        self, source: str, query: str, response: Dict[str, Any], params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write-through store under the current run and config hash."""
+        self.store_response(self.run_id, self.config_hash, source, self.cache_key(query, params), response)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss counts per source."""
+        with self._stats_lock:
+            hits, misses = dict(self.hits), dict(self.misses)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_total": sum(hits.values()),
+            "miss_total": sum(misses.values()),
+            "memory_entries": len(self.memory),
+        }
@@ -0,0 +1,87 @@
+"""Persistence of fitted topic cluster models."""
+
+import pickle
+import zlib
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4
+
+from loguru import logger
+from sqlalchemy import or_, select
+
+from pipeline.cluster_model import FittedClusterModel
+from storage.database import ClusterModelRecord, ClusterModelRun
+from storage.payloads import COMPRESSION_LEVEL
+
+
+class ClusterModelStore:
+    """Saves fitted cluster models as compressed blobs and loads them by id or run.
+
+    Blobs are pickles written by this application only; never load rows from an
+    untrusted database.
+    """
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def save(self, model: FittedClusterModel, run_id: str) -> str:
+        """Store `model` for `run_id` and return its model_id."""
+        model_id = uuid4().hex
+        model.model_id = model_id
+        raw = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        compressed = zlib.compress(raw, COMPRESSION_LEVEL)
+        session = self.session_factory()
+        try:
+            session.add(ClusterModelRecord(
+                model_id=model_id,
+                run_id=run_id,
+                method=model.method,
+                features=model.features,
+                n_clusters=len(model.cluster_ids),
+                compressed=compressed,
+                size_bytes=len(raw),
+                created_at=datetime.utcnow(),
+            ))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        logger.info(f"Stored cluster model {model_id} for run {run_id} ({len(compressed)} bytes compressed)")
+        return model_id
+
+    def link(self, model_id: str, run_id: str) -> bool:
+        """Let `run_id` load an existing model without storing it again. False if the model is gone."""
+        session = self.session_factory()
+        try:
+            if session.get(ClusterModelRecord, model_id) is None:
+                return False
+            if session.get(ClusterModelRun, (run_id, model_id)) is None:
+                session.add(ClusterModelRun(run_id=run_id, model_id=model_id, created_at=datetime.utcnow()))
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        return True
+
+    def load(self, model_id: Optional[str] = None, run_id: Optional[str] = None) -> Optional[FittedClusterModel]:
+        """Load a model by id, else the newest for `run_id` (fitted or linked), else the newest overall."""
+        stmt = select(ClusterModelRecord.compressed)
+        if model_id is not None:
+            stmt = stmt.where(ClusterModelRecord.model_id == model_id)
+        elif run_id is not None:
+            linked = select(ClusterModelRun.model_id).where(ClusterModelRun.run_id == run_id)
+            stmt = stmt.where(or_(ClusterModelRecord.run_id == run_id, ClusterModelRecord.model_id.in_(linked)))
+        stmt = stmt.order_by(ClusterModelRecord.created_at.desc()).limit(1)
+        session = self.session_factory()
+        try:
+            compressed = session.scalar(stmt)
+        finally:
+            session.close()
+        if compressed is None:
+            return None
+        model: FittedClusterModel = pickle.loads(zlib.decompress(compressed))
+        return model
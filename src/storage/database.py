@@ -2,28 +2,88 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text, create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    create_engine,
+    event,
+    inspect,
+    text,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from sqlalchemy.types import JSON
 
 from core.config import settings
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base for all storage tables."""
+
+
+# SQLite tuning presets; individual sqlite_*/db_* settings override these values.
+STORAGE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "journal_mode": None,
+        "synchronous": None,
+        "mmap_size": None,
+        "cache_size": None,
+        "busy_timeout_ms": 5000,
+        "pool_size": 5,
+        "max_overflow": 10,
+    },
+    "production": {
+        "journal_mode": "WAL",  # readers never block the writer (API + CLI share one file)
+        "synchronous": "NORMAL",  # durable at checkpoints; safe with WAL
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64000,  # negative = KiB, i.e. ~64 MB page cache per connection
+        "busy_timeout_ms": 15000,
+        "pool_size": 10,
+        "max_overflow": 20,
+    },
+}
+
+
+class RawApiPayload(Base):
+    """Content-addressed, zlib-compressed API payload stored once per distinct body."""
+
+    __tablename__ = "raw_api_payloads"
+
+    digest = Column(String(64), primary_key=True)  # sha256 of canonical JSON
+    compressed = Column(LargeBinary, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
 
 
 class RawApiResponse(Base):
-    """Stores raw API responses for caching and reproducibility."""
+    """Stores raw API responses for caching and reproducibility.
+
+    New rows reference their body through ``payload_digest``; ``response_json``
+    is only populated on rows written before payloads were deduplicated.
+    """
 
     __tablename__ = "raw_api_responses"
+    __table_args__ = (
+        # Cache lookups filter on source/query/config_hash and take the newest created_at
+        Index("ix_raw_api_responses_lookup", "source", "query", "config_hash", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     run_id = Column(String(64), nullable=False, index=True)
     config_hash = Column(String(64), nullable=False, index=True)
     source = Column(String(50), nullable=False)  # serpapi, trends, gsc
     query = Column(String(500), nullable=False)
-    response_json = Column(JSON, nullable=False)
+    response_json = Column(JSON, nullable=True)
+    payload_digest = Column(String(64), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
@@ -75,15 +135,130 @@ class CompetitorCrawl(Base):
     crawled_at = Column(DateTime, default=datetime.utcnow)
 
 
-def init_database(url: Optional[str] = None) -> tuple:
-    """Initialize the database and return engine + session maker."""
+class TrendPoint(Base):
+    """One Google Trends interest value per keyword and period (ISO start date).
+
+    Stored WITHOUT ROWID so rows are clustered on (keyword, period) and a keyword's
+    history is a single contiguous range scan.
+    """
+
+    __tablename__ = "trend_points"
+    __table_args__ = ({"sqlite_with_rowid": False},)
+
+    keyword = Column(String(500), primary_key=True)
+    period = Column(String(10), primary_key=True)  # YYYY-MM-DD
+    value = Column(Integer, nullable=False)
+    source = Column(String(50), nullable=False, default="trends")
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ClusterModelRecord(Base):
+    """A fitted topic cluster model (vectorizer, centroids, labels) stored per run."""
+
+    __tablename__ = "cluster_models"
+
+    model_id = Column(String(64), primary_key=True)
+    run_id = Column(String(64), nullable=False, index=True)
+    method = Column(String(50), nullable=False)
+    features = Column(String(50), nullable=False)
+    n_clusters = Column(Integer, nullable=False)
+    compressed = Column(LargeBinary, nullable=False)  # zlib-compressed pickle
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class ClusterModelRun(Base):
+    """Links a run to a model fitted by an earlier run (a cluster cache hit reuses the fit)."""
+
+    __tablename__ = "cluster_model_runs"
+
+    run_id = Column(String(64), primary_key=True)
+    model_id = Column(String(64), primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+def resolve_storage_profile(name: Optional[str] = None) -> Dict[str, Any]:
+    """Return the named storage profile with any explicit settings overrides applied."""
+    profile_name = name or settings.storage_profile
+    if profile_name not in STORAGE_PROFILES:
+        raise ValueError(f"Unknown storage profile '{profile_name}', expected one of {sorted(STORAGE_PROFILES)}")
+    profile = dict(STORAGE_PROFILES[profile_name])
+    overrides = {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "mmap_size": settings.sqlite_mmap_size,
+        "cache_size": settings.sqlite_cache_size,
+        "busy_timeout_ms": settings.sqlite_busy_timeout_ms,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+    }
+    profile.update({k: v for k, v in overrides.items() if v is not None})
+    return profile
+
+
+def _sqlite_pragmas(profile: Dict[str, Any]) -> List[str]:
+    pragmas = []
+    if profile["busy_timeout_ms"] is not None:
+        pragmas.append(f"PRAGMA busy_timeout={int(profile['busy_timeout_ms'])}")
+    if profile["journal_mode"]:
+        pragmas.append(f"PRAGMA journal_mode={profile['journal_mode']}")
+    if profile["synchronous"]:
+        pragmas.append(f"PRAGMA synchronous={profile['synchronous']}")
+    if profile["mmap_size"] is not None:
+        pragmas.append(f"PRAGMA mmap_size={int(profile['mmap_size'])}")
+    if profile["cache_size"] is not None:
+        pragmas.append(f"PRAGMA cache_size={int(profile['cache_size'])}")
+    return pragmas
+
+
+def init_database(url: Optional[str] = None, profile: Optional[str] = None) -> tuple:
+    """Initialize the database and return engine + session maker.
+
+    SQLite connections are tuned per the storage profile (see ``STORAGE_PROFILES``)
+    through a connect event hook, so every pooled connection gets the same PRAGMAs.
+    """
     db_url = url or settings.database_url
-    engine = create_engine(db_url, connect_args={"check_same_thread": False})
+    storage = resolve_storage_profile(profile)
+    parsed = make_url(db_url)
+    is_sqlite = parsed.get_backend_name() == "sqlite"
+    is_memory = is_sqlite and parsed.database in (None, "", ":memory:")
+
+    engine_kwargs: Dict[str, Any] = {}
+    if is_sqlite:
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    if not is_memory:
+        engine_kwargs["pool_size"] = storage["pool_size"]
+        engine_kwargs["max_overflow"] = storage["max_overflow"]
+    engine = create_engine(db_url, **engine_kwargs)
+
+    if is_sqlite:
+        pragmas = _sqlite_pragmas(storage)
+
+        @event.listens_for(engine, "connect")
+        def _apply_sqlite_pragmas(dbapi_connection, _connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
     Base.metadata.create_all(bind=engine)
+    _upgrade_schema(engine)
     session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     return engine, session_local
 
 
+def _upgrade_schema(engine) -> None:
+    """Add columns and indexes introduced after a database file was first created."""
+    columns = {c["name"] for c in inspect(engine).get_columns(RawApiResponse.__tablename__)}
+    if "payload_digest" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE raw_api_responses ADD COLUMN payload_digest VARCHAR(64)"))
+    for index in Base.metadata.tables[RawApiResponse.__tablename__].indexes:
+        index.create(bind=engine, checkfirst=True)
+
+
 def get_session(session_maker: sessionmaker) -> Session:
     """Get a database session."""
     db = session_maker()
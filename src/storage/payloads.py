@@ -0,0 +1,32 @@
+"""Content-addressed encoding for raw API payloads."""
+
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+COMPRESSION_LEVEL = 6
+
+
+def canonical_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload deterministically so identical bodies hash identically."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def encode_payload(payload: Dict[str, Any]) -> Tuple[str, bytes, int]:
+    """Return (sha256 digest, compressed bytes, uncompressed size) for a payload."""
+    raw = canonical_json(payload)
+    return hashlib.sha256(raw).hexdigest(), zlib.compress(raw, COMPRESSION_LEVEL), len(raw)
+
+
+def decode_payload(compressed: bytes) -> Dict[str, Any]:
+    """Decompress and parse a stored payload."""
+    payload: Dict[str, Any] = json.loads(zlib.decompress(compressed))
+    return payload
+
+
+def resolve_response(response_json: Optional[Dict[str, Any]], compressed: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """Return a row's payload, preferring the deduplicated blob over legacy inline JSON."""
+    if compressed is not None:
+        return decode_payload(compressed)
+    return response_json
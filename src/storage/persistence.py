@@ -0,0 +1,113 @@
+"""Bulk persistence of per-run pipeline outputs."""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from loguru import logger
+from sqlalchemy import select
+
+from models.competitors import CompetitorContent
+from models.keywords import Keyword, KeywordCluster
+from storage.database import CompetitorCrawl, DerivedCluster, NormalizedKeyword
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+class RunStore:
+    """Writes and reads normalized keywords, clusters and competitor crawls keyed by run_id.
+
+    Rows are inserted with Core executemany statements (no per-row ORM objects), all
+    tables for a run in one transaction, so a run is either fully stored or not at all.
+    """
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def save_run(
+        self,
+        run_id: str,
+        keywords: Iterable[Keyword] = (),
+        clusters: Iterable[KeywordCluster] = (),
+        crawls: Optional[Mapping[str, Iterable[CompetitorContent]]] = None,
+    ) -> Dict[str, int]:
+        """Bulk-insert a run's outputs in one transaction. Returns row counts per table."""
+        now = datetime.utcnow()
+        keyword_rows = [
+            {
+                "run_id": run_id,
+                "term": kw.term,
+                "volume": kw.volume,
+                "cpc": kw.cpc,
+                "competition": kw.competition,
+                "search_intent": _enum_value(kw.search_intent),
+                "trends_interest": kw.trends_interest,
+                "trends_momentum": kw.trends_momentum,
+                "source": kw.source,
+                "created_at": now,
+            }
+            for kw in keywords
+        ]
+        cluster_rows = [
+            {
+                "run_id": run_id,
+                "cluster_id": c.cluster_id,
+                "label": c.label,
+                "keyword_count": c.size,
+                "avg_demand_signal": c.avg_demand_signal,
+                "top_intent": _enum_value(c.top_intent),
+                "created_at": now,
+            }
+            for c in clusters
+        ]
+        crawl_rows = [
+            {
+                "run_id": run_id,
+                "domain": domain,
+                "url": page.url,
+                "title": page.title,
+                "topic": page.topic,
+                "word_count": page.word_count,
+                "crawled_at": now,
+            }
+            for domain, pages in (crawls or {}).items()
+            for page in pages
+        ]
+
+        session = self.session_factory()
+        try:
+            for model, rows in (
+                (NormalizedKeyword, keyword_rows),
+                (DerivedCluster, cluster_rows),
+                (CompetitorCrawl, crawl_rows),
+            ):
+                if rows:
+                    session.execute(model.__table__.insert(), rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        counts = {"keywords": len(keyword_rows), "clusters": len(cluster_rows), "crawls": len(crawl_rows)}
+        logger.info(f"Persisted run {run_id}: {counts}")
+        return counts
+
+    def load_run(self, run_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Read a stored run back as plain row dicts per table."""
+        session = self.session_factory()
+        try:
+            result = {}
+            for name, model in (
+                ("keywords", NormalizedKeyword),
+                ("clusters", DerivedCluster),
+                ("crawls", CompetitorCrawl),
+            ):
+                table = model.__table__
+                rows = session.execute(select(table).where(table.c.run_id == run_id).order_by(table.c.id))
+                result[name] = [dict(row._mapping) for row in rows]
+            return result
+        finally:
+            session.close()
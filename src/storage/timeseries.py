@@ -0,0 +1,99 @@
+"""Incremental per-keyword Google Trends time-series store."""
+
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import insert, select
+
+from models.keywords import SearchVolumeTimeSeries
+from storage.database import TrendPoint
+
+# SQLite bound-parameter budget per IN (...) query
+_BULK_CHUNK_SIZE = 500
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Store keys are case- and whitespace-normalized."""
+    return " ".join(keyword.lower().split())
+
+
+def period_key(timestamp) -> str:
+    """ISO date string used as the period key."""
+    if isinstance(timestamp, str):
+        return timestamp[:10]
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.date()
+    key: str = timestamp.isoformat()
+    return key
+
+
+class TrendSeriesStore:
+    """Keyword x period interest values in SQLite, written and read back in bulk.
+
+    Each (keyword, period) pair is stored once; re-storing a period overwrites its value,
+    so refetching an overlapping window is idempotent.
+    """
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def upsert(self, series: Iterable[SearchVolumeTimeSeries]) -> int:
+        """Insert or replace every point of every series in one transaction. Returns points written."""
+        now = datetime.utcnow()
+        rows: Dict[Tuple[str, str], Dict] = {}
+        for ts in series:
+            keyword = normalize_keyword(ts.keyword)
+            for timestamp, value in zip(ts.timestamps, ts.values, strict=True):
+                period = period_key(timestamp)
+                rows[(keyword, period)] = {
+                    "keyword": keyword,
+                    "period": period,
+                    "value": int(value),
+                    "source": ts.source,
+                    "fetched_at": now,
+                }
+        if not rows:
+            return 0
+
+        session = self.session_factory()
+        try:
+            session.execute(insert(TrendPoint).prefix_with("OR REPLACE", dialect="sqlite"), list(rows.values()))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        logger.debug(f"Stored {len(rows)} trend point(s)")
+        return len(rows)
+
+    def _points(self, keywords: List[str], start: Optional[date] = None) -> Dict[str, Dict[str, int]]:
+        points: Dict[str, Dict[str, int]] = {}
+        session = self.session_factory()
+        try:
+            for offset in range(0, len(keywords), _BULK_CHUNK_SIZE):
+                chunk = keywords[offset : offset + _BULK_CHUNK_SIZE]
+                stmt = select(TrendPoint.keyword, TrendPoint.period, TrendPoint.value).where(
+                    TrendPoint.keyword.in_(chunk)
+                )
+                if start is not None:
+                    stmt = stmt.where(TrendPoint.period >= period_key(start))
+                for keyword, period, value in session.execute(stmt):
+                    points.setdefault(keyword, {})[period] = value
+        finally:
+            session.close()
+        return points
+
+    def load(self, keywords: Iterable[str], start: Optional[date] = None) -> Dict[str, SearchVolumeTimeSeries]:
+        """Stored series per normalized keyword, oldest period first, optionally from `start` on."""
+        names = list(dict.fromkeys(normalize_keyword(k) for k in keywords))
+        result = {}
+        for keyword, points in self._points(names, start).items():
+            periods = sorted(points)
+            result[keyword] = SearchVolumeTimeSeries(
+                keyword=keyword,
+                timestamps=[datetime.fromisoformat(p) for p in periods],
+                values=[points[p] for p in periods],
+            )
+        return result
@@ -0,0 +1,166 @@
+"""Process-wide token-bucket rate limiting for external providers."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from core.config import settings
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that slows down when the provider throttles us.
+
+    Tokens may go negative: each reservation takes a token immediately and returns
+    how long the caller must wait, so concurrent callers queue up fairly without
+    polling. A 429 halves the refill rate (down to ``MIN_RATE_FRACTION`` of the
+    configured rate) and pushes the bucket into debt for the Retry-After period;
+    every success recovers ``RECOVERY_FRACTION`` of the configured rate.
+    """
+
+    MIN_RATE_FRACTION = 0.1
+    RECOVERY_FRACTION = 0.1
+    DEFAULT_PENALTY_SECONDS = 5.0
+
+    def __init__(self, name: str, rate: float, burst: int):
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return the number of seconds to wait before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.acquired += 1
+            self.total_wait += wait
+            return wait
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Back off after a 429: halve the rate and block for the Retry-After period."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.rate * 0.5, self.base_rate * self.MIN_RATE_FRACTION)
+            delay = retry_after if retry_after is not None else self.DEFAULT_PENALTY_SECONDS
+            self.tokens = min(self.tokens, 0.0) - delay * self.rate
+            self.throttled += 1
+
+    def recover(self) -> None:
+        """Step the rate back toward its configured value after a successful call."""
+        with self._lock:
+            if self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * self.RECOVERY_FRACTION)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate_per_second": round(self.rate, 4),
+                "configured_rate_per_second": self.base_rate,
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "total_wait_seconds": round(self.total_wait, 4),
+            }
+
+
+class RateLimiter:
+    """Registry of per-provider token buckets shared by every client in the process.
+
+    Provider keys are ``serpapi``, ``trends`` or ``competitor:<host>``; the part
+    before the colon selects the configured rate, so each competitor host gets
+    its own bucket.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, provider: str) -> TokenBucket:
+        with self._lock:
+            if provider not in self._buckets:
+                self._buckets[provider] = TokenBucket(
+                    name=provider,
+                    rate=self._configured_rate(provider),
+                    burst=settings.rate_limit_burst,
+                )
+            return self._buckets[provider]
+
+    @staticmethod
+    def _configured_rate(provider: str) -> float:
+        rates = {
+            "serpapi": settings.serpapi_rate_limit,
+            "trends": settings.trends_rate_limit,
+            "competitor": settings.competitor_rate_limit,
+        }
+        rate: float = rates.get(provider.split(":", 1)[0], 1.0 / settings.rate_limit_delay)
+        return rate
+
+    async def acquire(self, provider: str) -> None:
+        """Wait (without blocking the event loop) until a request to provider is allowed."""
+        wait = self.bucket(provider).reserve()
+        if wait > 0:
+            logger.debug(f"Rate limiter: waiting {wait:.2f}s for {provider}")
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, provider: str) -> None:
+        """Blocking variant of ``acquire`` for synchronous clients."""
+        wait = self.bucket(provider).reserve()
+        if wait > 0:
+            logger.debug(f"Rate limiter: waiting {wait:.2f}s for {provider}")
+            time.sleep(wait)
+
+    def report_throttled(self, provider: str, retry_after: Optional[float] = None) -> None:
+        """Record a 429 from provider and slow its bucket down."""
+        bucket = self.bucket(provider)
+        bucket.penalize(retry_after)
+        logger.warning(f"Rate limited by {provider}, slowing to {bucket.rate:.3f} req/s")
+
+    def report_success(self, provider: str) -> None:
+        self.bucket(provider).recover()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider limiter statistics."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {name: bucket.stats() for name, bucket in sorted(buckets.items())}
+
+    def reset(self) -> None:
+        """Drop all buckets (used by tests)."""
+        with self._lock:
+            self._buckets.clear()
+
+
+rate_limiter = RateLimiter()
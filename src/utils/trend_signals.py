@@ -0,0 +1,138 @@
+"""Vectorized trend signals over a keywords x periods interest matrix."""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+# Series shorter than this have no meaningful prior/recent split (matches calculate_momentum)
+MIN_MOMENTUM_PERIODS = 6
+BREAKOUT_RISING_VALUE = 5000
+SIGNAL_DECIMALS = 4
+
+
+def round_exact(values: np.ndarray, ndigits: int = SIGNAL_DECIMALS) -> np.ndarray:
+    """Round like Python's built-in ``round`` (np.round can differ on near-half ties)."""
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0 ** ndigits
+    tie_distance = np.abs(scaled - np.floor(scaled) - 0.5)
+    suspect = np.isfinite(scaled) & (tie_distance < 1e-6)
+    if suspect.any():
+        rounded[suspect] = [round(v, ndigits) for v in values[suspect].tolist()]
+    return rounded
+
+
+def _exact_dtype(matrix: np.ndarray) -> np.ndarray:
+    """Integer-valued matrices (all Trends data) are summed as int64 so sums are exact."""
+    if (
+        matrix.dtype.kind == "f"
+        and matrix.size
+        and np.isfinite(matrix).all()
+        and (matrix == np.floor(matrix)).all()
+        and np.abs(matrix).max() < 2 ** 53
+    ):
+        return matrix.astype(np.int64)
+    return matrix
+
+
+def _row_sums(matrix: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Left-to-right row sums of matrix[:, start:stop], matching Python's sum() order."""
+    if stop <= start:
+        return np.zeros(matrix.shape[0], dtype=np.float64)
+    return np.cumsum(matrix[:, start:stop], axis=1)[:, -1].astype(np.float64)
+
+
+def momentum_batch(matrix: np.ndarray) -> np.ndarray:
+    """(recent_avg - prior_avg) / prior_avg per row, clamped to [-1, 1] and rounded to 4 places."""
+    matrix = _exact_dtype(np.asarray(matrix))
+    n_rows, n_periods = matrix.shape
+    if n_periods < MIN_MOMENTUM_PERIODS:
+        return np.zeros(n_rows, dtype=np.float64)
+    midpoint = n_periods // 2
+    prior_avg = _row_sums(matrix, 0, midpoint) / midpoint
+    recent_avg = _row_sums(matrix, midpoint, n_periods) / (n_periods - midpoint)
+
+    zero_prior = prior_avg == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        momentum = (recent_avg - prior_avg) / np.where(zero_prior, 1.0, prior_avg)
+    momentum = round_exact(np.clip(momentum, -1.0, 1.0))
+    return np.where(zero_prior, np.where(recent_avg > 0, 1.0, 0.0), momentum)
+
+
+def slope_batch(matrix: np.ndarray) -> np.ndarray:
+    """Least-squares slope of interest per period for each row, rounded to 4 places."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    n_rows, n_periods = matrix.shape
+    if n_periods < 2:
+        return np.zeros(n_rows, dtype=np.float64)
+    x = np.arange(n_periods, dtype=np.float64)
+    x -= x.mean()
+    slope = (matrix * x).sum(axis=1) / (x * x).sum()
+    return round_exact(slope)
+
+
+def volatility_batch(matrix: np.ndarray) -> np.ndarray:
+    """Coefficient of variation (population std / mean) per row, rounded to 4 places; 0 for all-zero rows."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    n_rows, n_periods = matrix.shape
+    if n_periods < 2:
+        return np.zeros(n_rows, dtype=np.float64)
+    mean = matrix.mean(axis=1)
+    std = matrix.std(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volatility = np.where(mean > 0, std / np.where(mean > 0, mean, 1.0), 0.0)
+    return round_exact(volatility)
+
+
+def has_rising_breakout(related_queries: Optional[Dict]) -> bool:
+    """True if any rising related query is flagged "Breakout" or grew >= 5000%."""
+    if not related_queries:
+        return False
+    for q in related_queries.get("rising", []):
+        val = q.get("value", 0)
+        if isinstance(val, str) and "Breakout" in val:
+            return True
+        if isinstance(val, (int, float)) and val >= BREAKOUT_RISING_VALUE:
+            return True
+    return False
+
+
+def score_matrix(
+    matrix: np.ndarray, related_queries: Optional[Sequence[Optional[Dict]]] = None
+) -> Dict[str, np.ndarray]:
+    """Momentum, breakout, slope and volatility for every row of a keywords x periods matrix."""
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D keywords x periods matrix, got shape {matrix.shape}")
+    momentum = momentum_batch(matrix)
+    breakout = momentum > 1.0
+    if related_queries is not None:
+        if len(related_queries) != matrix.shape[0]:
+            raise ValueError("related_queries must have one entry per matrix row")
+        breakout |= np.fromiter((has_rising_breakout(rq) for rq in related_queries), dtype=bool, count=len(related_queries))
+    return {
+        "momentum": momentum,
+        "breakout": breakout,
+        "slope": slope_batch(matrix),
+        "volatility": volatility_batch(matrix),
+    }
+
+
+def score_series(
+    series: Mapping[str, Sequence[float]], related_queries: Optional[Mapping[str, Dict]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Score named series of possibly different lengths; rows of equal length share one matrix pass."""
+    by_length: Dict[int, List[str]] = {}
+    for name, values in series.items():
+        if values:
+            by_length.setdefault(len(values), []).append(name)
+
+    scores: Dict[str, Dict[str, Any]] = {}
+    for names in by_length.values():
+        matrix = np.array([series[name] for name in names])
+        related = [related_queries.get(name) for name in names] if related_queries else None
+        signals = score_matrix(matrix, related)
+        columns = {key: values.tolist() for key, values in signals.items()}
+        for i, name in enumerate(names):
+            scores[name] = {key: column[i] for key, column in columns.items()}
+    return scores
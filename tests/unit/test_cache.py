@@ -0,0 +1,210 @@
+"""Unit tests for the API response cache."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def cache():
+    from storage.cache import CacheManager
+    from storage.database import init_database
+
+    _, session_factory = init_database("sqlite://")
+    return CacheManager(session_factory, run_id="run1", config_hash="abc123")
+
+
+def test_cache_key_normalizes_query_and_params():
+    from storage.cache import CacheManager
+    assert CacheManager.cache_key("  Executive   Leadership ") == "executive leadership"
+    assert CacheManager.cache_key("x", {"b": 1, "a": 2}) == CacheManager.cache_key("X", {"a": 2, "b": 1})
+    assert CacheManager.cache_key("x", {"num": 20}) != CacheManager.cache_key("x", {"num": 50})
+
+
+def test_lookup_read_through(cache):
+    assert cache.lookup("serpapi", "Leadership", {"num": 20}) is None
+    cache.store("serpapi", "leadership", {"ok": True}, {"num": 20})
+    assert cache.lookup("serpapi", "LEADERSHIP", {"num": 20}) == {"ok": True}
+    assert cache.lookup("serpapi", "leadership", {"num": 20}, force_refresh=True) is None
+    stats = cache.stats()
+    assert stats["hits"] == {"serpapi": 1}
+    assert stats["misses"] == {"serpapi": 2}
+    assert (stats["hit_total"], stats["miss_total"]) == (1, 2)
+
+
+def test_get_many_and_put_many(cache):
+    cache.put_many("run1", "abc123", "serpapi", {"a": {"v": 1}, "b": {"v": 2}})
+    cache.memory.clear()
+    assert cache.get_many("serpapi", ["a", "b", "c"], "abc123") == {"a": {"v": 1}, "b": {"v": 2}}
+    assert len(cache.memory) == 2
+
+
+def test_newest_entry_wins(cache):
+    cache.store_response("run1", "abc123", "serpapi", "a", {"v": 1})
+    cache.store_response("run2", "abc123", "serpapi", "a", {"v": 2})
+    assert cache.get_cached_response("serpapi", "a", "abc123") == {"v": 2}
+    cache.memory.clear()
+    assert cache.get_cached_response("serpapi", "a", "abc123") == {"v": 2}
+    assert cache.get_many("serpapi", ["a", "b"], "abc123") == {"a": {"v": 2}}
+    assert cache.is_cache_hit("serpapi", "a", "abc123")
+    assert not cache.is_cache_hit("serpapi", "b", "abc123")
+
+
+def test_get_many_reads_only_newest_rows(cache):
+    for run in range(3):
+        cache.put_many(f"run{run}", "abc123", "serpapi", {"a": {"v": run}, "b": {"v": -run}})
+    cache.put_many("run9", "other", "serpapi", {"a": {"v": 99}})
+    cache.memory.clear()
+    assert cache.get_many("serpapi", ["a", "b"], "abc123") == {"a": {"v": 2}, "b": {"v": -2}}
+
+
+def test_lookup_counters_are_thread_safe(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from storage.cache import CacheManager
+    from storage.database import init_database
+
+    _, session_factory = init_database(f"sqlite:///{tmp_path / 'cache.db'}")
+    cache = CacheManager(session_factory)
+    cache.store("serpapi", "leadership", {"ok": True})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: cache.lookup("serpapi", "leadership" if i % 2 else "missing"), range(400)))
+    stats = cache.stats()
+    assert (stats["hit_total"], stats["miss_total"]) == (200, 200)
+
+
+def test_memory_tier_serves_without_database(cache):
+    cache.store("serpapi", "leadership", {"ok": True})
+    cache.session_factory = None  # any SQLite access would now fail
+    assert cache.lookup("serpapi", "leadership") == {"ok": True}
+
+
+def test_memory_lru_evicts_oldest():
+    from datetime import datetime
+
+    from storage.cache import MemoryLRU
+    lru = MemoryLRU(max_entries=2)
+    now = datetime.utcnow()
+    lru.put(("s", "a", "h"), now, {"v": "a"})
+    lru.put(("s", "b", "h"), now, {"v": "b"})
+    lru.get(("s", "a", "h"))
+    lru.put(("s", "c", "h"), now, {"v": "c"})
+    assert lru.get(("s", "b", "h")) is None
+    assert lru.get(("s", "a", "h")) is not None
+
+
+def test_lookup_respects_ttl_and_config_hash(cache):
+    cache.store("trends", "leadership", {"ok": True})
+    cache.ttls["trends"] = 0
+    assert cache.lookup("trends", "leadership") is None
+    cache.ttls["trends"] = 3600
+    assert cache.lookup("trends", "leadership") == {"ok": True}
+    cache.config_hash = "other"
+    assert cache.lookup("trends", "leadership") is None
+
+
+def test_serpapi_client_reads_through_cache(cache, monkeypatch):
+    from integrations.serpapi_client import SerpApiClient
+
+    monkeypatch.setattr("integrations.serpapi_client.settings.no_network_mode", False)
+    calls = []
+
+    async def fake_fetch(request_params):
+        calls.append(request_params)
+        return {"related_searches": [{"query": "leadership training"}]}
+
+    def make_client():
+        client = SerpApiClient(api_key="test-key", cache=cache)
+        client.enabled = True
+        client._fetch = fake_fetch
+        return client
+
+    assert asyncio.run(make_client().get_related_searches("leadership")) == ["leadership training"]
+    # A fresh client (new process) is served from storage
+    assert asyncio.run(make_client().get_related_searches("leadership")) == ["leadership training"]
+    assert len(calls) == 1
+    asyncio.run(make_client().search("leadership", force_refresh=True))
+    assert len(calls) == 2
+
+
+def test_identical_payloads_are_stored_once(cache):
+    from storage.database import RawApiPayload, RawApiResponse
+
+    payload = {"organic_results": [{"title": "Leadership"}] * 50}
+    cache.store_response("run1", "abc123", "serpapi", "a", payload)
+    cache.store_response("run2", "abc123", "serpapi", "a", dict(payload))
+    cache.put_many("run3", "abc123", "serpapi", {"b": payload, "c": {"other": True}})
+
+    session = cache.session_factory()
+    try:
+        assert session.query(RawApiResponse).count() == 4
+        blobs = session.query(RawApiPayload).all()
+        assert len(blobs) == 2
+        assert all(len(b.compressed) < b.size_bytes for b in blobs if b.size_bytes > 100)
+    finally:
+        session.close()
+
+    cache.memory.clear()
+    assert cache.get_many("serpapi", ["a", "b"], "abc123") == {"a": payload, "b": payload}
+
+
+def test_legacy_inline_rows_are_readable(cache):
+    from storage.database import RawApiResponse
+
+    session = cache.session_factory()
+    session.add(RawApiResponse(
+        run_id="old", config_hash="abc123", source="serpapi", query="legacy", response_json={"v": 1},
+    ))
+    session.commit()
+    session.close()
+    assert cache.get_cached_response("serpapi", "legacy", "abc123") == {"v": 1}
+
+
+def test_init_database_upgrades_existing_file(tmp_path):
+    import sqlite3
+
+    from sqlalchemy import inspect
+
+    from storage.database import init_database
+
+    db_file = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "CREATE TABLE raw_api_responses (id INTEGER PRIMARY KEY, run_id VARCHAR(64) NOT NULL, "
+        "config_hash VARCHAR(64) NOT NULL, source VARCHAR(50) NOT NULL, query VARCHAR(500) NOT NULL, "
+        "response_json JSON NOT NULL, created_at DATETIME)"
+    )
+    conn.commit()
+    conn.close()
+
+    engine, session_factory = init_database(f"sqlite:///{db_file}")
+    inspector = inspect(engine)
+    assert "payload_digest" in {c["name"] for c in inspector.get_columns("raw_api_responses")}
+    assert "ix_raw_api_responses_lookup" in {i["name"] for i in inspector.get_indexes("raw_api_responses")}
+
+    from storage.cache import CacheManager
+    cache = CacheManager(session_factory, config_hash="h")
+    cache.store("serpapi", "q", {"ok": True})
+    cache.memory.clear()
+    assert cache.lookup("serpapi", "q") == {"ok": True}
+
+
+def test_production_storage_profile_applies_pragmas(tmp_path):
+    from sqlalchemy import text
+
+    from storage.database import init_database
+
+    engine, _ = init_database(f"sqlite:///{tmp_path / 'tuned.db'}", profile="production")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar().lower() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 15000
+    assert engine.pool.size() == 10
+    engine.dispose()
+
+
+def test_unknown_storage_profile_rejected():
+    from storage.database import init_database
+
+    with pytest.raises(ValueError):
+        init_database("sqlite://", profile="turbo")
@@ -0,0 +1,64 @@
+"""Unit tests for the Competitive Scraper agent."""
+
+import asyncio
+
+
+def test_scrape_page_retries_after_429_on_pooled_client(monkeypatch):
+    import httpx
+
+    from agents.competitive_scraper import CompetitiveScraperAgent
+    from utils.rate_limiter import rate_limiter
+
+    monkeypatch.setattr("agents.competitive_scraper.settings.max_retries", 3)
+    monkeypatch.setattr("utils.rate_limiter.settings.competitor_rate_limit", 1000.0)
+    rate_limiter.reset()
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, html="<html><title>Executive Leadership Insights</title><body>one two three</body></html>"),
+    ]
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["User-Agent"])
+        return responses.pop(0)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            agent = CompetitiveScraperAgent(http_client=http_client)
+            page = await agent._scrape_page("https://example.org/leadership")
+            await agent.aclose()
+            # An injected client is left open for its owner
+            assert not http_client.is_closed
+            return page
+
+    page = asyncio.run(run())
+    assert page.topic == "Leadership"
+    assert len(seen) == 2
+    stats = rate_limiter.stats()["competitor:example.org"]
+    assert (stats["acquired"], stats["throttled"]) == (2, 1)
+    rate_limiter.reset()
+
+
+def test_get_returns_last_429_when_retries_run_out(monkeypatch):
+    import httpx
+
+    from agents.competitive_scraper import CompetitiveScraperAgent
+    from utils.rate_limiter import rate_limiter
+
+    monkeypatch.setattr("agents.competitive_scraper.settings.max_retries", 2)
+    monkeypatch.setattr("utils.rate_limiter.settings.competitor_rate_limit", 1000.0)
+    rate_limiter.reset()
+
+    async def run():
+        transport = httpx.MockTransport(lambda _request: httpx.Response(429, headers={"Retry-After": "0"}))
+        agent = CompetitiveScraperAgent()
+        agent._http = httpx.AsyncClient(transport=transport)
+        resp = await agent._get("https://example.org/")
+        await agent.aclose()
+        return resp, agent
+
+    resp, agent = asyncio.run(run())
+    assert resp.status_code == 429
+    assert agent._http is None
+    assert rate_limiter.stats()["competitor:example.org"]["throttled"] == 2
+    rate_limiter.reset()
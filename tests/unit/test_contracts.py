@@ -81,3 +81,16 @@ def test_report_output():
     from contracts.report_generator import ReportOutput
     out = ReportOutput(content="# Report", format="markdown")
     assert out.path is None
+
+
+def test_competitive_scraper_hands_off_typed_output():
+    import asyncio
+
+    from agents.competitive_scraper import CompetitiveScraperAgent
+    from contracts.competitive_scraper import CompetitiveScrapeOutput
+    agent = CompetitiveScraperAgent()
+    agent.enabled = True
+    result = asyncio.run(agent.process())
+    assert isinstance(result.output, CompetitiveScrapeOutput)
+    assert result.data["competitors"] == [c.model_dump() for c in result.output.competitors]
+    assert set(result.output.pages) == {c.domain for c in result.output.competitors}
@@ -0,0 +1,164 @@
+"""Unit tests for the Google Trends client."""
+
+import asyncio
+import threading
+import time
+
+
+def _blocking_client(monkeypatch, delay):
+    """Trends client whose pytrends fetch blocks for `delay` seconds per batch."""
+    from core.config import settings
+    from integrations.google_trends_client import GoogleTrendsClient
+
+    monkeypatch.setattr(settings, "no_network_mode", False)
+    monkeypatch.setattr(settings, "trends_max_workers", 3)
+    client = GoogleTrendsClient()
+    client.enabled = True
+    client.instances = {}
+    client.active = 0
+    client.max_active = 0
+    lock = threading.Lock()
+
+    def get_pytrends():
+        # One fake TrendReq per worker thread
+        return client.instances.setdefault(threading.get_ident(), object())
+
+    def fetch_batch(_pt, batch, _timeframe):
+        with lock:
+            client.active += 1
+            client.max_active = max(client.max_active, client.active)
+        time.sleep(delay)
+        with lock:
+            client.active -= 1
+        return {kw: [10, 10, 10, 20, 20, 20] for kw in batch}
+
+    client._get_pytrends = get_pytrends
+    client._fetch_interest_batch = fetch_batch
+    return client
+
+
+def test_async_interest_fetches_batches_in_parallel(monkeypatch):
+    client = _blocking_client(monkeypatch, delay=0.05)
+    keywords = [f"kw {i}" for i in range(15)]
+    try:
+        result = asyncio.run(client.get_interest_over_time_async(keywords))
+    finally:
+        client.close()
+    assert set(result["interest_over_time"]) == set(keywords)
+    assert client.max_active == 3
+    assert len(client.instances) == 3
+
+
+def test_async_interest_does_not_block_event_loop(monkeypatch):
+    client = _blocking_client(monkeypatch, delay=0.1)
+
+    async def scenario():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        await client.get_interest_over_time_async(["a", "b"])
+        beat.cancel()
+        return ticks
+
+    try:
+        assert asyncio.run(scenario()) >= 5
+    finally:
+        client.close()
+
+
+def test_score_batch_matches_scalar_functions():
+    import numpy as np
+
+    from integrations.google_trends_client import GoogleTrendsClient
+
+    client = GoogleTrendsClient()
+    rng = np.random.default_rng(7)
+    for periods in (4, 6, 7, 12):
+        matrix = rng.integers(0, 101, size=(500, periods))
+        matrix[:20, : periods // 2] = 0  # zero prior average
+        related = [{"rising": [{"value": "Breakout"}]} if i % 50 == 0 else None for i in range(500)]
+        scores = client.score_batch(matrix, related)
+        rows = matrix.tolist()
+        assert scores["momentum"].tolist() == [client.calculate_momentum(r) for r in rows]
+        assert scores["breakout"].tolist() == [client.detect_breakout(r, rq) for r, rq in zip(rows, related, strict=True)]
+        assert scores["slope"].tolist() == [client.calculate_slope(r) for r in rows]
+        assert scores["volatility"].tolist() == [client.calculate_volatility(r) for r in rows]
+
+
+def test_round_exact_matches_builtin_round():
+    import numpy as np
+
+    from utils.trend_signals import round_exact
+
+    values = np.array([0.00005, 0.00015, 0.12345, -0.12345, 0.99995, 2.675, 1.00005])
+    assert round_exact(values).tolist() == [round(v, 4) for v in values.tolist()]
+
+
+def test_region_batch_fills_payloads_and_caches_per_resolution(monkeypatch, tmp_path):
+    from core.config import settings
+    from integrations.google_trends_client import GoogleTrendsClient
+    from storage.cache import CacheManager
+    from storage.database import init_database
+
+    monkeypatch.setattr(settings, "no_network_mode", False)
+    # File database: worker threads would each get their own empty in-memory one
+    _, session_factory = init_database(f"sqlite:///{tmp_path / 'regions.db'}")
+    client = GoogleTrendsClient(cache=CacheManager(session_factory))
+    client.enabled = True
+    client._get_pytrends = lambda: object()
+    calls = []
+
+    def fetch_regions(_pt, batch, resolution, _timeframe):
+        calls.append((tuple(batch), resolution))
+        # Only even-numbered keywords are reported in Canada
+        return {
+            kw: {"United States": 100, **({"Canada": int(kw.split()[-1])} if int(kw.split()[-1]) % 2 == 0 else {})}
+            for kw in batch
+        }
+
+    client._fetch_region_batch = fetch_regions
+    keywords = [f"kw {i}" for i in range(12)]
+
+    regions = asyncio.run(client.get_interest_by_region_batch_async(keywords))
+    client.close()
+    assert sorted(len(batch) for batch, _ in calls) == [2, 5, 5]
+    assert regions["keywords"] == keywords
+    assert regions["regions"] == ["Canada", "United States"]
+    assert regions["matrix"][2] == [2, 100]
+    assert regions["matrix"][3] == [0, 100]
+
+    calls.clear()
+    assert client.get_interest_by_region_batch(keywords) == regions
+    assert calls == []
+    client.get_interest_by_region_batch(keywords[:5], resolution="REGION")
+    assert calls == [(tuple(keywords[:5]), "REGION")]
+
+
+def test_region_rows_do_not_depend_on_batch_partners(monkeypatch):
+    from core.config import settings
+    from integrations.google_trends_client import GoogleTrendsClient
+
+    monkeypatch.setattr(settings, "no_network_mode", False)
+    client = GoogleTrendsClient()
+    client.enabled = True
+    client._get_pytrends = lambda: object()
+    # pytrends scales a payload across its keywords: the strongest keyword's top region is 100
+    payloads = {
+        ("coaching",): {"coaching": {"Canada": 50, "United States": 100}},
+        ("coaching", "leadership"): {
+            "coaching": {"Canada": 10, "United States": 20},
+            "leadership": {"Canada": 40, "United States": 100},
+        },
+    }
+    client._fetch_region_batch = lambda _pt, batch, _resolution, _timeframe: payloads[tuple(batch)]
+
+    regions = client.get_interest_by_region_batch(["coaching", "leadership"])
+    assert regions["matrix"] == [[50, 100], [40, 100]]
+    assert dict(zip(regions["regions"], regions["matrix"][0], strict=True)) == client.get_interest_by_region("coaching")
+    client.close()
@@ -0,0 +1,96 @@
+"""Tests for intent classification."""
+
+
+def test_classify_intent_keeps_pattern_priority():
+    from agents.intent_segmenter import classify_intent
+
+    assert classify_intent("Executive Coaching Program") == "training"
+    assert classify_intent("executive coaching") == "coaching"
+    # A lower-priority match earlier in the term does not win
+    assert classify_intent("future of team building") == "team_building"
+    assert classify_intent("360 feedback for a CEO") == "executive_development"
+    assert classify_intent("leadership podcasts") is None
+
+
+def test_compiled_matcher_matches_per_pattern_search():
+    import re
+
+    from agents.intent_segmenter import INTENT_PATTERNS, classify_intent
+
+    def legacy(term):
+        for name, intent_def in INTENT_PATTERNS.items():
+            if any(re.search(p, term.lower()) for p in intent_def["patterns"]):
+                return name
+        return None
+
+    terms = [
+        "1-on-1 mentoring", "change management certification", "teamwork workshop", "c-suite transformation",
+        "leadership assessments", "strategic thought leadership", "coaches", "class of leaders", "",
+        "Transformational leadership degree", "measuring team leadership", "insightful trends",
+    ]
+    assert [classify_intent(t) for t in terms] == [legacy(t) for t in terms]
+
+
+def test_compile_intent_matcher_without_word_boundaries():
+    from agents.intent_segmenter import compile_intent_matcher
+
+    matcher = compile_intent_matcher({"a": {"patterns": ["lead"]}, "b": {"patterns": [r"\bship"]}})
+    assert [m.lastgroup for m in matcher.finditer("leadership")] == ["a"]
+
+
+def test_intent_weight_matrix_rows_sum_to_one():
+    import numpy as np
+
+    from agents.intent_segmenter import INTENT_PATTERNS, intent_weight_matrix
+
+    weights = intent_weight_matrix(["executive coaching program", "leadership podcasts", "coaching"])
+    assert weights.shape == (3, len(INTENT_PATTERNS))
+    np.testing.assert_allclose(np.asarray(weights.sum(axis=1)).ravel(), [1.0, 0.0, 1.0])
+    intents = list(INTENT_PATTERNS)
+    assert weights[0, intents.index("training")] == weights[0, intents.index("coaching")] == weights[0, intents.index("executive_development")]
+
+
+def test_intent_weight_matrix_records_every_intent_at_a_position():
+    import numpy as np
+
+    from agents.intent_segmenter import intent_weight_matrix
+
+    patterns = {
+        "team_building": {"patterns": [r"\bteam\s+lead"]},
+        "teams": {"patterns": [r"\bteam\b"]},
+        "leadership": {"patterns": [r"\blead"]},
+    }
+    weights = intent_weight_matrix(["team leadership", "team games"], patterns)
+    # "team leadership": team_building and teams both match at position 0, leadership at 5
+    np.testing.assert_allclose(weights.toarray(), [[1 / 3, 1 / 3, 1 / 3], [0.0, 1.0, 0.0]])
+
+
+def test_weighted_scoring_shares_keywords_across_segments():
+    import asyncio
+
+    from agents.intent_segmenter import IntentSegmenterAgent
+    from contracts.intent_segmenter import IntentSegmentInput
+    from models.keywords import Keyword
+
+    keywords = [
+        Keyword(term="executive coaching", trends_momentum=1.0),
+        Keyword(term="leadership coaching", trends_momentum=0.2),
+        Keyword(term="executive presence"),
+        Keyword(term="leadership podcasts", trends_momentum=0.5),
+    ]
+    result = asyncio.run(IntentSegmenterAgent().process(
+        IntentSegmentInput(keywords=keywords, scoring="weighted", generate_personas=False)
+    ))
+    segments = {s.query_intents[0]: s for s in result.output.segments}
+    assert segments["coaching"].keywords == ["executive coaching", "leadership coaching"]
+    assert segments["executive_development"].keywords == ["executive coaching", "executive presence"]
+    assert segments["other"].keywords == ["leadership podcasts"]
+    # (0.5 * 1.0 + 1.0 * 0.2) / 1.5
+    assert segments["coaching"].demand_signal == round(0.7 / 1.5, 4)
+    assert result.metadata["multi_intent"] == 1
+    assert result.metadata["overlap"] == {
+        "coaching": {"executive_development": 1},
+        "executive_development": {"coaching": 1},
+    }
+    assert result.output.weights.shape == (4, len(result.metadata["intents"]))
+    assert "weights" not in result.data
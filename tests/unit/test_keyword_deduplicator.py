@@ -0,0 +1,78 @@
+"""Unit tests for near-duplicate keyword dedup."""
+
+import asyncio
+
+
+def _dedup(keywords, **kwargs):
+    from agents.keyword_deduplicator import KeywordDeduplicatorAgent
+    from contracts.keyword_deduplicator import KeywordDedupInput
+
+    return asyncio.run(KeywordDeduplicatorAgent().process(KeywordDedupInput(keywords=keywords, **kwargs)))
+
+
+def test_canonical_form_ignores_order_case_plurals_and_punctuation():
+    from pipeline.near_duplicates import canonical_form
+
+    assert canonical_form("Leadership Trainings") == "leadership training"
+    assert canonical_form("training, leadership") == "leadership training"
+    assert canonical_form("executive coaches") == "coach executive"
+    assert canonical_form("the") == "the"
+
+
+def test_question_and_modifier_keywords_stay_separate():
+    from models.keywords import Keyword
+
+    pairs = [
+        ("what is leadership", "leadership"),
+        ("how to improve leadership", "improve leadership"),
+        ("leadership without authority", "leadership authority"),
+        ("why leadership training fails", "leadership training fails"),
+        ("not a leader", "leader"),
+    ]
+    for question, bare in pairs:
+        result = _dedup([Keyword(term=question), Keyword(term=bare)])
+        assert [kw["term"] for kw in result.data["keywords"]] == [question, bare]
+
+
+def test_minhash_estimates_jaccard_and_groups_near_duplicates():
+    from pipeline.near_duplicates import MinHashLSH, group_near_duplicates
+
+    lsh = MinHashLSH(num_perm=128, bands=32, threshold=0.8)
+    signatures = lsh.signatures(["leadership training", "leadership training", "quarterly tax filing"])
+    assert (signatures[0] == signatures[1]).all()
+    assert (signatures[0] == signatures[2]).mean() < 0.2
+
+    terms = ["leadership training", "team building", "leadership trainning", "training leadership", "team buildings"]
+    assert group_near_duplicates(terms, lsh) == [[0, 2, 3], [1, 4]]
+
+
+def test_dedup_merges_group_data_and_keeps_mapping():
+    from models.keywords import Keyword
+
+    keywords = [
+        Keyword(term="leadership trainings", volume=90, people_also_ask=["what is leadership training?"],
+                related_queries=["leadership training"], trends_interest=40, trends_momentum=0.1),
+        Keyword(term="leadership training", volume=900, related_queries=["leadership courses"],
+                serp_features=["video"]),
+        Keyword(term="Training, Leadership", people_also_ask=["how long is leadership training?"],
+                trends_interest=75, trends_momentum=0.6, related_queries=["leadership courses", "team training"]),
+        Keyword(term="executive coaching", volume=300),
+    ]
+    result = _dedup(keywords)
+
+    canonical = {kw["term"]: kw for kw in result.data["keywords"]}
+    assert set(canonical) == {"leadership training", "executive coaching"}
+    merged = canonical["leadership training"]
+    assert merged["volume"] == 900
+    assert merged["related_queries"] == ["leadership courses", "team training"]
+    assert merged["people_also_ask"] == ["what is leadership training?", "how long is leadership training?"]
+    assert merged["serp_features"] == ["video"]
+    assert (merged["trends_interest"], merged["trends_momentum"]) == (75, 0.6)
+    assert result.data["mapping"] == {
+        "leadership trainings": "leadership training",
+        "leadership training": "leadership training",
+        "Training, Leadership": "leadership training",
+        "executive coaching": "executive coaching",
+    }
+    assert set(result.data["groups"]) == {"leadership training"}
+    assert result.metadata["merged"] == 2
@@ -0,0 +1,96 @@
+"""Unit tests for the columnar KeywordFrame."""
+
+import asyncio
+import random
+
+
+def _keywords(n, seed=0):
+    from models.keywords import Keyword
+
+    rng = random.Random(seed)
+    heads = ["leadership training", "executive coaching", "team building", "leadership course"]
+    return [
+        Keyword(
+            term=f"{rng.choice(heads)} {i}",
+            volume=rng.choice([None, 0, rng.randint(1, 20000)]),
+            cpc=rng.choice([None, round(rng.uniform(0, 60), 2)]),
+            competition=rng.choice([None, round(rng.random(), 3)]),
+            trends_interest=rng.choice([None, rng.randint(0, 100)]),
+            trends_momentum=rng.choice([None, round(rng.uniform(-1, 2), 4)]),
+            people_also_ask=[f"q{j}" for j in range(rng.randint(0, 12))],
+            serp_features=["video"] * rng.randint(0, 7),
+        )
+        for i in range(n)
+    ]
+
+
+def test_round_trip_keeps_objects_and_columns():
+    import numpy as np
+
+    from models.keyword_frame import KeywordFrame
+
+    keywords = _keywords(50)
+    frame = KeywordFrame.from_keywords(keywords)
+    assert len(frame) == 50
+    assert all(a is b for a, b in zip(frame.to_keywords(), keywords, strict=True))
+    assert np.isnan(frame.volume[[kw.volume is None for kw in keywords]]).all()
+    assert frame.paa_count.tolist() == [len(kw.people_also_ask) for kw in keywords]
+
+    bare = KeywordFrame(frame.terms, volume=frame.volume, momentum=frame.momentum, interest=frame.interest)
+    rebuilt = bare.to_keywords()
+    assert [kw.volume for kw in rebuilt] == [kw.volume for kw in keywords]
+    assert [kw.trends_momentum for kw in rebuilt] == [kw.trends_momentum for kw in keywords]
+    assert frame.take([3, 1]).terms == [keywords[3].term, keywords[1].term]
+
+
+def test_contracts_accept_frames_and_reject_empty_input():
+    import pytest
+    from pydantic import ValidationError
+
+    from contracts.intent_segmenter import IntentSegmentInput
+    from contracts.topic_clusterer import TopicClusterInput
+    from models.keyword_frame import KeywordFrame
+
+    frame = KeywordFrame.from_keywords(_keywords(5))
+    assert TopicClusterInput(keywords=frame).keywords is frame
+    assert len(IntentSegmentInput(keywords=[{"term": "leadership coaching"}]).keywords) == 1
+    with pytest.raises(ValidationError):
+        TopicClusterInput(keywords=KeywordFrame([]))
+    with pytest.raises(ValidationError):
+        IntentSegmentInput(keywords=[])
+
+
+def test_agents_give_identical_results_for_lists_and_frames():
+    from agents.intent_segmenter import IntentSegmenterAgent
+    from agents.report_generator import ReportGeneratorAgent
+    from agents.topic_clusterer import TopicClustererAgent
+    from contracts.intent_segmenter import IntentSegmentInput
+    from contracts.topic_clusterer import TopicClusterInput
+    from models.keyword_frame import KeywordFrame
+
+    keywords = _keywords(300, seed=1)
+    frame = KeywordFrame.from_keywords(keywords)
+
+    def demand_signal(kw):
+        return round(
+            max(min(kw.trends_momentum or 0, 1.0), 0.0) * 0.30
+            + min(len(kw.serp_features) / 6, 1.0) * 0.30
+            + min(len(kw.people_also_ask) / 10, 1.0) * 0.20
+            + min((kw.volume or 0) / 10000, 1.0) * 0.20,
+            4,
+        )
+
+    assert ReportGeneratorAgent._demand_signals(frame).tolist() == [demand_signal(kw) for kw in keywords]
+
+    segmenter = IntentSegmenterAgent()
+    by_list = asyncio.run(segmenter.process(IntentSegmentInput(keywords=keywords)))
+    by_frame = asyncio.run(segmenter.process(IntentSegmentInput(keywords=frame)))
+    assert by_list.data == by_frame.data
+    for segment in by_frame.data["segments"]:
+        members = [kw for kw in keywords if kw.term in set(segment["keywords"])]
+        assert segment["demand_signal"] == round(sum(kw.trends_momentum or 0 for kw in members) / len(members), 4)
+
+    clusterer = TopicClustererAgent()
+    by_list = asyncio.run(clusterer.process(TopicClusterInput(keywords=keywords, n_clusters_range=(3, 5))))
+    by_frame = asyncio.run(clusterer.process(TopicClusterInput(keywords=frame, n_clusters_range=(3, 5))))
+    assert by_list.data["clusters"] == by_frame.data["clusters"]
@@ -0,0 +1,118 @@
+"""Unit tests for breadth-first keyword graph expansion."""
+
+import asyncio
+
+# term -> related searches; every term has one PAA question
+RELATED = {
+    "leadership": ["Leadership Training", "executive coaching"],
+    "leadership training": ["leadership  training", "team building", "leadership"],
+    "executive coaching": ["coaching certification"],
+    "team building": ["team games"],
+    "coaching certification": ["icf credential"],
+}
+
+
+def _serp_client():
+    from integrations.serpapi_client import SerpApiClient
+
+    class GraphSerpClient(SerpApiClient):
+        def __init__(self):
+            super().__init__()
+            self.searched = []
+
+        async def search(self, query, **_params):
+            self.searched.append(query)
+            await asyncio.sleep(0)
+            return {
+                "related_searches": [{"query": q} for q in RELATED.get(query, [])],
+                "related_questions": [{"question": f"what is {query}?"}],
+            }
+
+    return GraphSerpClient()
+
+
+def _expand(seeds, **kwargs):
+    from pipeline.keyword_graph import KeywordGraphExpander
+
+    client = _serp_client()
+    expander = KeywordGraphExpander(client, **kwargs)
+    return asyncio.run(expander.expand(seeds)), client
+
+
+def test_bfs_depths_and_normalized_dedup():
+    graph, _ = _expand(["Leadership"], max_depth=2, workers=3)
+    assert graph.nodes["leadership"] == 0
+    assert graph.nodes["leadership training"] == 1
+    assert graph.nodes["executive coaching"] == 1
+    assert graph.nodes["team building"] == 2
+    assert graph.nodes["coaching certification"] == 2
+    assert "team games" not in graph.nodes  # depth 3 is beyond max_depth
+    assert graph.nodes["what is leadership?"] == 1
+    # PAA leaves are never expanded; only the seed and its two depth-1 terms are queried
+    assert graph.queries_used == 3
+    edge = next(e for e in graph.edges if e.target == "team building")
+    assert (edge.source, edge.relation, edge.depth) == ("leadership training", "related_search", 2)
+    # Back-edge to an already seen term is recorded without re-enqueueing it
+    assert any(e.source == "leadership training" and e.target == "leadership" for e in graph.edges)
+
+
+def test_budget_truncates_expansion():
+    graph, client = _expand(["leadership"], max_depth=4, max_queries=2, workers=1)
+    assert graph.queries_used == 2
+    assert graph.truncated
+    assert len(client.searched) == 2
+
+
+def test_trends_rising_values_prioritize_frontier():
+    from integrations.google_trends_client import GoogleTrendsClient
+
+    class RisingTrends(GoogleTrendsClient):
+        async def get_related_queries_async(self, keyword, **_kwargs):
+            if keyword != "leadership":
+                return {}
+            return {"rising": [
+                {"query": "slow riser", "value": 150},
+                {"query": "hot topic", "value": "Breakout"},
+                {"query": "warm topic", "value": 900},
+            ]}
+
+    graph, client = _expand(["leadership"], trends_client=RisingTrends(), max_depth=2, workers=1)
+    client.searched.remove("leadership")
+    assert client.searched[:3] == ["hot topic", "warm topic", "slow riser"]
+    assert graph.nodes["hot topic"] == 1
+
+
+def test_researcher_adds_graph_terms():
+    from agents.keyword_researcher import KeywordResearcherAgent
+    from contracts.keyword_researcher import KeywordResearchInput
+
+    agent = KeywordResearcherAgent(serpapi_client=_serp_client())
+    result = asyncio.run(agent.process(
+        KeywordResearchInput(queries=["leadership"], include_trends=False, expand_depth=2)
+    ))
+    terms = {kw["term"] for kw in result.data["keywords"]}
+    assert {"team building", "coaching certification"} <= terms
+    assert result.data["graph"]["nodes"]["team building"] == 2
+    assert result.metadata["graph_queries"] == 3
+
+
+def test_mock_trends_fallback_is_not_expanded():
+    from integrations.google_trends_client import GoogleTrendsClient
+
+    class FailingTrends(GoogleTrendsClient):
+        def __init__(self):
+            super().__init__()
+            self.enabled = True
+
+        def _get_pytrends(self):
+            return object()
+
+        def _fetch_related_queries(self, *_args):
+            raise RuntimeError("429 Too Many Requests")
+
+    trends = FailingTrends()
+    assert trends.get_related_queries("leadership")["mock"] is True
+    graph, _ = _expand(["leadership"], trends_client=trends, max_depth=1, workers=1)
+    trends.close()
+    assert "executive leadership program" not in graph.nodes
+    assert not any(e.relation.startswith("trends_") for e in graph.edges)
@@ -0,0 +1,127 @@
+"""Unit tests for the Keyword Researcher agent."""
+
+import asyncio
+
+
+def _slow_serp_client(delays):
+    """SerpAPI client whose latency varies per query and which tracks concurrency."""
+    from integrations.serpapi_client import SerpApiClient
+
+    class SlowSerpClient(SerpApiClient):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def search(self, query, **_params):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(delays[query])
+            self.in_flight -= 1
+            return {
+                "related_searches": [{"query": f"{query} training"}, {"query": "shared related term"}],
+                "related_questions": [{"question": f"What is {query}?"}],
+            }
+
+    return SlowSerpClient()
+
+
+def _run_research(queries, delays, **kwargs):
+    from agents.keyword_researcher import KeywordResearcherAgent
+    from contracts.keyword_researcher import KeywordResearchInput
+
+    client = _slow_serp_client(delays)
+    agent = KeywordResearcherAgent(serpapi_client=client)
+    input_data = KeywordResearchInput(queries=queries, include_trends=False, **kwargs)
+    return asyncio.run(agent.process(input_data)), client
+
+
+def test_concurrent_research_keeps_first_seen_order():
+    queries = ["alpha", "beta", "gamma"]
+    delays = {"alpha": 0.03, "beta": 0.02, "gamma": 0.01}
+    concurrent, _ = _run_research(queries, delays, max_concurrency=3)
+    sequential, _ = _run_research(queries, delays, max_concurrency=1)
+
+    terms = [kw["term"] for kw in concurrent.data["keywords"]]
+    assert terms == [kw["term"] for kw in sequential.data["keywords"]]
+    assert terms == [
+        "alpha", "alpha training", "shared related term",
+        "beta", "beta training",
+        "gamma", "gamma training",
+    ]
+
+
+def test_concurrent_research_respects_limit():
+    queries = [f"query {i}" for i in range(6)]
+    delays = {q: 0.01 for q in queries}
+    result, client = _run_research(queries, delays, max_concurrency=2)
+    assert client.max_in_flight == 2
+    assert result.metadata["max_concurrency"] == 2
+
+
+def test_research_reports_query_latency():
+    queries = ["alpha", "beta"]
+    result, _ = _run_research(queries, {"alpha": 0.01, "beta": 0.01})
+    latency = result.metadata["query_latency_seconds"]
+    assert set(latency) == set(queries)
+    assert all(v >= 0.01 for v in latency.values())
+
+
+def test_trends_enrichment_batches_terms_off_loop():
+    import threading
+
+    from agents.keyword_researcher import KeywordResearcherAgent
+    from contracts.keyword_researcher import KeywordResearchInput
+    from integrations.google_trends_client import GoogleTrendsClient
+
+    class RecordingTrendsClient(GoogleTrendsClient):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+            self.threads = set()
+
+        def get_interest_over_time(self, keywords, *_args, **_kwargs):
+            self.batches.append(list(keywords))
+            self.threads.add(threading.get_ident())
+            return self._mock_interest(keywords)
+
+    queries = [f"query {i}" for i in range(7)] + ["Query 0"]
+    trends = RecordingTrendsClient()
+    agent = KeywordResearcherAgent(
+        serpapi_client=_slow_serp_client({q: 0 for q in queries}), trends_client=trends
+    )
+    result = asyncio.run(agent.process(KeywordResearchInput(queries=queries)))
+    trends.close()
+
+    # 7 seeds, 7 related "query i training" terms and one shared related term
+    assert sorted(len(b) for b in trends.batches) == [5, 5, 5]
+    assert threading.get_ident() not in trends.threads
+    enriched = {kw["term"]: kw["trends_momentum"] for kw in result.data["keywords"] if kw["trends_interest"]}
+    assert set(enriched) == {kw["term"] for kw in result.data["keywords"]}
+    assert "shared related term" in enriched and "query 3 training" in enriched
+
+
+def test_trends_interest_does_not_depend_on_batch_partners():
+    from agents.keyword_researcher import KeywordResearcherAgent
+    from integrations.google_trends_client import GoogleTrendsClient
+    from models.keywords import Keyword
+
+    class PartnerScaledTrendsClient(GoogleTrendsClient):
+        async def get_interest_over_time_async(self, keywords, **_kwargs):
+            # Same shape per keyword; "popular term" squeezes the rest of its batch to a quarter
+            shape = [40, 60, 100, 80, 60, 80]
+            interest = {kw: list(shape) for kw in keywords}
+            for i in range(0, len(keywords), 5):
+                batch = keywords[i : i + 5]
+                if "popular term" in batch:
+                    for kw in batch:
+                        if kw != "popular term":
+                            interest[kw] = [v // 4 for v in shape]
+            return {"interest_over_time": interest}
+
+    terms = ["popular term", "alpha", "beta", "gamma", "delta", "epsilon"]
+    keywords = [Keyword(term=term) for term in terms]
+    agent = KeywordResearcherAgent(trends_client=PartnerScaledTrendsClient())
+    asyncio.run(agent._enrich_with_trends(keywords))
+
+    # "alpha" shared a batch with "popular term", "epsilon" did not
+    assert {kw.trends_interest for kw in keywords} == {80}
+    assert {kw.trends_momentum for kw in keywords} == {0.1}
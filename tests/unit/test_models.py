@@ -152,3 +152,19 @@ def test_keyword_serialization():
     kw2 = Keyword(**data)
     assert kw2.term == kw.term
     assert kw2.volume == kw.volume
+
+
+def test_agent_response_carries_typed_output_without_serializing_it():
+    import asyncio
+
+    from agents.intent_segmenter import IntentSegmenterAgent
+    from contracts.intent_segmenter import IntentSegmentInput, IntentSegmentOutput
+    from models.keywords import Keyword
+
+    result = asyncio.run(IntentSegmenterAgent().process(
+        IntentSegmentInput(keywords=[Keyword(term="leadership coaching"), Keyword(term="ceo training")])
+    ))
+    assert isinstance(result.output, IntentSegmentOutput)
+    assert result.output.segments[0].keywords == result.data["segments"][0]["keywords"]
+    assert "output" not in result.model_dump()
+    assert "output" not in result.model_dump_json()
@@ -0,0 +1,45 @@
+"""Unit tests for per-run bulk persistence."""
+
+import pytest
+
+
+@pytest.fixture
+def run_store():
+    from storage.database import init_database
+    from storage.persistence import RunStore
+
+    _, session_factory = init_database("sqlite://")
+    return RunStore(session_factory)
+
+
+def test_save_and_load_run(run_store, sample_keywords):
+    from models.competitors import CompetitorContent
+    from models.keywords import KeywordCluster, SearchIntent
+
+    clusters = [
+        KeywordCluster(cluster_id=0, label="Coaching", keywords=sample_keywords[:2], size=2,
+                       avg_demand_signal=0.2, top_intent=SearchIntent.COMMERCIAL),
+    ]
+    crawls = {"hbr.org": [CompetitorContent(url="https://hbr.org/a", title="A", topic="Leadership", word_count=10)]}
+
+    counts = run_store.save_run("run1", keywords=sample_keywords, clusters=clusters, crawls=crawls)
+    assert counts == {"keywords": 5, "clusters": 1, "crawls": 1}
+    run_store.save_run("run2", keywords=sample_keywords[:1])
+
+    stored = run_store.load_run("run1")
+    assert [k["term"] for k in stored["keywords"]] == [kw.term for kw in sample_keywords]
+    assert stored["keywords"][0]["search_intent"] == "informational"
+    assert stored["clusters"][0]["top_intent"] == "commercial"
+    assert stored["crawls"][0]["domain"] == "hbr.org"
+    assert len(run_store.load_run("run2")["keywords"]) == 1
+
+
+def test_save_run_is_atomic(run_store, sample_keywords):
+    from sqlalchemy.exc import IntegrityError
+
+    from models.competitors import CompetitorContent
+
+    bad_crawls = {"hbr.org": [CompetitorContent.model_construct(url=None, title="x", topic=None, word_count=1)]}
+    with pytest.raises(IntegrityError):
+        run_store.save_run("run1", keywords=sample_keywords, crawls=bad_crawls)
+    assert run_store.load_run("run1")["keywords"] == []
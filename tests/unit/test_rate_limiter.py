@@ -0,0 +1,59 @@
+"""Unit tests for the shared rate limiter."""
+
+import asyncio
+
+import pytest
+
+
+def test_parse_retry_after_seconds():
+    from utils.rate_limiter import parse_retry_after
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+
+
+def test_parse_retry_after_http_date():
+    from utils.rate_limiter import parse_retry_after
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    from utils.rate_limiter import TokenBucket
+    bucket = TokenBucket("test", rate=10.0, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_bucket_backs_off_and_recovers():
+    from utils.rate_limiter import TokenBucket
+    bucket = TokenBucket("test", rate=10.0, burst=1)
+    bucket.penalize(retry_after=2.0)
+    assert bucket.rate == 5.0
+    assert bucket.throttled == 1
+    # Next caller waits at least the Retry-After period
+    assert bucket.reserve() >= 2.0
+
+    for _ in range(3):
+        bucket.penalize()
+    assert bucket.rate == pytest.approx(1.0)  # floor at 10% of configured rate
+
+    for _ in range(20):
+        bucket.recover()
+    assert bucket.rate == 10.0
+
+
+def test_registry_buckets_per_provider():
+    from utils.rate_limiter import RateLimiter
+    limiter = RateLimiter()
+    asyncio.run(limiter.acquire("serpapi"))
+    limiter.acquire_sync("competitor:hbr.org")
+    limiter.acquire_sync("competitor:ccl.org")
+    limiter.report_throttled("competitor:hbr.org", retry_after=0)
+
+    stats = limiter.stats()
+    assert set(stats) == {"competitor:ccl.org", "competitor:hbr.org", "serpapi"}
+    assert stats["serpapi"]["acquired"] == 1
+    assert stats["competitor:hbr.org"]["throttled"] == 1
+    assert stats["competitor:ccl.org"]["throttled"] == 0
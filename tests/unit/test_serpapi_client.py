@@ -0,0 +1,179 @@
+"""Unit tests for the SerpAPI client."""
+
+import asyncio
+
+
+def _counting_client(monkeypatch, delay=0.01):
+    """Return a network-enabled client whose HTTP fetch is replaced by a counter."""
+    from integrations.serpapi_client import SerpApiClient
+
+    client = SerpApiClient(api_key="test-key")
+    client.enabled = True
+    monkeypatch.setattr("integrations.serpapi_client.settings.no_network_mode", False)
+    calls = []
+
+    async def fake_fetch(request_params):
+        calls.append(request_params)
+        await asyncio.sleep(delay)
+        return {
+            "related_searches": [{"query": "leadership training"}],
+            "related_questions": [{"question": "What is leadership?"}],
+            "organic_results": [{"position": 1}],
+        }
+
+    client._fetch = fake_fetch
+    return client, calls
+
+
+def test_concurrent_identical_searches_share_one_request(monkeypatch):
+    client, calls = _counting_client(monkeypatch)
+
+    async def run():
+        return await asyncio.gather(
+            client.get_related_searches("leadership"),
+            client.get_people_also_ask("leadership"),
+            client.get_serp_features("leadership"),
+        )
+
+    related, paa, features = asyncio.run(run())
+    assert len(calls) == 1
+    assert related == ["leadership training"]
+    assert paa == ["What is leadership?"]
+    assert features["paa_count"] == 1
+
+
+def test_recent_search_is_reused(monkeypatch):
+    client, calls = _counting_client(monkeypatch)
+
+    async def run():
+        await client.search("leadership")
+        await client.search("leadership")
+        await client.search("leadership", num=50)
+
+    asyncio.run(run())
+    # Different params are a different request
+    assert len(calls) == 2
+
+
+def test_expired_search_is_refetched(monkeypatch):
+    client, calls = _counting_client(monkeypatch)
+    client.coalesce_ttl = 0
+
+    async def run():
+        await client.search("leadership")
+        await client.search("leadership")
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_failed_search_is_not_cached(monkeypatch):
+    import contextlib
+
+    client, calls = _counting_client(monkeypatch)
+
+    async def failing_fetch(request_params):
+        calls.append(request_params)
+        raise RuntimeError("boom")
+
+    client._fetch = failing_fetch
+
+    async def run():
+        for _ in range(2):
+            with contextlib.suppress(RuntimeError):
+                await client.search("leadership")
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_http_client_is_pooled_and_closed():
+    from integrations.serpapi_client import SerpApiClient
+
+    async def run():
+        async with SerpApiClient(api_key="test-key") as client:
+            first = client._get_http_client()
+            assert client._get_http_client() is first
+        return client, first
+
+    client, first = asyncio.run(run())
+    assert first.is_closed
+    assert client._http is None
+
+
+def test_injected_http_client_is_not_closed():
+    import httpx
+
+    from integrations.serpapi_client import SerpApiClient
+
+    async def run():
+        shared = httpx.AsyncClient()
+        async with SerpApiClient(api_key="test-key", http_client=shared) as client:
+            assert client._get_http_client() is shared
+        closed = shared.is_closed
+        await shared.aclose()
+        return closed
+
+    assert asyncio.run(run()) is False
+
+
+def test_search_retries_after_429(monkeypatch):
+    import httpx
+
+    from integrations.serpapi_client import SerpApiClient
+    from utils.rate_limiter import rate_limiter
+
+    monkeypatch.setattr("integrations.serpapi_client.settings.no_network_mode", False)
+    rate_limiter.reset()
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"related_searches": [{"query": "leadership training"}]}),
+    ]
+
+    async def run():
+        transport = httpx.MockTransport(lambda _request: responses.pop(0))
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = SerpApiClient(api_key="test-key", http_client=http_client)
+            client.enabled = True
+            return await client.get_related_searches("leadership")
+
+    assert asyncio.run(run()) == ["leadership training"]
+    stats = rate_limiter.stats()["serpapi"]
+    assert stats["acquired"] == 2
+    assert stats["throttled"] == 1
+    rate_limiter.reset()
+
+
+def test_coalesced_callers_get_independent_payloads(monkeypatch):
+    client, calls = _counting_client(monkeypatch)
+
+    async def run():
+        first, second = await asyncio.gather(client.search("leadership"), client.search("leadership"))
+        first["related_searches"].clear()
+        return second, await client.search("leadership")
+
+    second, recent = asyncio.run(run())
+    assert len(calls) == 1
+    assert second["related_searches"] == [{"query": "leadership training"}]
+    assert recent["related_searches"] == [{"query": "leadership training"}]
+
+
+def test_mock_search_does_not_mutate_shared_mock():
+    from integrations.serpapi_client import MOCK_SERP_RESPONSE, SerpApiClient
+
+    client = SerpApiClient()
+    client.enabled = False
+    result = asyncio.run(client.search("team coaching"))
+    assert result["search_parameters"]["q"] == "team coaching"
+    assert MOCK_SERP_RESPONSE["search_parameters"]["q"] == "executive leadership"
+
+
+def test_fetch_without_attempts_raises(monkeypatch):
+    import pytest
+
+    from integrations.serpapi_client import SerpApiClient
+
+    monkeypatch.setattr("integrations.serpapi_client.settings.max_retries", 0)
+    client = SerpApiClient(api_key="test-key")
+    with pytest.raises(RuntimeError):
+        asyncio.run(client._fetch({"q": "leadership"}))
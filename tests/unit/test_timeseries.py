@@ -0,0 +1,128 @@
+"""Unit tests for the Trends time-series store and incremental fetch."""
+
+from datetime import date, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def series_store():
+    from storage.database import init_database
+    from storage.timeseries import TrendSeriesStore
+
+    _, session_factory = init_database("sqlite://")
+    return TrendSeriesStore(session_factory)
+
+
+def _weekly(start, values):
+    return [(start + timedelta(weeks=i)).isoformat() for i in range(len(values))], values
+
+
+def test_upsert_and_load(series_store):
+    from models.keywords import SearchVolumeTimeSeries
+
+    periods, values = _weekly(date(2026, 1, 5), [10, 20, 30])
+    written = series_store.upsert([
+        SearchVolumeTimeSeries(keyword="Executive  Coaching", timestamps=periods, values=values),
+        SearchVolumeTimeSeries(keyword="team leadership", timestamps=periods[1:], values=[5, 6]),
+    ])
+    assert written == 5
+    # Re-storing a period overwrites it
+    series_store.upsert([SearchVolumeTimeSeries(keyword="executive coaching", timestamps=periods[2:], values=[33])])
+
+    loaded = series_store.load(["EXECUTIVE COACHING"])
+    assert loaded["executive coaching"].values == [10, 20, 33]
+    assert loaded["executive coaching"].timestamps[-1].date().isoformat() == periods[2]
+
+    both = series_store.load(["team leadership", "executive coaching", "unknown"], start=date(2026, 1, 12))
+    assert sorted(both) == ["executive coaching", "team leadership"]
+    assert both["executive coaching"].values == [20, 33]
+
+
+def test_timeframe_start_and_resample():
+    from integrations.google_trends_client import resample_to_cadence, timeframe_start
+
+    assert timeframe_start("today 12-m", date(2026, 3, 31)) == date(2025, 3, 28)
+    assert timeframe_start("today 5-y", date(2026, 1, 10)) == date(2021, 1, 10)
+    assert timeframe_start("all") is None
+
+    anchor = date(2026, 1, 4)
+    periods = [(anchor + timedelta(days=i)).isoformat() for i in range(17)]
+    buckets = resample_to_cadence(periods, [7.0] * 7 + [14.0] * 7 + [1.0] * 3, anchor, 7)
+    # The trailing 3-day partial week is dropped
+    assert buckets == [(anchor, 7.0), (anchor + timedelta(days=7), 14.0)]
+
+
+def test_incremental_fetch_requests_only_missing_periods(monkeypatch, series_store):
+    from core.config import settings
+    from integrations.google_trends_client import GoogleTrendsClient
+    from models.keywords import SearchVolumeTimeSeries
+
+    monkeypatch.setattr(settings, "no_network_mode", False)
+    today = date.today()
+    anchor = today - timedelta(days=15)
+    history = [(anchor - timedelta(weeks=i)).isoformat() for i in range(10, -1, -1)]
+    series_store.upsert([SearchVolumeTimeSeries(keyword="coaching", timestamps=history, values=[40] * 11)])
+
+    requests = []
+
+    def fetch_batch(_pt, batch, timeframe):
+        requests.append((tuple(batch), timeframe))
+        if timeframe.startswith("today"):
+            # Trends weeks share one grid across keywords
+            periods = [(anchor + timedelta(weeks=1 - i)).isoformat() for i in range(51, -1, -1)]
+            return {**{kw: [50] * 52 for kw in batch}, "periods": periods}
+        # Daily data for the short window, on a scale where the anchor week reads 80 (stored: 40)
+        days = [(anchor + timedelta(days=i)).isoformat() for i in range((today - anchor).days + 1)]
+        values = [80] * 7 + [100] * 7 + [100] * (len(days) - 14)
+        return {**{kw: values for kw in batch}, "periods": days}
+
+    client = GoogleTrendsClient(series_store=series_store)
+    client.enabled = True
+    client._get_pytrends = lambda: object()
+    client._fetch_interest_batch = fetch_batch
+
+    result = client.get_interest_over_time(["coaching", "new term"])["interest_over_time"]
+
+    assert (("coaching",), f"{anchor.isoformat()} {today.isoformat()}") in requests
+    assert (("new term",), "today 12-m") in requests
+    assert len(requests) == 2
+    # New week is rescaled onto the stored scale: 100 * 40 / 80
+    assert series_store.load(["coaching"])["coaching"].values[-1] == 50
+    assert result["coaching"][-1] == 50
+    assert len(result["new term"]) == len(result["periods"])
+
+    # Stored history is now current: nothing is fetched again
+    requests.clear()
+    client.get_interest_over_time(["coaching"])
+    assert requests == []
+
+
+def test_incremental_result_keeps_each_keywords_own_span(monkeypatch, series_store):
+    from core.config import settings
+    from integrations.google_trends_client import GoogleTrendsClient
+    from models.keywords import SearchVolumeTimeSeries
+    from utils.trend_signals import score_series
+
+    monkeypatch.setattr(settings, "no_network_mode", False)
+    last = date.today() - timedelta(days=3)
+    weeks = [last - timedelta(weeks=i) for i in range(9, -1, -1)]
+    # "shifted" sits on a weekly grid one day earlier and stopped extending two weeks ago
+    shifted = [d - timedelta(days=1) for d in weeks[:-2]]
+    series_store.upsert([
+        SearchVolumeTimeSeries(keyword="coaching", timestamps=weeks, values=list(range(10, 20))),
+        SearchVolumeTimeSeries(keyword="shifted", timestamps=shifted, values=list(range(10, 18))),
+    ])
+
+    client = GoogleTrendsClient(series_store=series_store)
+    client.enabled = True
+    client._get_pytrends = lambda: object()
+    client._extend_batch = lambda *_args: []
+    result = client.get_interest_over_time(["coaching", "shifted"])["interest_over_time"]
+
+    assert result["coaching"] == list(range(10, 20))
+    assert result["shifted"] == list(range(10, 18))
+    assert result["keyword_periods"]["shifted"] == [d.isoformat() for d in shifted]
+    assert len(result["periods"]) == 18
+    scores = score_series({kw: result[kw] for kw in ("coaching", "shifted")})
+    assert scores["shifted"]["momentum"] > 0
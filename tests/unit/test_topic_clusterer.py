@@ -0,0 +1,242 @@
+"""Unit tests for the Topic Clusterer agent."""
+
+import asyncio
+import random
+
+
+def _keywords(n, seed=0):
+    from models.keywords import Keyword
+
+    rng = random.Random(seed)
+    heads = ["leadership", "coaching", "training", "management", "culture", "strategy"]
+    tails = [f"topic{i}" for i in range(40)]
+    return [Keyword(term=f"{rng.choice(heads)} {rng.choice(tails)} {rng.choice(tails)}") for _ in range(n)]
+
+
+def _cluster(keywords, **kwargs):
+    from agents.topic_clusterer import TopicClustererAgent
+    from contracts.topic_clusterer import TopicClusterInput
+
+    return asyncio.run(TopicClustererAgent().process(TopicClusterInput(keywords=keywords, **kwargs)))
+
+
+def test_auto_method_switches_on_threshold(monkeypatch):
+    from agents.topic_clusterer import TopicClustererAgent
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "clustering_scalable_threshold", 100)
+    assert TopicClustererAgent.resolve_method("auto", 99) == "tfidf_kmeans"
+    assert TopicClustererAgent.resolve_method("auto", 100) == "tfidf_minibatch"
+    assert TopicClustererAgent.resolve_method("tfidf_kmeans", 10_000) == "tfidf_kmeans"
+
+
+def test_minibatch_clusters_every_keyword_and_reports_cost(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "clustering_scalable_threshold", 200)
+    keywords = _keywords(400)
+    result = _cluster(keywords, n_clusters_range=(3, 6), method="auto")
+
+    assert result.data["method_used"] == "tfidf_minibatch"
+    assert sum(c["size"] for c in result.data["clusters"]) == len(keywords)
+    assert 3 <= result.metadata["optimal_k"] <= 6
+    assert set(result.metadata["timing_seconds"]) == {"vectorize", "select_k", "total"}
+    assert result.metadata["memory"]["feature_matrix_mb"] > 0
+
+
+def test_minibatch_is_reproducible():
+    keywords = _keywords(300, seed=1)
+    first = _cluster(keywords, n_clusters_range=(3, 5), method="tfidf_minibatch")
+    second = _cluster(keywords, n_clusters_range=(3, 5), method="tfidf_minibatch")
+    assert [c["keywords"] for c in first.data["clusters"]] == [c["keywords"] for c in second.data["clusters"]]
+    assert first.metadata["silhouette_score"] == second.metadata["silhouette_score"]
+
+
+def test_fast_selection_is_independent_of_worker_count(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "clustering_parallel_min_keywords", 0)
+    keywords = _keywords(300, seed=2)
+    runs = []
+    for n_jobs in (1, 2):
+        monkeypatch.setattr(settings, "clustering_n_jobs", n_jobs)
+        runs.append(_cluster(keywords, n_clusters_range=(3, 12), method="tfidf_kmeans", k_selection="fast"))
+
+    first, second = runs
+    assert first.metadata["optimal_k"] == second.metadata["optimal_k"]
+    assert first.metadata["k_scores"] == second.metadata["k_scores"]
+    assert [c["keywords"] for c in first.data["clusters"]] == [c["keywords"] for c in second.data["clusters"]]
+    assert first.metadata["silhouette_sample_size"] == settings.clustering_silhouette_sample_size
+
+
+def test_fast_selection_sweeps_small_inputs_serially(monkeypatch):
+    import agents.topic_clusterer as topic_clusterer
+    from core.config import settings
+
+    pools = []
+    original = topic_clusterer.Parallel
+
+    def recording_parallel(n_jobs, **kwargs):
+        pools.append(n_jobs)
+        return original(n_jobs=n_jobs, **kwargs)
+
+    monkeypatch.setattr(settings, "clustering_n_jobs", 2)
+    monkeypatch.setattr(topic_clusterer, "Parallel", recording_parallel)
+    _cluster(_keywords(40, seed=2), n_clusters_range=(3, 6), k_selection="fast")
+    assert pools == [1]
+
+
+def test_fast_selection_stops_on_plateau(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "clustering_n_jobs", 1)
+    monkeypatch.setattr(settings, "clustering_plateau_patience", 2)
+    monkeypatch.setattr(settings, "clustering_plateau_tol", 1.0)  # nothing beats the first k by 1.0
+    result = _cluster(_keywords(200, seed=3), n_clusters_range=(3, 10), k_selection="fast")
+    assert list(result.metadata["k_scores"]) == [3, 4, 5]
+    assert result.metadata["stopped_early"] is True
+
+
+def test_incremental_idf_matches_tfidf_transformer():
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfTransformer
+
+    from pipeline.text_features import HashingTfidfVectorizer
+
+    terms = [kw.term for kw in _keywords(250, seed=4)]
+    chunked = HashingTfidfVectorizer(n_features=2 ** 12)
+    matrix = chunked.fit_transform_chunks(terms[i : i + 60] for i in range(0, len(terms), 60))
+
+    counts = chunked.hasher.transform(terms)
+    expected = TfidfTransformer().fit_transform(counts)
+    assert np.allclose(matrix.toarray(), expected.toarray())
+    assert chunked.idf.n_docs == len(terms)
+    assert chunked.idf.doc_freq.shape == (2 ** 12,)
+
+
+def test_hashing_features_cluster_and_label_from_tokens(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "clustering_hash_chunk_size", 50)
+    keywords = _keywords(300, seed=5)
+    result = _cluster(keywords, n_clusters_range=(3, 6), method="tfidf_minibatch", features="hashing")
+
+    assert result.metadata["features"] == "hashing"
+    assert sum(c["size"] for c in result.data["clusters"]) == len(keywords)
+    for cluster in result.data["clusters"]:
+        member_text = " ".join(kw["term"] for kw in cluster["keywords"])
+        assert all(part.lower() in member_text for part in cluster["label"].split(" / "))
+
+
+def _model_store():
+    from storage.cluster_models import ClusterModelStore
+    from storage.database import init_database
+
+    _, session_factory = init_database("sqlite://")
+    return ClusterModelStore(session_factory)
+
+
+def test_stored_model_assigns_training_keywords_to_their_clusters():
+    from agents.topic_clusterer import TopicClustererAgent
+    from contracts.topic_clusterer import TopicClusterInput
+
+    agent = TopicClustererAgent(model_store=_model_store())
+    keywords = _keywords(200, seed=6)
+    fitted = asyncio.run(agent.process(TopicClusterInput(keywords=keywords, n_clusters_range=(3, 6), run_id="run-1")))
+    model_id = fitted.metadata["model_id"]
+    assert model_id
+
+    assigned = asyncio.run(agent.process(TopicClusterInput(keywords=keywords[:50], mode="assign", run_id="run-1")))
+    assert assigned.metadata["model_id"] == model_id
+    fit_label = {kw["term"]: c["label"] for c in fitted.data["clusters"] for kw in c["keywords"]}
+    for cluster in assigned.data["clusters"]:
+        for kw in cluster["keywords"]:
+            assert fit_label[kw["term"]] == cluster["label"]
+    assert assigned.metadata["drift"]["refit_recommended"] is False
+
+
+def test_assign_flags_drift_for_unrelated_keywords():
+    import pytest
+
+    from agents.topic_clusterer import TopicClustererAgent
+    from contracts.topic_clusterer import TopicClusterInput
+    from models.keywords import Keyword
+
+    agent = TopicClustererAgent(model_store=_model_store())
+    with pytest.raises(ValueError):
+        asyncio.run(agent.process(TopicClusterInput(keywords=_keywords(3), mode="assign")))
+
+    asyncio.run(agent.process(TopicClusterInput(keywords=_keywords(200, seed=7), n_clusters_range=(3, 6))))
+    unrelated = [Keyword(term=f"quantum {i} physics lecture") for i in range(20)]
+    result = asyncio.run(agent.process(TopicClusterInput(keywords=unrelated, mode="assign")))
+    assert sum(c["size"] for c in result.data["clusters"]) == 20
+    assert result.metadata["drift"]["far_share"] == 1.0
+    assert result.metadata["drift"]["refit_recommended"] is True
+
+
+def test_cluster_cache_hits_on_reordered_keywords():
+    from agents.topic_clusterer import TopicClustererAgent
+    from contracts.topic_clusterer import TopicClusterInput
+    from storage.cache import CacheManager
+    from storage.database import init_database
+
+    _, session_factory = init_database("sqlite://")
+    cache = CacheManager(session_factory)
+    agent = TopicClustererAgent(cache=cache)
+    keywords = _keywords(150, seed=8)
+
+    first = asyncio.run(agent.process(TopicClusterInput(keywords=keywords, n_clusters_range=(3, 5))))
+    reordered = [kw.model_copy(update={"term": kw.term.upper(), "trends_momentum": 1.0}) for kw in reversed(keywords)]
+    second = asyncio.run(agent.process(TopicClusterInput(keywords=reordered, n_clusters_range=(3, 5))))
+
+    assert first.metadata["cache_hit"] is False
+    assert second.metadata["cache_hit"] is True
+    assert second.metadata["fingerprint"] == first.metadata["fingerprint"]
+    assert second.metadata["optimal_k"] == first.metadata["optimal_k"]
+    def groups(result):
+        return sorted(sorted(kw["term"].lower() for kw in c["keywords"]) for c in result.data["clusters"])
+
+    assert groups(first) == groups(second)
+    # Demand is recomputed from the keywords passed in, not replayed from the cache
+    assert all(c["avg_demand_signal"] == 1.0 for c in second.data["clusters"])
+    assert cache.stats()["hits"]["topic_clusters"] == 1
+
+    other = asyncio.run(agent.process(TopicClusterInput(keywords=keywords, n_clusters_range=(3, 6))))
+    assert other.metadata["cache_hit"] is False
+    forced = asyncio.run(agent.process(TopicClusterInput(keywords=keywords, n_clusters_range=(3, 5), force_refresh=True)))
+    assert forced.metadata["cache_hit"] is False
+
+
+def test_cache_hit_links_the_stored_model_to_the_new_run():
+    from sqlalchemy import func, select
+
+    from agents.topic_clusterer import TopicClustererAgent
+    from contracts.topic_clusterer import TopicClusterInput
+    from storage.cache import CacheManager
+    from storage.database import ClusterModelRecord, init_database
+
+    _, session_factory = init_database("sqlite://")
+    agent = TopicClustererAgent(model_store=_model_store(), cache=CacheManager(session_factory))
+    keywords = _keywords(120, seed=9)
+
+    first = asyncio.run(agent.process(TopicClusterInput(keywords=keywords, n_clusters_range=(3, 5), run_id="run-1")))
+    second = asyncio.run(agent.process(TopicClusterInput(keywords=keywords, n_clusters_range=(3, 5), run_id="run-2")))
+    assert second.metadata["cache_hit"] is True
+    assert second.metadata["model_id"] == first.metadata["model_id"]
+
+    assigned = asyncio.run(agent.process(TopicClusterInput(keywords=keywords[:20], mode="assign", run_id="run-2")))
+    assert assigned.metadata["model_id"] == first.metadata["model_id"]
+    # Linked, not copied: the model is stored once
+    session = agent.model_store.session_factory()
+    assert session.scalar(select(func.count()).select_from(ClusterModelRecord)) == 1
+    session.close()
+
+
+def test_keyword_sets_smaller_than_the_k_range_still_cluster():
+    from models.keywords import Keyword
+
+    for n in (3, 10):
+        keywords = [Keyword(term=f"leadership topic{i}") for i in range(n)]
+        result = _cluster(keywords, k_selection="fast")
+        assert sum(c["size"] for c in result.data["clusters"]) == n
+        assert result.metadata["optimal_k"] <= n - 1